@@ -49,29 +49,29 @@ async def run_test():
         # -> Click on the Glassmorphism Generator tool link to open the tool page.
         frame = context.pages[-1]
         # Click the 'Free Glass Architect' link to open the Glassmorphism Generator tool page 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section[3]/div/div[2]/a').nth(0)
+        elem = frame.locator("a[href='/glass'] >> visible=true").nth(0)  # locator: tool_link.glass
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Adjust the blur, transparency, and border radius sliders by simulating slider drag or clicking on the slider track to set values.
         frame = context.pages[-1]
         # Click blur slider to adjust value 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=blur-slider] [role=slider]').nth(0)  # locator: glass.blur_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         frame = context.pages[-1]
         # Click transparency slider to adjust value 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[3]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=transparency-slider] [role=slider]').nth(0)  # locator: glass.transparency_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Adjust the blur slider to 20px, transparency slider to 0.5, and border radius slider to 24px by clicking or dragging sliders. Then verify live preview updates.
         frame = context.pages[-1]
         # Click blur slider to set value to 20px 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=blur-slider] [role=slider]').nth(0)  # locator: glass.blur_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         frame = context.pages[-1]
         # Click transparency slider to set value to 0.5 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[3]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=transparency-slider] [role=slider]').nth(0)  # locator: glass.transparency_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         frame = context.pages[-1]
         # Click border radius slider to set value to 24px 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[5]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=radius-slider] [role=slider]').nth(0)  # locator: glass.radius_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Click the Export or Copy button to export the generated CSS and verify the CSS content.
         frame = context.pages[-1]
@@ -79,7 +79,7 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000) 
         # -> Adjust the sliders to Blur=20px, Transparency=0.5, Border Radius=24px and verify the live preview updates accordingly.
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=blur-slider] [role=slider]').nth(0)  # locator: glass.blur_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -90,32 +90,32 @@ async def run_test():
 
         # -> Adjust the blur, transparency, and border radius sliders by clicking or dragging slider handles to set values to Blur=20px, Transparency=0.5, Border Radius=24px and verify live preview updates.
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=blur-slider] [role=slider]').nth(0)  # locator: glass.blur_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=blur-slider] [role=slider]').nth(0)  # locator: glass.blur_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[3]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=transparency-slider] [role=slider]').nth(0)  # locator: glass.transparency_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[3]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=transparency-slider] [role=slider]').nth(0)  # locator: glass.transparency_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[5]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=radius-slider] [role=slider]').nth(0)  # locator: glass.radius_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[5]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=radius-slider] [role=slider]').nth(0)  # locator: glass.radius_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -125,7 +125,6 @@ async def run_test():
             await expect(frame.locator('text=Glassmorphism Effect Applied Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test failed: The Glassmorphism Generator did not correctly create frosted glass effects with the specified blur, opacity, and border settings, or the live preview and CSS export did not update as expected.')
-        await asyncio.sleep(5)
 
     finally:
         if context:
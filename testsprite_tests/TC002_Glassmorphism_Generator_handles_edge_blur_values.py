@@ -49,24 +49,23 @@ async def run_test():
         # -> Click the Glassmorphism Generator tool button to open the tool interface
         frame = context.pages[-1]
         # Click the Glassmorphism Generator tool button to open the tool 
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a/button').nth(0)
+        elem = frame.locator("a[href='/glass'] >> visible=true").nth(0)  # locator: tool_link.glass
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Try to set blur value to minimum by clicking or dragging the blur slider control or using keyboard keys if supported
         frame = context.pages[-1]
         # Click the blur slider control to set blur to minimum or activate slider for keyboard input 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=blur-slider] [role=slider]').nth(0)  # locator: glass.blur_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Try to focus the blur slider and use keyboard arrow keys to decrease the blur value to minimum (0px)
         frame = context.pages[-1]
         # Focus the blur slider control to enable keyboard input 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=blur-slider] [role=slider]').nth(0)  # locator: glass.blur_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000) 
         # --> Assertions to verify final state
         try:
             await expect(page.locator('text=Extreme Blur Effect Applied').first).to_be_visible(timeout=30000)
         except AssertionError:
             raise AssertionError('Test failed: The Glassmorphism Generator did not handle minimum and maximum blur values correctly, causing the live preview to break or not update as expected.')
-        await asyncio.sleep(5)
 
     finally:
         if context:
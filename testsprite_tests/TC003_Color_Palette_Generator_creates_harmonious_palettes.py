@@ -49,7 +49,7 @@ async def run_test():
         # -> Click on the Palette Master tool to open the Color Palette Generator
         frame = context.pages[-1]
         # Click on Palette Master to open the Color Palette Generator tool
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section[3]/div/div[2]/a[3]').nth(0)
+        elem = frame.locator("a[href='/palette'] >> visible=true").nth(0)  # locator: tool_link.palette
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -84,35 +84,35 @@ async def run_test():
         # -> Generate palette using Split-Complementary harmony algorithm by selecting it from the Harmony dropdown
         frame = context.pages[-1]
         # Open Harmony dropdown
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[7]/button').nth(0)
+        elem = frame.locator("a[href='/blob'] >> visible=true").nth(0)  # locator: tool_link.blob
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Click the 'Back to Hub' button to return to the main hub and then navigate to the Color Palette Generator tool (Palette Master)
         frame = context.pages[-1]
         # Click 'Back to Hub' button to return to main hub page
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div/a/button').nth(0)
+        elem = frame.locator("role=button[name='Back to Hub']").nth(0)  # locator: nav.back_to_hub
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Click on the Palette Master tool link to open the Color Palette Generator
         frame = context.pages[-1]
         # Click on Palette Master to open the Color Palette Generator tool
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section[3]/div/div[2]/a[3]').nth(0)
+        elem = frame.locator("a[href='/palette'] >> visible=true").nth(0)  # locator: tool_link.palette
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Test the remaining harmony algorithms: Tetradic and Monochromatic by selecting them from the Harmony dropdown
         frame = context.pages[-1]
         # Open Harmony dropdown
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[7]/button').nth(0)
+        elem = frame.locator("a[href='/blob'] >> visible=true").nth(0)  # locator: tool_link.blob
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Click the 'Back to Hub' button to return to the main hub and then navigate to the Color Palette Generator tool (Palette Master)
         frame = context.pages[-1]
         # Click 'Back to Hub' button to return to main hub page
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div/a/button').nth(0)
+        elem = frame.locator("role=button[name='Back to Hub']").nth(0)  # locator: nav.back_to_hub
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -122,7 +122,6 @@ async def run_test():
             await expect(frame.locator('text=Nonexistent Harmony Algorithm').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test plan failed: Color palette generation did not produce harmonious color schemes or export verification failed.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -49,7 +49,7 @@ async def run_test():
         # -> Click on the Palette tool button to open the palette generation interface
         frame = context.pages[-1]
         # Click on the Palette button to open the palette generation tool
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[3]/button').nth(0)
+        elem = frame.locator("a[href='/palette'] >> visible=true").nth(0)  # locator: tool_link.palette
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -96,7 +96,6 @@ async def run_test():
         await expect(frame.locator('text=Professional color palette generator with interactive shade picker, accessibility checker, Elementor export, and advanced features').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Fail').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Poor contrast').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -49,7 +49,7 @@ async def run_test():
         # -> Click on the Gradient Text tool to access the gradient text generator
         frame = context.pages[-1]
         # Click on the Gradient Text tool to open the gradient text generator
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section[3]/div/div[2]/a[5]').nth(0)
+        elem = frame.locator("a[href='/gradient-text'] >> visible=true").nth(0)  # locator: tool_link.gradient-text
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -87,7 +87,6 @@ async def run_test():
         frame = context.pages[-1]
         await expect(frame.locator('text=Build Faster Websites').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=.gradient-word {\n  background: linear-gradient(to right, #fb923c, #db2777);\n  -webkit-background-clip: text;\n  color: transparent;\n  font-weight: bold;\n}').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -49,28 +49,28 @@ async def run_test():
         # -> Click the 'Shadow' button to open the Box Shadow Generator tool
         frame = context.pages[-1]
         # Click the 'Shadow' button to open the Box Shadow Generator tool
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[6]/button').nth(0)
+        elem = frame.locator("a[href='/shadow'] >> visible=true").nth(0)  # locator: tool_link.shadow
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Add multiple shadow layers with varying offsets, blur, spread, and colors
         frame = context.pages[-1]
         # Click 'Randomize' to generate initial shadow layers for variation
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div/div/button').nth(0)
+        elem = frame.locator('role=button[name=/Randomize/]').nth(0)  # locator: tool.randomize
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Edit shadow properties by adjusting sliders for Distance, Blur, or Intensity and remove one shadow layer if possible
         frame = context.pages[-1]
         # Click 'Reset' to clear current shadows and start fresh for editing
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div/div/button[2]').nth(0)
+        elem = frame.locator('role=button[name=/^Reset/]').nth(0)  # locator: tool.reset
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Add multiple shadow layers with varying offsets, blur, spread, and colors by using 'Randomize' or manual input
         frame = context.pages[-1]
         # Click 'Randomize' to generate multiple shadow layers for editing
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div/div/button').nth(0)
+        elem = frame.locator('role=button[name=/Randomize/]').nth(0)  # locator: tool.randomize
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -83,14 +83,14 @@ async def run_test():
         # -> Remove one shadow layer and verify the preview and CSS box-shadow property update accordingly
         frame = context.pages[-1]
         # Click 'Reset' to clear all shadows for removal test
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div/div/button[2]').nth(0)
+        elem = frame.locator('role=button[name=/^Reset/]').nth(0)  # locator: tool.reset
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Wait briefly to ensure page stability, then retry clicking the 'Randomize' button to add multiple shadow layers for editing
         frame = context.pages[-1]
         # Click 'Randomize' to generate multiple shadow layers for editing
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div/div/button').nth(0)
+        elem = frame.locator('role=button[name=/Randomize/]').nth(0)  # locator: tool.randomize
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -103,7 +103,7 @@ async def run_test():
 
         frame = context.pages[-1]
         # Click 'Reset' to clear all shadows for removal test
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div/div/button[2]').nth(0)
+        elem = frame.locator('role=button[name=/^Reset/]').nth(0)  # locator: tool.reset
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -121,14 +121,14 @@ async def run_test():
 
         frame = context.pages[-1]
         # Click 'Reset' to clear shadows after removal test
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div/div/button[2]').nth(0)
+        elem = frame.locator('role=button[name=/^Reset/]').nth(0)  # locator: tool.reset
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Export final CSS box-shadow property and verify it matches the applied shadow layers
         frame = context.pages[-1]
         # Click 'Copy' button to copy the final CSS box-shadow property
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div/div[2]/div/div/button').nth(0)
+        elem = frame.locator('role=button[name=/^Cop(y|ied)/]').nth(0)  # locator: tool.copy
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -149,7 +149,6 @@ async def run_test():
         await expect(frame.locator('text=CSS').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=.neumorphic {').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=box-shadow: 20px 20px 40px rgb(15, 26, 44), -20px -20px 40px rgb(45, 56, 74);').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
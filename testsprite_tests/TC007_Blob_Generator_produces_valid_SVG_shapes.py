@@ -49,22 +49,22 @@ async def run_test():
         # -> Click on the Blob Maker button to open the Blob Generator tool
         frame = context.pages[-1]
         # Click on the Blob Maker button to open the Blob Generator tool 
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[7]/button').nth(0)
+        elem = frame.locator("a[href='/blob'] >> visible=true").nth(0)  # locator: tool_link.blob
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Adjust the Complexity slider to a new value to verify the shape preview updates accordingly
         frame = context.pages[-1]
         # Click and adjust the Complexity slider to change the blob shape complexity 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=complexity-slider] [role=slider]').nth(0)  # locator: blob.complexity_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Try adjusting the Size slider (index 33) to see if the shape preview updates accordingly
         frame = context.pages[-1]
         # Click and adjust the Size slider to change the blob shape size 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=size-slider] [role=slider]').nth(0)  # locator: blob.size_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Try clicking the Randomize button to see if the blob shape preview updates accordingly
         frame = context.pages[-1]
         # Click the Randomize button to generate a new blob shape and verify if the preview updates 
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div/div/button').nth(0)
+        elem = frame.locator('role=button[name=/Randomize/]').nth(0)  # locator: tool.randomize
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Export the blob as an SVG file by clicking the appropriate export or download button
         frame = context.pages[-1]
@@ -73,18 +73,18 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000) 
         # -> Adjust the Complexity slider by clicking or dragging to a new value and verify the blob shape preview updates accordingly.
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=complexity-slider] [role=slider]').nth(0)  # locator: blob.complexity_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Adjust the Size slider by simulating keyboard input or dragging the slider handle to a new value and verify the blob preview updates accordingly.
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=size-slider] [role=slider]').nth(0)  # locator: blob.size_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator('[data-testid=size-slider] [role=slider]').nth(0)  # locator: blob.size_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -100,7 +100,6 @@ async def run_test():
         await expect(frame.locator('text=50%').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=256px').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Download SVG').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -49,58 +49,58 @@ async def run_test():
         # -> Click on the Grid Architect tool to open the CSS Grid Generator
         frame = context.pages[-1]
         # Click on the 'Grid Architect' tool to open the CSS Grid Generator
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section[3]/div/div[2]/a[4]').nth(0)
+        elem = frame.locator("a[href='/grid'] >> visible=true").nth(0)  # locator: tool_link.grid
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Adjust columns, rows, and gap using sliders or available controls to test grid generation
         frame = context.pages[-1]
         # Click and drag or adjust the slider for Columns
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div/span/span[2]/span').nth(0)
+        elem = frame.locator("div:has(> div > label:text-is('Columns')) [role=slider]").nth(0)  # locator: grid.columns_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Click and drag or adjust the slider for Rows
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator("div:has(> div > label:text-is('Rows')) [role=slider]").nth(0)  # locator: grid.rows_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Adjust the columns slider to 4, rows slider to 3, and gap slider to 20 and verify the live preview updates accordingly.
         frame = context.pages[-1]
         # Adjust columns slider to increase columns from 3 to 4
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div/span/span[2]/span').nth(0)
+        elem = frame.locator("div:has(> div > label:text-is('Columns')) [role=slider]").nth(0)  # locator: grid.columns_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Adjust rows slider to increase rows from 2 to 3
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator("div:has(> div > label:text-is('Rows')) [role=slider]").nth(0)  # locator: grid.rows_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Adjust gap slider to increase gap from 16px to 20px
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div[2]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator("div:has(> div > label:text-is('Gap')) [role=slider]").nth(0)  # locator: grid.gap_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Try to interact with sliders differently or verify if there are other controls to input gap, columns, and rows values. Then verify the live preview updates correctly.
         frame = context.pages[-1]
         # Try clicking columns slider again to adjust columns
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div/span/span[2]/span').nth(0)
+        elem = frame.locator("div:has(> div > label:text-is('Columns')) [role=slider]").nth(0)  # locator: grid.columns_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Try clicking rows slider again to adjust rows
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator("div:has(> div > label:text-is('Rows')) [role=slider]").nth(0)  # locator: grid.rows_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Try clicking gap slider again to adjust gap
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div[2]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator("div:has(> div > label:text-is('Gap')) [role=slider]").nth(0)  # locator: grid.gap_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -114,14 +114,14 @@ async def run_test():
         # -> Adjust the gap slider to 20px and verify the live preview and CSS code update accordingly.
         frame = context.pages[-1]
         # Adjust gap slider to increase gap from 16px to 20px
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div[2]/div[2]/span/span[2]/span').nth(0)
+        elem = frame.locator("div:has(> div > label:text-is('Gap')) [role=slider]").nth(0)  # locator: grid.gap_slider
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Click the 'Copy' button to export the generated CSS grid code and verify it matches the input configurations.
         frame = context.pages[-1]
         # Click the 'Copy' button to export the generated CSS grid code
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[3]/div/div[2]/div/div/button').nth(0)
+        elem = frame.locator('role=button[name=/^Cop(y|ied)/]').nth(0)  # locator: tool.copy
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -138,7 +138,6 @@ async def run_test():
         await expect(frame.locator('text=grid-template-columns: repeat(3, 1fr);').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=grid-template-rows: repeat(2, 1fr);').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=gap: 16px;').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
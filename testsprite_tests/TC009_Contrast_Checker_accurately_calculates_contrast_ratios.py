@@ -49,78 +49,78 @@ async def run_test():
         # -> Click on the Contrast button to access the Contrast Checker tool
         frame = context.pages[-1]
         # Click on the Contrast button to open the Contrast Checker tool
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[8]/button').nth(0)
+        elem = frame.locator("a[href='/contrast'] >> visible=true").nth(0)  # locator: tool_link.contrast
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Input first foreground and background color pair to test contrast ratio and WCAG compliance
         frame = context.pages[-1]
         # Input foreground color black (#000000)
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#ffffff']").nth(0)  # locator: contrast.foreground_hex
         await page.wait_for_timeout(3000); await elem.fill('#000000')
         
 
         # -> Retry inputting background color #ffffff to complete first color pair test
         frame = context.pages[-1]
         # Input background color white (#ffffff) to complete first color pair test
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div[2]/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#0f172a']").nth(0)  # locator: contrast.background_hex
         await page.wait_for_timeout(3000); await elem.fill('#ffffff')
         
 
         # -> Try to input the second color pair by clearing the input first or using a different input element or method to set foreground color to #777777 and background color to #ffffff
         frame = context.pages[-1]
         # Click foreground color input to focus and clear existing value
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#ffffff']").nth(0)  # locator: contrast.foreground_hex
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Input foreground color #777777 after clearing
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#ffffff']").nth(0)  # locator: contrast.foreground_hex
         await page.wait_for_timeout(3000); await elem.fill('#777777')
         
 
         # -> Input third color pair with very low contrast (e.g., #aaaaaa on #ffffff) and verify the contrast ratio and compliance status
         frame = context.pages[-1]
         # Click foreground color input to clear current value
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#ffffff']").nth(0)  # locator: contrast.foreground_hex
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Input foreground color #aaaaaa for third test pair
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#ffffff']").nth(0)  # locator: contrast.foreground_hex
         await page.wait_for_timeout(3000); await elem.fill('#aaaaaa')
         
 
         frame = context.pages[-1]
         # Click background color input to clear current value
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div[2]/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#0f172a']").nth(0)  # locator: contrast.background_hex
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Input background color #ffffff for third test pair
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div[2]/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#0f172a']").nth(0)  # locator: contrast.background_hex
         await page.wait_for_timeout(3000); await elem.fill('#ffffff')
         
 
         # -> Input fourth color pair with invalid or malformed color input to test error handling
         frame = context.pages[-1]
         # Click foreground color input to clear current value
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#ffffff']").nth(0)  # locator: contrast.foreground_hex
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Input invalid foreground color #zzzzzz for fourth test pair
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#ffffff']").nth(0)  # locator: contrast.foreground_hex
         await page.wait_for_timeout(3000); await elem.fill('#zzzzzz')
         
 
         frame = context.pages[-1]
         # Click background color input to clear current value
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[2]/div[2]/div/input[2]').nth(0)
+        elem = frame.locator("input[placeholder='#0f172a']").nth(0)  # locator: contrast.background_hex
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -136,7 +136,6 @@ async def run_test():
         await expect(frame.locator('text=Pass').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=AAA Large').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Pass').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -49,14 +49,14 @@ async def run_test():
         # -> Click on the Meta Tags Generator tool button to open it
         frame = context.pages[-1]
         # Click on Meta Tags Generator tool button
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[9]/button').nth(0)
+        elem = frame.locator("a[href='/meta'] >> visible=true").nth(0)  # locator: tool_link.meta
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Input webpage title, description, keywords, author, OG image URL, social handle, and select platform, skipping Site URL input due to error
         frame = context.pages[-1]
         # Input webpage title
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div/div[2]/div/input').nth(0)
+        elem = frame.locator("input[placeholder='Page title']").nth(0)  # locator: meta.title
         await page.wait_for_timeout(3000); await elem.fill('Test Website Title')
         
 
@@ -68,7 +68,7 @@ async def run_test():
 
         frame = context.pages[-1]
         # Input keywords
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div/div[2]/div[3]/input').nth(0)
+        elem = frame.locator("input[placeholder='keyword1, keyword2, keyword3']").nth(0)  # locator: meta.keywords
         await page.wait_for_timeout(3000); await elem.fill('test, seo, meta tags')
         
 
@@ -115,7 +115,6 @@ async def run_test():
         await expect(frame.locator('text=summary_large_image').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=website').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=canonical').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -49,7 +49,7 @@ async def run_test():
         # -> Click on the Prompt tool button to access the AI Prompt Generator.
         frame = context.pages[-1]
         # Click on the Prompt tool button to open the AI Prompt Generator 
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[2]/button').nth(0)
+        elem = frame.locator("a[href='/prompt'] >> visible=true").nth(0)  # locator: tool_link.prompt
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Click the Templates button to select a different prompt template.
         frame = context.pages[-1]
@@ -186,7 +186,6 @@ async def run_test():
             await expect(frame.locator('text=AI Prompt Generator Failure Notification').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The AI Prompt Generator did not correctly build or export prompts as per the test plan steps.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -49,28 +49,28 @@ async def run_test():
         # -> Click on 'Explore Tools' button to navigate to the tools list.
         frame = context.pages[-1]
         # Click 'Explore Tools' button to navigate to the tools list
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section/div[3]/button').nth(0)
+        elem = frame.locator("role=button[name='Explore Tools']").nth(0)  # locator: hub.explore_tools
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Star multiple tools as favorites by clicking their star icons.
         frame = context.pages[-1]
         # Star the 'Glass Architect' tool as favorite
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section[3]/div/div[2]/a').nth(0)
+        elem = frame.locator("a[href='/glass'] >> visible=true").nth(0)  # locator: tool_link.glass
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Go back to the tools list page to retry starring tools as favorites.
         frame = context.pages[-1]
         # Click 'Back to Hub' button to return to tools list
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div/a/button').nth(0)
+        elem = frame.locator("role=button[name='Back to Hub']").nth(0)  # locator: nav.back_to_hub
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Click 'Explore Tools' button to navigate to the tools list and attempt to star favorites correctly.
         frame = context.pages[-1]
         # Click 'Explore Tools' button to navigate to the tools list
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section/div[3]/button').nth(0)
+        elem = frame.locator("role=button[name='Explore Tools']").nth(0)  # locator: hub.explore_tools
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -80,21 +80,21 @@ async def run_test():
 
         frame = context.pages[-1]
         # Attempt to star 'Glass Architect' tool by clicking its star or favorite icon if available
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a/button').nth(0)
+        elem = frame.locator("a[href='/glass'] >> visible=true").nth(0)  # locator: tool_link.glass
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Click 'Back to Hub' button (index 27) to return to the tools list and retry starring favorites.
         frame = context.pages[-1]
         # Click 'Back to Hub' button to return to tools list
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div/a/button').nth(0)
+        elem = frame.locator("role=button[name='Back to Hub']").nth(0)  # locator: nav.back_to_hub
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Click 'Explore Tools' button (index 25) to navigate to the tools list and find the correct favorite toggle elements.
         frame = context.pages[-1]
         # Click 'Explore Tools' button to navigate to the tools list
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section/div[3]/button').nth(0)
+        elem = frame.locator("role=button[name='Explore Tools']").nth(0)  # locator: hub.explore_tools
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -117,7 +117,6 @@ async def run_test():
         frame = context.pages[-1]
         await expect(frame.locator('text=Glass Architect').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Prompt Engineer').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -53,7 +53,7 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000) 
         # -> Configure the tool with custom parameters
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a/button').nth(0)
+        elem = frame.locator("a[href='/glass'] >> visible=true").nth(0)  # locator: tool_link.glass
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -113,7 +113,7 @@ async def run_test():
 
         # -> Verify that the deleted preset 'CustomPreset1' cannot be loaded again and no errors occur
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div/div/button').nth(0)
+        elem = frame.locator('role=button[name=/Randomize/]').nth(0)  # locator: tool.randomize
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -121,7 +121,6 @@ async def run_test():
         frame = context.pages[-1]
         await expect(frame.locator('text=CustomPreset1').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Contrast Eye').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -56,7 +56,7 @@ async def run_test():
         # -> Try clicking on a different tool button (e.g., 'Glass') to see if it opens the tool interface for export testing.
         frame = context.pages[-1]
         # Click on the 'Glass' tool button to try opening a different tool for export testing
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a/button').nth(0)
+        elem = frame.locator("a[href='/glass'] >> visible=true").nth(0)  # locator: tool_link.glass
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -70,7 +70,7 @@ async def run_test():
         # -> Navigate to export history page or section to verify the export entry.
         frame = context.pages[-1]
         # Click 'Back to Hub' to navigate to main hub page where export history might be accessible
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div/a/button').nth(0)
+        elem = frame.locator("role=button[name='Back to Hub']").nth(0)  # locator: nav.back_to_hub
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -90,7 +90,6 @@ async def run_test():
             await expect(frame.locator('text=Export completed successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The export action was not logged in export history with correct metadata as required by the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -49,12 +49,12 @@ async def run_test():
         # -> Set system theme to dark mode
         frame = context.pages[-1]
         # Click the theme toggle button to check current theme state or toggle manually if needed 
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div[2]/button').nth(0)
+        elem = frame.locator("role=button[name='Toggle theme']").nth(0)  # locator: nav.theme_toggle
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Manually toggle to light mode using theme toggle control
         frame = context.pages[-1]
         # Manually toggle to light mode using the theme toggle control 
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div[2]/button').nth(0)
+        elem = frame.locator("role=button[name='Toggle theme']").nth(0)  # locator: nav.theme_toggle
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Reload application to verify saved theme preference overrides system theme
         await page.goto('http://localhost:8080/', timeout=10000)
@@ -62,17 +62,17 @@ async def run_test():
         # -> Click the theme toggle button to manually toggle theme and observe visual changes to confirm current theme mode
         frame = context.pages[-1]
         # Click the theme toggle button to toggle theme and observe visual changes to confirm current theme mode 
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div[2]/button').nth(0)
+        elem = frame.locator("role=button[name='Toggle theme']").nth(0)  # locator: nav.theme_toggle
         await page.wait_for_timeout(3000); await elem.click(timeout=5000) 
         # -> Click the theme toggle button to manually toggle theme again and observe any changes in page content or attributes that might indicate theme mode.
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div[2]/button').nth(0)
+        elem = frame.locator("role=button[name='Toggle theme']").nth(0)  # locator: nav.theme_toggle
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
         # -> Manually toggle the theme again using the toggle button to observe if the theme changes visually and then reload the application to check if the last toggled theme persists.
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div[2]/button').nth(0)
+        elem = frame.locator("role=button[name='Toggle theme']").nth(0)  # locator: nav.theme_toggle
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -82,7 +82,7 @@ async def run_test():
 
         # -> Manually toggle the theme again using the toggle button to observe if the theme changes visually and then verify if the last toggled theme persists after reload.
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div[2]/button').nth(0)
+        elem = frame.locator("role=button[name='Toggle theme']").nth(0)  # locator: nav.theme_toggle
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -92,7 +92,7 @@ async def run_test():
 
         # -> Manually toggle the theme to light mode again using the toggle button and verify the visual change to light mode.
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div[2]/button').nth(0)
+        elem = frame.locator("role=button[name='Toggle theme']").nth(0)  # locator: nav.theme_toggle
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -103,7 +103,7 @@ async def run_test():
 
         # -> Manually toggle the theme to dark mode again using the toggle button and verify the visual change to dark mode.
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div[2]/button').nth(0)
+        elem = frame.locator("role=button[name='Toggle theme']").nth(0)  # locator: nav.theme_toggle
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -201,7 +201,6 @@ async def run_test():
         await expect(frame.locator('text=Contact').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Privacy').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Terms').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
 
     finally:
         if context:
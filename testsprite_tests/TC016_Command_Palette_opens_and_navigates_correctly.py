@@ -56,7 +56,7 @@ async def run_test():
         # -> Click 'Hub' option in Command Palette to verify navigation to homepage.
         frame = context.pages[-1]
         # Select 'Hub' option from Command Palette
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[9]/button').nth(0)
+        elem = frame.locator("a[href='/meta'] >> visible=true").nth(0)  # locator: tool_link.meta
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -66,7 +66,6 @@ async def run_test():
             await expect(frame.locator('text=Command Palette Activated Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: Command Palette did not open or navigate correctly when triggered by Cmd/Ctrl+K shortcut as per the test plan.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
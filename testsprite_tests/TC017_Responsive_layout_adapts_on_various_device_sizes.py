@@ -75,7 +75,7 @@ async def run_test():
         # -> Resize viewport to tablet dimensions and verify layout adjustment and accessibility of controls
         frame = context.pages[-1]
         # Toggle theme button to check UI responsiveness
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div[2]/button').nth(0)
+        elem = frame.locator("role=button[name='Toggle theme']").nth(0)  # locator: nav.theme_toggle
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -93,7 +93,7 @@ async def run_test():
 
         frame = context.pages[-1]
         # Click 'Explore Tools' button to check tool panel visibility and functionality on desktop view
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section/div[3]/button').nth(0)
+        elem = frame.locator("role=button[name='Explore Tools']").nth(0)  # locator: hub.explore_tools
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -107,7 +107,7 @@ async def run_test():
 
         frame = context.pages[-1]
         # Click 'Explore Tools' button to check tool panel visibility and functionality on desktop view
-        elem = frame.locator('xpath=html/body/div/div[2]/main/section[3]/div/div[2]/a[4]').nth(0)
+        elem = frame.locator("a[href='/grid'] >> visible=true").nth(0)  # locator: tool_link.grid
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -139,7 +139,7 @@ async def run_test():
 
         frame = context.pages[-1]
         # Click 'Back to Hub' button to test navigation and UI responsiveness on tablet view
-        elem = frame.locator('xpath=html/body/div/div[2]/main/div/div/div/a/button').nth(0)
+        elem = frame.locator("role=button[name='Back to Hub']").nth(0)  # locator: nav.back_to_hub
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -159,7 +159,7 @@ async def run_test():
 
         frame = context.pages[-1]
         # Click 'Toggle theme' button to check UI responsiveness on mobile view
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div[2]/button').nth(0)
+        elem = frame.locator("role=button[name='Toggle theme']").nth(0)  # locator: nav.theme_toggle
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -264,7 +264,6 @@ async def run_test():
         await expect(frame.locator('text=Contact').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Privacy').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Terms').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -49,20 +49,20 @@ async def run_test():
         # -> Click on the 'Meta Tags' button to open the Meta Tags Generator tool
         frame = context.pages[-1]
         # Click on the 'Meta Tags' button to open the Meta Tags Generator tool 
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[9]/button').nth(0)
+        elem = frame.locator("a[href='/meta'] >> visible=true").nth(0)  # locator: tool_link.meta
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Click on the button or link to generate sitemap and structured data
         frame = context.pages[-1]
         # Click on the 'Meta' button or relevant element to navigate or open sitemap and structured data generation tool 
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[9]/button').nth(0)
+        elem = frame.locator("a[href='/meta'] >> visible=true").nth(0)  # locator: tool_link.meta
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         # -> Click on the button or link to generate sitemap and structured data.
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[9]/button').nth(0)
+        elem = frame.locator("a[href='/meta'] >> visible=true").nth(0)  # locator: tool_link.meta
         await page.wait_for_timeout(3000); await elem.click(timeout=5000) 
         # -> Click on the button or link to generate sitemap and structured data
         frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div[2]/nav/div/div/div/div/a[9]/button').nth(0)
+        elem = frame.locator("a[href='/meta'] >> visible=true").nth(0)  # locator: tool_link.meta
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
@@ -72,7 +72,6 @@ async def run_test():
             await expect(frame.locator('text=SEO Optimization Complete').first).to_be_visible(timeout=30000)
         except AssertionError:
             raise AssertionError('Test case failed: SEO utilities did not generate valid meta tags, sitemap XML, and structured data as per SEO best practices and standards.')
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -87,7 +87,6 @@ async def run_test():
             await expect(frame.locator('text=Subscription Active - Access Granted').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: Supabase backend integration for user subscription management did not complete successfully. User session establishment, subscription status retrieval, session clearance on sign out, or access denial when signed out did not behave as expected.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -0,0 +1,45 @@
+"""Harness for running the generated TestSprite ``TC*.py`` scripts as a suite.
+
+Modules with their own command line (``executor``, ``flakes``, ``locators``,
+``store``, ...) are not imported here, so ``python -m harness.<module>`` runs
+them only once.
+"""
+
+from .artifacts import ArtifactFlush
+from .fixtures import StorageSeed, open_tool, storage_state, tool_url
+from .hooks import ContextHook
+from .loader import TestCase, discover, load_case, load_cases
+from .mainthread import MainThreadMonitor
+from .plan import PlanCase, load_plan
+from .results import merge_results, record_durations
+from .runner import plan_shards, run_sharded
+from .session import CaseResult, FailureBudget, SuiteSession, run_concurrent, run_sequential
+from .steps import StepTimer
+from .waits import SmartWaits
+
+__all__ = [
+    "ArtifactFlush",
+    "CaseResult",
+    "ContextHook",
+    "FailureBudget",
+    "MainThreadMonitor",
+    "PlanCase",
+    "SmartWaits",
+    "StepTimer",
+    "StorageSeed",
+    "SuiteSession",
+    "TestCase",
+    "discover",
+    "load_case",
+    "load_cases",
+    "load_plan",
+    "merge_results",
+    "open_tool",
+    "plan_shards",
+    "record_durations",
+    "run_concurrent",
+    "run_sequential",
+    "run_sharded",
+    "storage_state",
+    "tool_url",
+]
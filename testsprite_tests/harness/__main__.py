@@ -0,0 +1,210 @@
+"""Command line entry point: ``python -m harness [TC001 TC009 ...]``.
+
+Run from the ``testsprite_tests`` directory.
+"""
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+
+from .artifacts import ArtifactFlush
+from .bisect_steps import bisect
+from .fixtures import bake_storage_state
+from .flakes import flake_rates, quarantined
+from .har_cache import HarReplay, ensure_recorded
+from .impact import affected_tcs
+from .loader import discover
+from .mainthread import MainThreadMonitor
+from .profiles import profile_names
+from .report import build_report
+from .results import last_statuses, new_run_id, record_durations
+from .runner import run_sharded, sources_for
+from .static_server import serve_dist
+from .steps import StepTimer, timings_path
+from .store import append_results, export_view
+from .waits import SmartWaits
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness", description=__doc__)
+    parser.add_argument("tests", nargs="*", help="TC ids to run (default: all)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument(
+        "--profile", choices=profile_names(),
+        help="Chromium launch profile (default: launchProfile in tmp/config.json)",
+    )
+    parser.add_argument(
+        "--fixed-waits",
+        action="store_true",
+        help="keep the scripts' fixed wait_for_timeout sleeps instead of settle waits",
+    )
+    parser.add_argument(
+        "--artifacts", choices=("failed", "always", "never"), default="failed",
+        help="when to keep final screenshots and console logs (default: failed)",
+    )
+    parser.add_argument("--trace", action="store_true", help="also record a Playwright trace")
+    parser.add_argument(
+        "--dist", action="store_true",
+        help="build dist/ if stale and serve it like nginx-spa.conf on the localEndpoint port",
+    )
+    parser.add_argument(
+        "--har", action="store_true",
+        help="serve app assets from the HAR cache for this build (recorded first if missing)",
+    )
+    parser.add_argument(
+        "--seed-storage", action="store_true",
+        help="start every context with the favorites/presets/theme from harness.fixtures",
+    )
+    parser.add_argument(
+        "--no-step-timings", action="store_true",
+        help="do not write tmp/step_timings-<run id>.jsonl",
+    )
+    parser.add_argument(
+        "--no-main-thread", action="store_true",
+        help="do not record long tasks, layout shifts and input latency per TC",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=1,
+        help="worker processes, each with its own browser (default: 1)",
+    )
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=1,
+        help="tests run at once per worker, each in its own context (default: 1)",
+    )
+    parser.add_argument(
+        "--changed", nargs="?", const="HEAD", metavar="REF",
+        help="run only the TCs affected by changes since REF (default: HEAD, i.e. uncommitted)",
+    )
+    order = parser.add_mutually_exclusive_group()
+    order.add_argument(
+        "--failed-first", action="store_true",
+        help="run the TCs that did not pass last time first",
+    )
+    order.add_argument(
+        "--only-failed", action="store_true",
+        help="run only the TCs that did not pass last time",
+    )
+    parser.add_argument(
+        "--max-failures", type=int, metavar="N",
+        help="start no further TCs once N have failed",
+    )
+    parser.add_argument(
+        "--retries", type=int, default=1,
+        help="rerun a failing TC up to this many times, each in a fresh context (default: 1)",
+    )
+    parser.add_argument(
+        "--no-quarantine", action="store_true",
+        help="let flaky TCs decide the exit status like any other TC",
+    )
+    parser.add_argument(
+        "--bisect", action="store_true",
+        help="afterwards, bisect each failing TC to its first failing action",
+    )
+    parser.add_argument(
+        "--no-write", action="store_true",
+        help="do not record results, durations, test_results.json or the report",
+    )
+    args = parser.parse_args(argv)
+
+    tc_ids = [path.name.split("_", 1)[0] for path in discover(only=args.tests or None)]
+    if args.changed:
+        impact = affected_tcs(args.changed)
+        tc_ids = [tc_id for tc_id in tc_ids if tc_id in impact.reasons]
+        for tc_id in tc_ids:
+            print(f"changed {tc_id}  {impact.reasons[tc_id][0]}")
+        if not tc_ids:
+            print(f"no TCs affected by changes since {args.changed}")
+            return 0
+    if args.failed_first or args.only_failed:
+        statuses = last_statuses()
+        failed = [tc_id for tc_id in tc_ids if statuses.get(tc_id, "PASSED") != "PASSED"]
+        rest = [] if args.only_failed else [tc_id for tc_id in tc_ids if tc_id not in failed]
+        tc_ids = failed + rest
+        if not tc_ids:
+            print("nothing failed in the last results")
+            return 0
+    hook_factories = [] if args.fixed_waits else [SmartWaits]
+    hook_factories.append(partial(ArtifactFlush, mode=args.artifacts, trace=args.trace))
+    run_id = new_run_id()
+    if not args.no_step_timings:
+        # After SmartWaits, so the wait it times is the settle wait.
+        hook_factories.append(partial(StepTimer, run_id))
+    if not args.no_main_thread:
+        hook_factories.append(MainThreadMonitor)
+    session_options = {"profile": args.profile, "hook_factories": hook_factories, "retries": args.retries}
+    if args.headed:
+        session_options["headless"] = False
+    if args.seed_storage:
+        session_options["storage_state"] = str(bake_storage_state())
+    held = [] if args.no_quarantine else [tc for tc in quarantined(flake_rates()) if tc in tc_ids]
+    blocking = [tc_id for tc_id in tc_ids if tc_id not in held]
+
+    with serve_dist() if args.dist else nullcontext(), ThreadPoolExecutor(1) as background:
+        if args.har:
+            # Recorded from the server that is up now, so a missing dist HAR is recorded from dist/.
+            hook_factories.append(partial(HarReplay, ensure_recorded("dist" if args.dist else "dev")))
+        # The quarantine shard runs alongside, in its own browser, outside the failure budget.
+        held_future = background.submit(run_sharded, held, 1, **session_options) if held else None
+        results = []
+        if blocking:
+            results = run_sharded(
+                blocking, args.workers, args.concurrency, max_failures=args.max_failures, **session_options
+            )
+        held_results = held_future.result() if held_future else []
+        failing = [result.tc_id for result in results if not result.passed]
+        bisected = []
+        if args.bisect and failing:
+            # ActionLimit does the step counting, so StepTimer stays out of these runs.
+            bisect_options = dict(session_options, retries=0)
+            bisect_options["hook_factories"] = [
+                factory for factory in hook_factories if getattr(factory, "func", None) is not StepTimer
+            ]
+            bisected = bisect(failing, **bisect_options)
+
+    if not args.no_write:
+        all_results = sorted(results + held_results, key=lambda result: result.tc_id)
+        append_results(all_results, sources_for(tc_ids), run_id, quarantined=held)
+        export_view()
+        build_report()
+        record_durations(all_results)
+
+    for result in sorted(results + held_results, key=lambda result: result.tc_id):
+        note = "  (quarantined)" if result.tc_id in held else ""
+        print(f"{result.status:<7} {result.duration_s:6.1f}s  {result.title}{note}")
+        if result.flaky:
+            print(f"        flaky: passed on attempt {result.attempts}")
+        if result.waits:
+            print(
+                f"        {result.waits} waits: {result.waited_s:.1f}s spent"
+                f" of {result.wait_budget_s:.1f}s fixed budget"
+            )
+        if result.long_tasks or result.worst_inp_ms:
+            worst = f" ({result.worst_input})" if result.worst_input else ""
+            print(
+                f"        main thread: TBT {result.tbt_ms:.0f}ms over {result.long_tasks} long tasks,"
+                f" worst INP {result.worst_inp_ms:.0f}ms{worst}"
+            )
+        if result.error:
+            print(f"        {result.error.splitlines()[0]}")
+        if result.artifacts:
+            print(f"        artifacts: {result.artifacts}")
+    failed = sum(not result.passed for result in results)
+    not_run = len(blocking) - len(results)
+    summary = f"\n{len(results) - failed} passed, {failed} failed"
+    if not_run:
+        summary += f", {not_run} not run"
+    if held:
+        held_failed = sum(not result.passed for result in held_results)
+        summary += f"; {len(held)} quarantined ({held_failed} failed, not counted)"
+    print(summary)
+    for result in bisected:
+        print(f"bisect  {result.describe()}")
+    if timings_path(run_id).exists():
+        print(f"step timings: {timings_path(run_id)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Explicit end-of-test artifact capture.
+
+The scripts used to end their passing path with ``await asyncio.sleep(5)`` so
+that recordings could catch up. Under the harness the final state is captured
+on purpose instead: when the script closes its context, ``ArtifactFlush``
+takes a screenshot of every open page, writes the console log and, if
+enabled, stops the Playwright trace. Then the context closes immediately.
+
+Artifacts land in ``tmp/artifacts/<TC id>/attempt-<n>/``, one directory per
+attempt, so a retry never overwrites the failure before it. With the default
+``mode="failed"`` an attempt's directory is removed again when it passes; the
+earlier failed attempts of a flaky test are kept.
+"""
+
+import shutil
+from pathlib import Path
+
+from playwright import async_api
+
+from .config import TMP_DIR
+from .hooks import ContextHook
+
+ARTIFACTS_DIR = TMP_DIR / "artifacts"
+
+
+class ArtifactFlush(ContextHook):
+    def __init__(self, mode: str = "failed", trace: bool = False, root: Path = ARTIFACTS_DIR):
+        if mode not in ("always", "failed", "never"):
+            raise ValueError(f"Unknown artifact mode: {mode!r}")
+        self.mode = mode
+        self.trace = trace
+        self.root = root
+        self.directory: Path | None = None
+        # context -> its 1-based index in the test and its console lines.
+        self._contexts: dict[async_api.BrowserContext, tuple[int, list[str]]] = {}
+
+    def start(self, case) -> None:
+        case_directory = self.root / case.tc_id
+        if self.attempt == 1 and case_directory.exists():
+            # Left over from an earlier run of the suite.
+            shutil.rmtree(case_directory)
+        self.directory = case_directory / f"attempt-{self.attempt}"
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        if self.mode == "never":
+            return
+        console: list[str] = []
+        self._contexts[context] = (len(self._contexts) + 1, console)
+        context.on("page", lambda page: self._watch_console(page, console))
+        if self.trace:
+            await context.tracing.start(screenshots=True, snapshots=True, sources=False)
+
+    @staticmethod
+    def _watch_console(page: async_api.Page, console: list[str]) -> None:
+        page.on("console", lambda message: console.append(f"[{message.type}] {message.text}"))
+        page.on("pageerror", lambda error: console.append(f"[pageerror] {error}"))
+
+    async def before_close(self, context: async_api.BrowserContext) -> None:
+        if self.mode == "never" or self.directory is None or context not in self._contexts:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        index, console = self._contexts[context]
+        prefix = f"context{index}-" if index > 1 else ""
+
+        for number, page in enumerate(context.pages):
+            try:
+                await page.screenshot(path=self.directory / f"{prefix}page{number}.png")
+            except async_api.Error:
+                pass  # Page crashed or is mid-navigation; the console log still helps.
+        if self.trace:
+            await context.tracing.stop(path=self.directory / f"{prefix}trace.zip")
+        (self.directory / f"{prefix}console.log").write_text("\n".join(console) + "\n", encoding="utf-8")
+
+    def finish(self, result) -> None:
+        if self.directory is None or not self.directory.exists():
+            return
+        if self.mode != "failed" or not result.passed:
+            result.artifacts = str(self.directory)
+            return
+        shutil.rmtree(self.directory)
+        case_directory = self.directory.parent
+        if any(case_directory.iterdir()):
+            # Passed on a retry: point at the failed attempts before it.
+            result.artifacts = str(case_directory)
+        else:
+            case_directory.rmdir()
@@ -0,0 +1,114 @@
+"""Compare launch profiles on wall-clock time and memory.
+
+    python -m harness.bench_profiles                       # every profile, all TCs
+    python -m harness.bench_profiles -p single-process throughput -c 4 TC001 TC009
+
+Each profile runs the selected TCs on a fresh suite session. While the
+run is in progress, the resident memory of this process and all of its
+descendants (Playwright driver and every Chromium process) is sampled from
+``/proc``. The summary goes to stdout and ``tmp/profile_bench.json``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from .config import TMP_DIR
+from .loader import load_cases
+from .profiles import profile_names
+from .session import run_concurrent
+
+BENCH_PATH = TMP_DIR / "profile_bench.json"
+SAMPLE_INTERVAL_S = 0.25
+
+
+def process_tree_rss(root_pid: int | None = None) -> int:
+    """Total RSS in bytes of ``root_pid`` and its descendants (Linux only, else 0)."""
+    root_pid = os.getpid() if root_pid is None else root_pid
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return 0
+
+    children: dict[int, list[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The command name may contain spaces, so split after its closing paren.
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total, pending = 0, [root_pid]
+    while pending:
+        pid = pending.pop()
+        try:
+            total += int((proc / str(pid) / "statm").read_text().split()[1]) * page_size
+        except OSError:
+            pass
+        pending.extend(children.get(pid, []))
+    return total
+
+
+async def _sample_rss(samples: list[int], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        samples.append(process_tree_rss())
+        try:
+            await asyncio.wait_for(stop.wait(), SAMPLE_INTERVAL_S)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def bench_profile(profile: str, tc_ids: list[str], concurrency: int) -> dict:
+    cases = load_cases(only=tc_ids or None)
+    samples: list[int] = []
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sample_rss(samples, stop))
+
+    start = time.perf_counter()
+    results = await run_concurrent(cases, concurrency, profile=profile)
+    wall_s = time.perf_counter() - start
+
+    stop.set()
+    await sampler
+    mib = 1024 * 1024
+    return {
+        "profile": profile,
+        "tests": len(results),
+        "passed": sum(result.passed for result in results),
+        "concurrency": concurrency,
+        "wall_s": round(wall_s, 2),
+        "peak_rss_mib": round(max(samples, default=0) / mib, 1),
+        "mean_rss_mib": round(sum(samples) / len(samples) / mib, 1) if samples else 0.0,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench_profiles", description=__doc__)
+    parser.add_argument("tests", nargs="*", help="TC ids to run (default: all)")
+    parser.add_argument("-p", "--profiles", nargs="+", choices=profile_names(), default=None)
+    parser.add_argument("-c", "--concurrency", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    profiles = args.profiles or [name for name in profile_names() if name != "debug"]
+    rows = [asyncio.run(bench_profile(name, args.tests, args.concurrency)) for name in profiles]
+
+    print(f"{'profile':<16}{'wall s':>9}{'peak MiB':>10}{'mean MiB':>10}{'passed':>8}")
+    for row in rows:
+        print(
+            f"{row['profile']:<16}{row['wall_s']:>9.1f}{row['peak_rss_mib']:>10.1f}"
+            f"{row['mean_rss_mib']:>10.1f}{row['passed']:>5}/{row['tests']}"
+        )
+    BENCH_PATH.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
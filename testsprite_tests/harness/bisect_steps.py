@@ -0,0 +1,161 @@
+"""Find the first failing action of a failing TC script.
+
+A generated script is a flat list of actions ending in an assertion, and it
+stops at the first action that raises. So when an action fails, the normal
+run already names it: it is the last action recorded, and no rerun is needed.
+
+That leaves the usual case: every action succeeds and the script's closing
+assertion fails, either an ``expect(...)`` or a bare ``assert``. Here the
+culprit is the action that put the page in the state the assertion rejects.
+:class:`ActionLimit` runs only the first ``k`` actions and skips the rest.
+``expect`` calls are not actions to it; they always run, so the script still
+reaches its assertion. A binary search over ``k`` finds the shortest prefix
+after which the assertion fails the same way, in about ``log2(n)`` further
+runs. Each run uses a fresh context on the same browser.
+
+    python -m harness --only-failed --bisect
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+from .loader import load_cases
+from .session import CaseResult, SuiteSession
+from .steps import StepTimer
+
+
+def is_assertion(row: dict) -> bool:
+    return row["action"].startswith("expect.")
+
+
+class ActionLimit(StepTimer):
+    """Run a script's first ``limit`` actions and skip the rest.
+
+    Skipped actions return ``None`` without running. ``expect.*`` calls are
+    neither counted nor skipped, so the script reaches its assertions. Rows
+    are kept in memory only.
+    """
+
+    def __init__(self, limit: int | None = None):
+        super().__init__(run_id="bisect")
+        self.limit = limit
+        self.taken = 0
+
+    def before_action(self, action: str, line: int) -> bool:
+        if action.startswith("expect."):
+            return True
+        if self.limit is not None and self.taken >= self.limit:
+            return False
+        self.taken += 1
+        return True
+
+    @property
+    def actions(self) -> list[dict]:
+        """The rows of actions that ran, without the assertions."""
+        return [row for row in self.rows if not is_assertion(row)]
+
+    def flush(self) -> None:
+        pass
+
+
+@dataclass
+class BisectResult:
+    tc_id: str
+    actions: int
+    runs: int
+    first_failing: int = 0
+    line: int = 0
+    step: str = ""
+    action: str = ""
+    error: str = ""
+    # The failing part is the final assertion, after the first ``first_failing`` actions.
+    assertion: bool = False
+
+    def describe(self) -> str:
+        if not self.error:
+            return f"{self.tc_id}: passed on rerun ({self.runs} run)"
+        if not self.assertion:
+            return (
+                f"{self.tc_id}: action {self.first_failing}/{self.actions} fails"
+                f" ({self.runs} run) - line {self.line} {self.action}: {self.step}"
+            )
+        error = self.error.splitlines()[0]
+        if not self.first_failing:
+            return f"{self.tc_id}: the final assertion fails even with no actions ({self.runs} runs): {error}"
+        return (
+            f"{self.tc_id}: the final assertion fails once action {self.first_failing}/{self.actions} has run"
+            f" ({self.runs} runs) - line {self.line} {self.action}: {self.step}: {error}"
+        )
+
+
+def _failing_row(limiter: ActionLimit) -> dict | None:
+    return next((row for row in limiter.rows if not row["ok"]), None)
+
+
+async def _run_prefix(
+    session: SuiteSession, case, limit: int | None
+) -> tuple[CaseResult, ActionLimit]:
+    limiter = ActionLimit(limit)
+    result = await session.run_case(case, extra_hooks=[limiter])
+    return result, limiter
+
+
+def _take_row(bisected: BisectResult, row: dict) -> None:
+    bisected.line, bisected.step, bisected.action = row["line"], row["step"], row["action"]
+
+
+def _same_failure(
+    result: CaseResult, limiter: ActionLimit, failed: CaseResult, failed_row: dict | None
+) -> bool:
+    """Whether a prefix run failed at the assertion the full run failed at."""
+    if result.passed:
+        return False
+    if failed_row is not None:
+        row = _failing_row(limiter)
+        return row is not None and row["line"] == failed_row["line"]
+    # A bare assert: no row, so compare the error it raised.
+    return _failing_row(limiter) is None and result.error == failed.error
+
+
+async def bisect_case(session: SuiteSession, case) -> BisectResult:
+    result, limiter = await _run_prefix(session, case, None)
+    actions = limiter.actions
+    bisected = BisectResult(case.tc_id, actions=len(actions), runs=1, error=result.error)
+    if result.passed:
+        return bisected
+    row = _failing_row(limiter)
+    if row is not None and not is_assertion(row):
+        # The script stopped at this action; it is the last one recorded.
+        bisected.first_failing = actions.index(row) + 1
+        _take_row(bisected, row)
+        return bisected
+
+    # Every action succeeded and an assertion after them failed. Find the
+    # shortest prefix after which it fails the same way.
+    # Invariant: the prefix of ``high`` actions fails, the prefix of ``low - 1`` passes.
+    bisected.assertion = True
+    low, high = 0, len(actions)
+    while low < high:
+        middle = (low + high) // 2
+        prefix_result, prefix_limiter = await _run_prefix(session, case, middle)
+        bisected.runs += 1
+        if _same_failure(prefix_result, prefix_limiter, result, row):
+            high = middle
+        else:
+            low = middle + 1
+
+    bisected.first_failing = high
+    if high:
+        _take_row(bisected, actions[high - 1])
+    return bisected
+
+
+async def bisect_cases(tc_ids: list[str], **session_options) -> list[BisectResult]:
+    """Bisect each of ``tc_ids`` in turn over one shared browser."""
+    cases = load_cases(only=tc_ids)
+    async with SuiteSession(**session_options) as session:
+        return [await bisect_case(session, case) for case in cases]
+
+
+def bisect(tc_ids: list[str], **session_options) -> list[BisectResult]:
+    return asyncio.run(bisect_cases(tc_ids, **session_options))
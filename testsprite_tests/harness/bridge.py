@@ -0,0 +1,398 @@
+"""Call the ``src/lib`` functions from Python in bulk, without going through the UI.
+
+Checking logic such as contrast ratios, prompt scores or schema markup by
+clicking through a tool costs seconds per data point. :class:`LibBridge`
+opens the app's origin once and imports ``src/lib`` modules in the page.
+Those are ``color-utils``, ``prompt-quality``, ``grid-presets``,
+``schema-markup`` and ``seo``. Their functions are then called over whole
+input columns:
+
+    async with LibBridge() as lib:
+        ratios = await lib.map(
+            "color-utils", "getContrastRatio", foregrounds, backgrounds,
+            prepare="(a, b) => [hex(a), hex(b)]", dtype="f8",
+        )
+        score = await lib.call("prompt-quality", "analyzePromptQuality", state)
+
+* Each column is a NumPy array or a plain sequence. Numeric arrays travel
+  as base64 typed arrays; anything else goes as JSON.
+* Inputs are sent in chunks of ``chunk`` rows, one ``page.evaluate`` per
+  chunk. With ``workers`` > 1 the chunks go round-robin to that many pages,
+  each in its own context and renderer, and results come back in input order.
+* ``prepare`` and ``transform`` are JavaScript functions, as source. They
+  turn a row into the call's arguments and the return value into what is
+  sent back. ``hex(n)`` formats ``0xRRGGBB`` integers as ``"#rrggbb"``.
+* With ``dtype`` the results are written into a typed array in the page.
+  A function returning ``[r, g, b]`` fills an ``(N, 3)`` array. Without
+  ``dtype`` they come back as a JSON list. :meth:`LibBridge.imap` yields
+  each chunk as it arrives.
+
+The modules are imported by source path, which only the Vite dev server
+serves; the production build has no per-module URLs. NumPy is needed for
+array columns and ``dtype`` only.
+
+    python -m harness.bridge exports prompt-quality
+    python -m harness.bridge call color-utils getContrastRatio '"#777777"' '"#ffffff"'
+    python -m harness.bridge bench -n 1000000 --workers 2
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import sys
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # Optional; only array columns and typed results need it.
+    np = None
+
+from .config import local_endpoint
+from .session import SuiteSession
+
+# Module name -> the path the dev server serves it at.
+LIB_MODULES = {
+    "color-utils": "/src/lib/color-utils.ts",
+    "prompt-quality": "/src/lib/prompt-quality.ts",
+    "grid-presets": "/src/lib/grid-presets.ts",
+    "schema-markup": "/src/lib/schema-markup.ts",
+    "seo": "/src/lib/seo.ts",
+}
+CHUNK = 50_000
+# "kind + itemsize" of a NumPy dtype -> the typed array the page uses for it.
+TYPED_ARRAYS = {
+    "f8": "Float64Array",
+    "f4": "Float32Array",
+    "i4": "Int32Array",
+    "u4": "Uint32Array",
+    "i2": "Int16Array",
+    "u2": "Uint16Array",
+    "i1": "Int8Array",
+    "u1": "Uint8Array",
+}
+
+_INSTALL_JS = """(typedArrays) => {
+    if (window.__harnessLib) return;
+    const types = Object.fromEntries(Object.entries(typedArrays).map(([key, name]) => [key, window[name]]));
+    const hex = n => "#" + n.toString(16).padStart(6, "0");
+    const modules = {};
+    const compiled = {};
+    const load = async path => modules[path] ??= await import(path);
+    const compile = source => compiled[source] ??= new Function("hex", `return (${source});`)(hex);
+    const decode = ({type, data}) => {
+        const binary = atob(data);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+        return new types[type](bytes.buffer);
+    };
+    const encode = array => {
+        const bytes = new Uint8Array(array.buffer, array.byteOffset, array.byteLength);
+        let binary = "";
+        for (let i = 0; i < bytes.length; i += 0x8000) {
+            binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+        }
+        return btoa(binary);
+    };
+    const lookup = async (path, name) => {
+        const module = await load(path);
+        if (!(name in module)) throw new Error(`${path} does not export ${name}`);
+        return module[name];
+    };
+    window.__harnessLib = {
+        exports: async path => Object.keys(await load(path)),
+        value: async (path, name) => lookup(path, name),
+        call: async (path, name, args) => (await lookup(path, name))(...args),
+        map: async ({path, name, columns, prepare, transform, type}) => {
+            const fn = await lookup(path, name);
+            const values = columns.map(column => Array.isArray(column) ? column : decode(column));
+            const rows = values.length ? values[0].length : 0;
+            const toArgs = prepare ? compile(prepare) : (...row) => row;
+            const after = transform ? compile(transform) : result => result;
+            const results = new Array(rows);
+            for (let i = 0; i < rows; i++) {
+                try {
+                    results[i] = after(fn(...toArgs(...values.map(column => column[i]))));
+                } catch (error) {
+                    return {error: String(error?.message ?? error), index: i};
+                }
+            }
+            if (!type) return {json: results};
+            const nested = rows > 0 && Array.isArray(results[0]);
+            const width = nested ? results[0].length : 1;
+            const out = new types[type](rows * width);
+            if (nested) results.forEach((result, i) => out.set(result, i * width));
+            else out.set(results);
+            return {data: encode(out), nested, width};
+        },
+    };
+}"""
+
+
+class LibCallError(RuntimeError):
+    """A ``src/lib`` function threw for one of the inputs."""
+
+
+def module_path(module: str) -> str:
+    """The dev-server path of ``module``, a :data:`LIB_MODULES` name or a ``/src/...`` path."""
+    if module.startswith("/"):
+        return module
+    try:
+        return LIB_MODULES[module]
+    except KeyError:
+        raise KeyError(f"Unknown lib module {module!r}; known: {', '.join(LIB_MODULES)}") from None
+
+
+def _typed_key(dtype) -> str:
+    dtype = np.dtype(dtype)
+    key = f"{dtype.kind}{dtype.itemsize}"
+    if key not in TYPED_ARRAYS:
+        raise TypeError(f"No typed array for dtype {dtype}; use one of {', '.join(TYPED_ARRAYS)}")
+    return key
+
+
+def _column_payload(column) -> list | dict:
+    if np is not None and isinstance(column, np.ndarray) and column.dtype.kind in "fiu":
+        key = _typed_key(column.dtype)
+        data = np.ascontiguousarray(column, dtype=np.dtype(key).newbyteorder("<")).tobytes()
+        return {"type": key, "data": base64.b64encode(data).decode("ascii")}
+    return column.tolist() if hasattr(column, "tolist") else list(column)
+
+
+class LibBridge:
+    """``src/lib`` modules of the app at ``endpoint``, callable from Python.
+
+    Use as ``async with LibBridge() as lib:``. It starts its own
+    :class:`~harness.session.SuiteSession` unless ``session`` is given.
+    """
+
+    def __init__(
+        self,
+        endpoint: str | None = None,
+        workers: int = 1,
+        chunk: int = CHUNK,
+        session: SuiteSession | None = None,
+        **session_options,
+    ):
+        self.endpoint = endpoint or local_endpoint()
+        self.workers = max(1, workers)
+        self.chunk = max(1, chunk)
+        self._session = session
+        self._owns_session = session is None
+        session_options.setdefault("hook_factories", [])
+        self._session_options = session_options
+        self._contexts = []
+        self.pages = []
+
+    async def __aenter__(self) -> "LibBridge":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        if self._session is None:
+            self._session = SuiteSession(**self._session_options)
+            await self._session.start()
+        for _ in range(self.workers):
+            context = await self._session.new_context()
+            page = await context.new_page()
+            await page.goto(self.endpoint, wait_until="domcontentloaded")
+            await page.evaluate(_INSTALL_JS, TYPED_ARRAYS)
+            self._contexts.append(context)
+            self.pages.append(page)
+
+    async def stop(self) -> None:
+        for context in self._contexts:
+            await context.close()
+        self._contexts.clear()
+        self.pages.clear()
+        if self._owns_session and self._session is not None:
+            await self._session.stop()
+            self._session = None
+
+    async def exports(self, module: str) -> list[str]:
+        return await self.pages[0].evaluate(
+            "path => window.__harnessLib.exports(path)", module_path(module)
+        )
+
+    async def value(self, module: str, name: str) -> Any:
+        """An exported constant, such as ``gridPresets``, as JSON."""
+        return await self.pages[0].evaluate(
+            "([path, name]) => window.__harnessLib.value(path, name)", [module_path(module), name]
+        )
+
+    async def call(self, module: str, name: str, *args) -> Any:
+        """One call of ``module.name(*args)``; arguments and result travel as JSON."""
+        return await self.pages[0].evaluate(
+            "([path, name, args]) => window.__harnessLib.call(path, name, args)",
+            [module_path(module), name, list(args)],
+        )
+
+    async def _map_chunk(
+        self, page, request: dict, columns: Sequence, start: int, stop: int, dtype
+    ) -> Any:
+        reply = await page.evaluate(
+            "request => window.__harnessLib.map(request)",
+            {**request, "columns": [_column_payload(column[start:stop]) for column in columns]},
+        )
+        if "error" in reply:
+            index = start + reply["index"]
+            row = [column[index] for column in columns]
+            raise LibCallError(f"{request['name']} failed for row {index} {row!r}: {reply['error']}")
+        if "json" in reply:
+            return reply["json"]
+        array = np.frombuffer(base64.b64decode(reply["data"]), dtype=np.dtype(dtype).newbyteorder("<"))
+        return array.reshape(-1, reply["width"]) if reply["nested"] else array
+
+    async def imap(
+        self,
+        module: str,
+        name: str,
+        *columns: Sequence,
+        prepare: str | None = None,
+        transform: str | None = None,
+        dtype=None,
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """Yield ``(first row, results)`` per chunk, in input order."""
+        if dtype is not None and np is None:
+            raise RuntimeError("NumPy is not installed; pip install numpy for typed results")
+        rows = len(columns[0]) if columns else 0
+        if any(len(column) != rows for column in columns):
+            raise ValueError("All columns must have the same length")
+        request = {
+            "path": module_path(module),
+            "name": name,
+            "prepare": prepare,
+            "transform": transform,
+            "type": _typed_key(dtype) if dtype is not None else None,
+        }
+        # Keep one chunk in flight per page, and hand results back in order.
+        pending: deque[tuple[int, asyncio.Task]] = deque()
+        try:
+            for number, start in enumerate(range(0, rows, self.chunk)):
+                page = self.pages[number % len(self.pages)]
+                stop = min(start + self.chunk, rows)
+                task = asyncio.ensure_future(self._map_chunk(page, request, columns, start, stop, dtype))
+                pending.append((start, task))
+                if len(pending) >= len(self.pages):
+                    first, oldest = pending.popleft()
+                    yield first, await oldest
+            while pending:
+                first, oldest = pending.popleft()
+                yield first, await oldest
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def map(
+        self,
+        module: str,
+        name: str,
+        *columns: Sequence,
+        prepare: str | None = None,
+        transform: str | None = None,
+        dtype=None,
+    ) -> Any:
+        """``module.name`` over every row: a NumPy array with ``dtype``, else a list."""
+        parts = [
+            part
+            async for _, part in self.imap(
+                module, name, *columns, prepare=prepare, transform=transform, dtype=dtype
+            )
+        ]
+        if dtype is None:
+            return [result for part in parts for result in part]
+        if not parts:
+            return np.empty(0, dtype=dtype)
+        return np.concatenate(parts)
+
+
+def _argument(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+async def bench(count: int, workers: int, chunk: int) -> list[tuple[str, int, float]]:
+    """Calls per second of a numeric, a string and an object-returning function."""
+    rng = np.random.default_rng(0)
+    colors = rng.integers(0, 1 << 24, count, dtype=np.uint32)
+    texts = [f"Summarise report {i} " * (i % 7 + 1) for i in range(min(count, 200_000))]
+    rows = []
+    async with LibBridge(workers=workers, chunk=chunk) as lib:
+        for label, run, calls in (
+            (
+                "color-utils.getContrastRatio",
+                lambda: lib.map(
+                    "color-utils", "getContrastRatio", colors, colors[::-1].copy(),
+                    prepare="(a, b) => [hex(a), hex(b)]", dtype="f8",
+                ),
+                count,
+            ),
+            (
+                "color-utils.hexToRgb",
+                lambda: lib.map("color-utils", "hexToRgb", colors, prepare="n => [hex(n)]", dtype="u1"),
+                count,
+            ),
+            (
+                "prompt-quality.estimateTokens",
+                lambda: lib.map("prompt-quality", "estimateTokens", texts, dtype="i4"),
+                len(texts),
+            ),
+            (
+                "prompt-quality.analyzePromptQuality",
+                lambda: lib.map(
+                    "prompt-quality", "analyzePromptQuality", texts[:20_000],
+                    prepare="task => [{task, context: '', persona: '', tone: '', format: ''}]",
+                    transform="quality => quality.score", dtype="i2",
+                ),
+                min(len(texts), 20_000),
+            ),
+        ):
+            start = time.perf_counter()
+            await run()
+            rows.append((label, calls, calls / (time.perf_counter() - start)))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bridge", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    exports = commands.add_parser("exports", help="list what a lib module exports")
+    exports.add_argument("module")
+    call = commands.add_parser("call", help="call one function; arguments are JSON, or plain strings")
+    call.add_argument("module")
+    call.add_argument("function")
+    call.add_argument("args", nargs="*")
+    timing = commands.add_parser("bench", help="calls per second through chunked page.evaluate")
+    timing.add_argument("-n", "--count", type=int, default=1_000_000)
+    timing.add_argument("--workers", type=int, default=1, help="pages, each in its own context")
+    timing.add_argument("--chunk", type=int, default=CHUNK, help="rows per page.evaluate")
+    args = parser.parse_args(argv)
+
+    async def run() -> None:
+        async with LibBridge() as lib:
+            if args.command == "exports":
+                print("\n".join(await lib.exports(args.module)))
+            else:
+                result = await lib.call(args.module, args.function, *map(_argument, args.args))
+                print(json.dumps(result, indent=2, ensure_ascii=False))
+
+    if args.command == "bench":
+        if np is None:
+            parser.error("NumPy is not installed; pip install numpy")
+        for label, calls, rate in asyncio.run(bench(max(1, args.count), args.workers, args.chunk)):
+            print(f"{label:<38}{calls:>10} calls  {rate:>12,.0f}/s")
+        return 0
+    asyncio.run(run())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
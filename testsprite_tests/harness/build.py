@@ -0,0 +1,46 @@
+"""Build inputs, build hash and the production ``dist/`` build."""
+
+import hashlib
+import subprocess
+from pathlib import Path
+
+from .config import REPO_ROOT
+
+DIST_DIR = REPO_ROOT / "dist"
+# Written into dist/ after a build so an unchanged tree is not rebuilt.
+BUILD_MARKER = ".build-hash"
+BUILD_INPUTS = [
+    "src",
+    "public",
+    "index.html",
+    "vite.config.ts",
+    "tailwind.config.ts",
+    "postcss.config.js",
+    "tsconfig.json",
+    "tsconfig.app.json",
+    "package-lock.json",
+]
+
+
+def build_hash(root: Path = REPO_ROOT) -> str:
+    """Short content hash of everything that affects the served assets."""
+    digest = hashlib.sha256()
+    for name in BUILD_INPUTS:
+        base = root / name
+        paths = [base] if base.is_file() else sorted(p for p in base.rglob("*") if p.is_file())
+        for path in paths:
+            digest.update(path.relative_to(root).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def build_dist(force: bool = False) -> Path:
+    """Run ``npm run build`` unless ``dist/`` already matches the current sources."""
+    current = build_hash()
+    marker = DIST_DIR / BUILD_MARKER
+    if not force and marker.exists() and marker.read_text().strip() == current:
+        return DIST_DIR
+    subprocess.run(["npm", "run", "build"], cwd=REPO_ROOT, check=True)
+    marker.write_text(current + "\n")
+    return DIST_DIR
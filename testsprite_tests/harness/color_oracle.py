@@ -0,0 +1,384 @@
+"""NumPy reference implementation of ``src/lib/color-utils.ts``, and a verifier for it.
+
+TC009 checks one contrast value through the UI: ``17.85:1`` for one pair of
+colours. This module re-implements the colour maths of
+``src/lib/color-utils.ts`` as array operations. It then checks the real
+TypeScript functions against that reference for millions of inputs:
+
+* ``hexToRgb``, ``hexToHsl`` and ``hslToHex``;
+* ``getLuminance`` and ``getContrastRatio``;
+* ``getWCAGLevel``;
+* ``generateShades``.
+
+The reference follows the TypeScript operation for operation: the same
+IEEE-754 double arithmetic in the same order, and ``Math.round`` rounding
+halves up. Integer and string results therefore have to match exactly.
+Luminance and contrast go through ``Math.pow``, which V8 and libm may round
+differently in the last bit. They are compared to a relative error of
+:data:`FLOAT_RTOL`.
+
+The verifier calls ``/src/lib/color-utils.ts`` on the Vite dev server
+through :class:`~harness.bridge.LibBridge`, so it runs the source as the
+app compiles it. Inputs go in chunks of ``--chunk``, one
+``page.evaluate`` per chunk and function. ``--all`` covers every 24-bit colour and every
+integer HSL triple. The default is a random sample.
+
+The reference covers valid input only: 3- or 6-digit hex, with or without
+``#``, and HSL within 0-360 / 0-100 / 0-100. ``parseInt``'s partial parsing
+of malformed hex is left out.
+
+NumPy is needed here but nowhere else in the harness: ``pip install numpy``.
+
+    python -m harness.color_oracle                  # 1,000,000 random colours
+    python -m harness.color_oracle --all            # all 16,777,216 colours
+"""
+
+import argparse
+import asyncio
+import functools
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+try:
+    import numpy as np
+except ImportError:  # Optional; only the oracle modules need it.
+    np = None
+
+from .bridge import CHUNK, LibBridge
+
+# generateShades: 50, 100, 200, ... 900, 950.
+SHADE_LIGHTNESSES = (95, 90, 80, 70, 60, 50, 40, 30, 20, 10, 5)
+FLOAT_RTOL = 1e-12
+EXAMPLES = 5
+# Inputs go to the page as 0xRRGGBB integers; the functions take "#rrggbb".
+_HEX_ARG = "n => [hex(n)]"
+_LEVEL_CODE = "result => ['fail', 'aa', 'aaa'].indexOf(result.level)"
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("NumPy is not installed; pip install numpy to use the colour oracle")
+
+
+@functools.cache
+def _hex_digit_values() -> "np.ndarray":
+    table = np.full(128, -1, dtype=np.int16)
+    for value, char in enumerate("0123456789abcdef"):
+        table[ord(char)] = table[ord(char.upper())] = value
+    return table
+
+
+@functools.cache
+def _hex_pairs() -> "np.ndarray":
+    return np.array([f"{value:02x}" for value in range(256)])
+
+
+def js_round(x: "np.ndarray") -> "np.ndarray":
+    """``Math.round``: nearest integer, halves towards +infinity."""
+    whole = np.floor(x)
+    # x - floor(x) is exact in binary floating point, so the tie test is too.
+    return whole + (x - whole >= 0.5)
+
+
+# -- color-utils.ts ---------------------------------------------------------------
+
+
+def hex_to_rgb(hexes) -> "np.ndarray":
+    """``hexToRgb`` of each string: an ``(N, 3)`` uint8 array."""
+    clean = np.char.replace(np.asarray(hexes, dtype=str).ravel(), "#", "", count=1)
+    short = np.char.str_len(clean) == 3
+    if short.any():
+        # "f0a" -> "ff00aa"
+        chars = np.ascontiguousarray(clean[short], dtype="<U3").view("<U1").reshape(-1, 3)
+        doubled = np.char.add(chars, chars)
+        clean = clean.astype("<U6")
+        clean[short] = np.char.add(np.char.add(doubled[:, 0], doubled[:, 1]), doubled[:, 2])
+    if (np.char.str_len(clean) != 6).any():
+        raise ValueError("Invalid hex color format")
+    codes = np.ascontiguousarray(clean, dtype="<U6").view(np.uint32).reshape(-1, 6)
+    digits = _hex_digit_values()[np.minimum(codes, 127)]
+    if (digits < 0).any():
+        raise ValueError("non-hex digit; parseInt's partial parsing is outside the oracle")
+    return (digits[:, 0::2] * 16 + digits[:, 1::2]).astype(np.uint8)
+
+
+def rgb_to_hex(rgb: "np.ndarray") -> "np.ndarray":
+    """``"#rrggbb"`` for each ``(..., 3)`` channel triple in 0-255."""
+    pairs = _hex_pairs()[np.asarray(rgb, dtype=np.intp)]
+    return np.char.add(np.char.add(np.char.add("#", pairs[..., 0]), pairs[..., 1]), pairs[..., 2])
+
+
+def hex_to_hsl(rgb: "np.ndarray") -> "np.ndarray":
+    """``hexToHsl`` of ``(..., 3)`` RGB: rounded ``(h, s, l)`` as int16."""
+    channels = np.asarray(rgb, dtype=np.float64) / 255
+    r, g, b = channels[..., 0], channels[..., 1], channels[..., 2]
+    high = np.maximum(np.maximum(r, g), b)
+    low = np.minimum(np.minimum(r, g), b)
+    lightness = (high + low) / 2
+    d = high - low
+    chromatic = high != low
+    with np.errstate(divide="ignore", invalid="ignore"):
+        saturation = np.where(lightness > 0.5, d / (2 - high - low), d / (high + low))
+        # The TypeScript switch tests r, then g, then b against the maximum.
+        hue = np.select(
+            [high == r, high == g],
+            [((g - b) / d + np.where(g < b, 6, 0)) / 6, ((b - r) / d + 2) / 6],
+            ((r - g) / d + 4) / 6,
+        )
+    hue = np.where(chromatic, hue, 0.0)
+    saturation = np.where(chromatic, saturation, 0.0)
+    hsl = np.stack([js_round(hue * 360), js_round(saturation * 100), js_round(lightness * 100)], axis=-1)
+    return hsl.astype(np.int16)
+
+
+def _hue_to_rgb(p: "np.ndarray", q: "np.ndarray", t: "np.ndarray") -> "np.ndarray":
+    t = np.where(t < 0, t + 1, t)
+    t = np.where(t > 1, t - 1, t)
+    return np.select(
+        [t < 1 / 6, t < 1 / 2, t < 2 / 3],
+        [p + (q - p) * 6 * t, q, p + (q - p) * (2 / 3 - t) * 6],
+        p,
+    )
+
+
+def hsl_to_rgb(h, s, l) -> "np.ndarray":
+    """The channels ``hslToHex`` formats, as a ``(..., 3)`` int array; inputs broadcast."""
+    h = np.asarray(h, dtype=np.float64) / 360
+    s = np.asarray(s, dtype=np.float64) / 100
+    l = np.asarray(l, dtype=np.float64) / 100
+    q = np.where(l < 0.5, l * (1 + s), l + s - l * s)
+    p = 2 * l - q
+    gray = s == 0
+    channels = np.stack(
+        [
+            np.where(gray, l, _hue_to_rgb(p, q, h + 1 / 3)),
+            np.where(gray, l, _hue_to_rgb(p, q, h)),
+            np.where(gray, l, _hue_to_rgb(p, q, h - 1 / 3)),
+        ],
+        axis=-1,
+    )
+    rounded = js_round(channels * 255)
+    if ((rounded < 0) | (rounded > 255)).any():
+        raise ValueError("HSL input outside 0-360 / 0-100 / 0-100")
+    return rounded.astype(np.intp)
+
+
+def hsl_to_hex(h, s, l) -> "np.ndarray":
+    """``hslToHex`` of each ``(h, s, l)``; inputs broadcast."""
+    return rgb_to_hex(hsl_to_rgb(h, s, l))
+
+
+def get_luminance(rgb: "np.ndarray") -> "np.ndarray":
+    """``getLuminance`` of ``(..., 3)`` RGB."""
+    c = np.asarray(rgb, dtype=np.float64) / 255
+    linear = np.where(c <= 0.03928, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    return 0.2126 * linear[..., 0] + 0.7152 * linear[..., 1] + 0.0722 * linear[..., 2]
+
+
+def get_contrast_ratio(rgb1: "np.ndarray", rgb2: "np.ndarray") -> "np.ndarray":
+    """``getContrastRatio`` of each pair."""
+    lum1, lum2 = get_luminance(rgb1), get_luminance(rgb2)
+    return (np.maximum(lum1, lum2) + 0.05) / (np.minimum(lum1, lum2) + 0.05)
+
+
+def get_wcag_level(ratio: "np.ndarray", text_size="normal") -> tuple["np.ndarray", "np.ndarray"]:
+    """``getWCAGLevel``: ``(level, passes)`` arrays; ``text_size`` may be an array too."""
+    large = np.asarray(text_size) == "large"
+    threshold = np.where(large, 3, 4.5)
+    aaa_threshold = np.where(large, 4.5, 7)
+    level = np.where(ratio >= aaa_threshold, "aaa", np.where(ratio >= threshold, "aa", "fail"))
+    return level, level != "fail"
+
+
+def generate_shades(rgb: "np.ndarray") -> "np.ndarray":
+    """``generateShades``: an ``(N, 11)`` array of hex strings, lightest first."""
+    hsl = hex_to_hsl(rgb)[:, None, :]
+    return hsl_to_hex(hsl[..., 0], hsl[..., 1], np.array(SHADE_LIGHTNESSES))
+
+
+# -- verifier -------------------------------------------------------------------
+
+
+def unpack_rgb(colors: "np.ndarray") -> "np.ndarray":
+    """``0xRRGGBB`` integers -> ``(N, 3)`` uint8."""
+    colors = np.asarray(colors, dtype=np.uint32)
+    return np.stack([colors >> 16, (colors >> 8) & 0xFF, colors & 0xFF], axis=-1).astype(np.uint8)
+
+
+@dataclass
+class Check:
+    name: str
+    checked: int = 0
+    mismatches: int = 0
+    max_rel_error: float = 0.0
+    # (input, expected, actual) of the first mismatches.
+    examples: list[tuple[str, str, str]] = field(default_factory=list)
+
+    def compare(
+        self, describe: Callable[[int], str], expected, actual, rtol: float | None = None
+    ) -> None:
+        """Count where ``actual`` differs from ``expected``; ``describe(i)`` names input ``i``."""
+        expected, actual = np.asarray(expected), np.asarray(actual)
+        if rtol is None:
+            wrong = expected != actual
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                error = np.where(expected == actual, 0.0, np.abs(actual - expected) / np.abs(expected))
+            self.max_rel_error = max(self.max_rel_error, float(error.max(initial=0.0)))
+            wrong = error > rtol
+        self.checked += len(expected)
+        self.mismatches += int(wrong.sum())
+        for index in np.flatnonzero(wrong)[: max(0, EXAMPLES - len(self.examples))]:
+            self.examples.append((describe(index), str(expected[index]), str(actual[index])))
+
+
+CHECKS = (
+    "hexToRgb",
+    "hexToHsl",
+    "hslToHex",
+    "getLuminance",
+    "getContrastRatio",
+    "getWCAGLevel",
+    "generateShades",
+)
+
+
+def _hsl_inputs(count: int, rng, exhaustive: bool) -> "np.ndarray":
+    if exhaustive:
+        h, s, l = np.meshgrid(np.arange(361), np.arange(101), np.arange(101), indexing="ij")
+        return (h.ravel() << 16 | s.ravel() << 8 | l.ravel()).astype(np.uint32)
+    return (
+        rng.integers(0, 361, count) << 16 | rng.integers(0, 101, count) << 8 | rng.integers(0, 101, count)
+    ).astype(np.uint32)
+
+
+def _level_codes(level: "np.ndarray") -> "np.ndarray":
+    return np.select([level == "aaa", level == "aa"], [2, 1], 0)
+
+
+def _pack(triples: "np.ndarray") -> "np.ndarray":
+    triples = np.asarray(triples, dtype=np.int64)
+    return triples[:, 0] << 16 | triples[:, 1] << 8 | triples[:, 2]
+
+
+async def query_chunk(lib: LibBridge, colors, partners, hsl) -> dict:
+    """The TypeScript results for one chunk of inputs, as arrays."""
+
+    def run(name: str, *columns, **options):
+        return lib.map("color-utils", name, *columns, **options)
+
+    out = {
+        "rgb": await run("hexToRgb", colors, prepare=_HEX_ARG, dtype="u1"),
+        "hsl": await run("hexToHsl", colors, prepare=_HEX_ARG, dtype="i2"),
+        "luminance": await run("getLuminance", colors, prepare=_HEX_ARG, dtype="f8"),
+        "ratio": await run(
+            "getContrastRatio", colors, partners, prepare="(a, b) => [hex(a), hex(b)]", dtype="f8"
+        ),
+        "shades": await run(
+            "generateShades", colors, prepare=_HEX_ARG, transform="shades => shades.join('')"
+        ),
+        "hslToHex": await run(
+            "hslToHex", *(part.astype(np.int16) for part in (hsl >> 16, hsl >> 8 & 0xFF, hsl & 0xFF))
+        ),
+    }
+    # Levels are asked for the page's own ratios, so a last-bit ratio difference cannot flip one.
+    levels = {
+        size: await run(
+            "getWCAGLevel", out["ratio"],
+            prepare=f"ratio => [ratio, '{size}']", transform=_LEVEL_CODE, dtype="i1",
+        )
+        for size in ("normal", "large")
+    }
+    out["wcag"] = levels["normal"].astype(np.int16) * 3 + levels["large"]
+    return out
+
+
+def check_chunk(checks: dict[str, Check], colors, partners, hsl, out: dict) -> None:
+    """Diff one chunk of page output, from :func:`query_chunk`, against the reference."""
+    rgb, partner_rgb = unpack_rgb(colors), unpack_rgb(partners)
+
+    def color(i: int) -> str:
+        return f"#{colors[i]:06x}"
+
+    def pair(i: int) -> str:
+        return f"#{colors[i]:06x} vs #{partners[i]:06x}"
+
+    def triple(i: int) -> str:
+        return f"hsl({hsl[i] >> 16}, {hsl[i] >> 8 & 0xFF}, {hsl[i] & 0xFF})"
+
+    checks["hexToRgb"].compare(color, colors, _pack(out["rgb"]))
+    checks["hexToHsl"].compare(color, _pack(hex_to_hsl(rgb)), _pack(out["hsl"]))
+    checks["getLuminance"].compare(color, get_luminance(rgb), out["luminance"], FLOAT_RTOL)
+    checks["getContrastRatio"].compare(pair, get_contrast_ratio(rgb, partner_rgb), out["ratio"], FLOAT_RTOL)
+    codes = _level_codes(get_wcag_level(out["ratio"], "normal")[0]) * 3 + _level_codes(
+        get_wcag_level(out["ratio"], "large")[0]
+    )
+    checks["getWCAGLevel"].compare(pair, codes, out["wcag"])
+    # Every shade is exactly 7 characters, so 11 of them join into one 77-character string.
+    shades = np.ascontiguousarray(generate_shades(rgb), dtype="<U7").view("<U77").ravel()
+    checks["generateShades"].compare(color, shades, np.asarray(out["shades"], dtype=str))
+
+    expected_hex = hsl_to_hex(hsl >> 16, hsl >> 8 & 0xFF, hsl & 0xFF)
+    checks["hslToHex"].compare(triple, expected_hex, np.asarray(out["hslToHex"], dtype=str))
+
+
+async def verify(
+    count: int = 1_000_000,
+    exhaustive: bool = False,
+    chunk: int = CHUNK,
+    seed: int = 0,
+    workers: int = 1,
+    endpoint: str | None = None,
+    **session_options,
+) -> list[Check]:
+    """Run the TypeScript functions over the inputs in the page and diff them with the reference."""
+    require_numpy()
+    rng = np.random.default_rng(seed)
+    if exhaustive:
+        colors = np.arange(1 << 24, dtype=np.uint32)
+    else:
+        colors = rng.integers(0, 1 << 24, count, dtype=np.uint32)
+    partners = rng.permutation(colors)
+    hsl = _hsl_inputs(count, rng, exhaustive)
+    checks = {name: Check(name) for name in CHECKS}
+    # Each batch is one chunk per worker page; holding all 2^24 results at once would not fit.
+    batches = -(-max(len(colors), len(hsl)) // (chunk * max(1, workers)))
+
+    async with LibBridge(endpoint, workers=workers, chunk=chunk, **session_options) as lib:
+        for colors_part, partners_part, hsl_part in zip(
+            np.array_split(colors, batches), np.array_split(partners, batches), np.array_split(hsl, batches)
+        ):
+            out = await query_chunk(lib, colors_part, partners_part, hsl_part)
+            check_chunk(checks, colors_part, partners_part, hsl_part, out)
+    return list(checks.values())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.color_oracle", description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=1_000_000, help="random colours to check")
+    parser.add_argument("--all", action="store_true", help="every 24-bit colour and integer HSL triple")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="colours per page.evaluate")
+    parser.add_argument("--workers", type=int, default=1, help="pages evaluating chunks in parallel")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if np is None:
+        parser.error("NumPy is not installed; pip install numpy")
+
+    start = time.perf_counter()
+    checks = asyncio.run(
+        verify(max(1, args.count), args.all, max(1, args.chunk), args.seed, max(1, args.workers))
+    )
+    for check in checks:
+        note = f"  max rel. error {check.max_rel_error:.1e}" if check.max_rel_error else ""
+        print(f"{check.name:<18}{check.checked:>10} checked{check.mismatches:>8} mismatches{note}")
+        for inputs, expected, actual in check.examples:
+            print(f"        {inputs}: expected {expected}, got {actual}")
+    failed = sum(check.mismatches for check in checks)
+    print(f"\n{'all match' if not failed else f'{failed} mismatches'} in {time.perf_counter() - start:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""Paths and settings shared by the TestSprite harness."""
+
+import json
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = TESTS_DIR.parent
+TMP_DIR = TESTS_DIR / "tmp"
+CONFIG_PATH = TMP_DIR / "config.json"
+RESULTS_PATH = TMP_DIR / "test_results.json"
+
+DEFAULT_ENDPOINT = "http://localhost:8080"
+
+
+def load_config() -> dict:
+    """Return the TestSprite ``tmp/config.json`` contents, or ``{}`` if absent."""
+    try:
+        return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def local_endpoint(config: dict | None = None) -> str:
+    """Base URL of the app under test, without a trailing slash."""
+    config = load_config() if config is None else config
+    return config.get("localEndpoint", DEFAULT_ENDPOINT).rstrip("/")
@@ -0,0 +1,536 @@
+"""Run the test plan directly, without a generated script per TC.
+
+Every step in ``testsprite_frontend_test_plan.json`` is a sentence such as
+"Navigate to the Glassmorphism Generator tool page". Handlers registered with
+:func:`step` match those sentences by regex and carry them out through
+:mod:`~harness.locators` names and the :mod:`~harness.pages` page objects.
+A new plan entry whose steps are already
+covered runs with no new code, every case gets a fresh context on one shared
+browser, and a fix to a handler applies to every case that uses it.
+
+A step no handler matches stops its case with status ``BLOCKED``, naming the
+step, so coverage gaps are visible rather than silently passed.
+
+This is experimental. Handlers cover only part of the plan's steps, so most
+cases stop as ``BLOCKED``. ``python -m harness`` never runs it, and its
+results are printed only, not stored with the suite's.
+
+    python -m harness.executor --dry-run     # which steps have handlers
+    python -m harness.executor TC002 TC015   # run those plan cases
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+import time
+import traceback
+import xml.etree.ElementTree as ElementTree
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from playwright import async_api
+
+from .config import local_endpoint
+from .fixtures import tool_url
+from .locators import resolve
+from .pages import (
+    BlobPage,
+    ContrastPage,
+    GlassPage,
+    GradientTextPage,
+    GridPage,
+    MetaPage,
+    PalettePage,
+    PromptPage,
+    ToolPage,
+    page_for,
+)
+from .plan import PLAN_PATH, PlanCase, infer_tool, load_plan
+from .profiles import profile_names
+from .session import CaseResult, SuiteSession
+
+# Generous for a settled SPA; a step that needs longer is a finding in itself.
+STEP_TIMEOUT_MS = 10_000
+VIEWPORTS = {
+    "desktop": {"width": 1280, "height": 800},
+    "tablet": {"width": 768, "height": 1024},
+    "mobile": {"width": 375, "height": 812},
+}
+
+
+class UnsupportedStep(Exception):
+    """No registered handler matches a plan step."""
+
+
+@dataclass
+class StepContext:
+    """State shared by the steps of one plan case."""
+
+    case: PlanCase
+    context: async_api.BrowserContext
+    endpoint: str
+    page: async_api.Page | None = None
+    tool: str | None = None
+    exported: str = ""
+    # What earlier steps entered, for later "verify" steps to check against.
+    inputs: dict = field(default_factory=dict)
+
+    async def page_at(self, path: str = "/") -> async_api.Page:
+        """The case's page, opened at ``path`` if there is none yet."""
+        if self.page is None:
+            self.page = await self.context.new_page()
+            await self.page.goto(self.endpoint + path, wait_until="domcontentloaded")
+        return self.page
+
+    async def open_tool(self, tool_id: str) -> async_api.Page:
+        if self.page is None:
+            self.page = await self.context.new_page()
+        await self.page.goto(tool_url(tool_id, self.endpoint), wait_until="domcontentloaded")
+        self.tool = tool_id
+        return self.page
+
+    async def tool_page(self) -> async_api.Page:
+        """The page of the case's tool, navigating there first if needed."""
+        tool_id = self.tool or self.case.tool
+        if tool_id is None:
+            raise UnsupportedStep(f"{self.case.tc_id} does not name a tool")
+        if self.tool != tool_id or self.page is None:
+            return await self.open_tool(tool_id)
+        return self.page
+
+    async def tool_object(self, expected: type[ToolPage] = ToolPage) -> ToolPage:
+        """The page object of the case's tool; UnsupportedStep if it is not ``expected``."""
+        page = await self.tool_page()
+        tool = page_for(page, self.tool)
+        if not isinstance(tool, expected):
+            raise UnsupportedStep(f"{self.case.tc_id}: step is for {expected.tool_id}, not {self.tool}")
+        return tool
+
+
+StepHandler = Callable[[StepContext, re.Match], Awaitable[None]]
+_HANDLERS: list[tuple[re.Pattern, StepHandler]] = []
+
+
+def step(pattern: str) -> Callable[[StepHandler], StepHandler]:
+    """Register a handler for plan steps matching ``pattern`` (case-insensitive)."""
+    compiled = re.compile(pattern, re.IGNORECASE)
+
+    def register(handler: StepHandler) -> StepHandler:
+        _HANDLERS.append((compiled, handler))
+        return handler
+
+    return register
+
+
+def handler_for(description: str) -> tuple[StepHandler, re.Match] | None:
+    for pattern, handler in _HANDLERS:
+        match = pattern.search(description)
+        if match:
+            return handler, match
+    return None
+
+
+# -- navigation ---------------------------------------------------------------
+
+
+@step(r"^navigate to tools list")
+async def _tools_list(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    await page.goto(ctx.endpoint + "/", wait_until="domcontentloaded")
+    ctx.tool = None
+
+
+@step(r"^(navigate to|access|open)\b.*\b(tool|generator|checker)\b")
+async def _open_tool(ctx: StepContext, match: re.Match) -> None:
+    tool_id = infer_tool(match.string) or ctx.case.tool
+    if tool_id is None:
+        raise UnsupportedStep(match.string)
+    await ctx.open_tool(tool_id)
+
+
+@step(r"^reload (the )?application")
+async def _reload(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    await page.reload(wait_until="domcontentloaded")
+
+
+@step(r"^access application using (desktop|tablet|mobile) screen size")
+@step(r"^resize viewport to (?:narrow )?(desktop|tablet|mobile)\b")
+async def _viewport(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    await page.set_viewport_size(VIEWPORTS[match.group(1).lower()])
+
+
+@step(r"^verify full layout with visible navigation")
+async def _desktop_layout(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    await async_api.expect(await resolve(page, "nav.main")).to_be_visible()
+    await async_api.expect(await resolve(page, "nav.menu_toggle")).to_be_hidden()
+
+
+@step(r"^verify optimized mobile view")
+async def _mobile_layout(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    await async_api.expect(await resolve(page, "nav.menu_toggle")).to_be_visible()
+
+
+# -- theme --------------------------------------------------------------------
+
+
+async def _expect_theme(page: async_api.Page, theme: str) -> None:
+    html = page.locator("html")
+    dark = re.compile(r"(^|\s)dark(\s|$)")
+    if theme == "dark":
+        await async_api.expect(html).to_have_class(dark)
+    else:
+        await async_api.expect(html).not_to_have_class(dark)
+
+
+@step(r"^set system theme to (dark|light) mode")
+async def _system_theme(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    await page.emulate_media(color_scheme=match.group(1).lower())
+
+
+@step(r"^verify application automatically switches to (dark|light) mode")
+async def _theme_follows_system(ctx: StepContext, match: re.Match) -> None:
+    await _expect_theme(await ctx.page_at(), match.group(1).lower())
+
+
+@step(r"^manually toggle to (dark|light) mode")
+async def _toggle_theme(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    await (await resolve(page, "nav.theme_toggle")).click()
+    await _expect_theme(page, match.group(1).lower())
+
+
+@step(r"^check application changes to (dark|light) mode and preference is saved")
+async def _theme_saved(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    theme = match.group(1).lower()
+    await _expect_theme(page, theme)
+    stored = await page.evaluate("() => localStorage.getItem('theme')")
+    if stored != theme:
+        raise AssertionError(f"theme preference saved as {stored!r}, expected {theme!r}")
+
+
+@step(r"^verify saved theme preference overrides system theme")
+async def _theme_override(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    stored = await page.evaluate("() => localStorage.getItem('theme')")
+    if stored not in ("dark", "light"):
+        raise AssertionError(f"no saved theme preference (found {stored!r})")
+    await _expect_theme(page, stored)
+
+
+# -- command palette ----------------------------------------------------------
+
+
+@step(r"^press cmd/ctrl\+k")
+async def _open_command_palette(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    await page.keyboard.press("ControlOrMeta+k")
+
+
+@step(r"^ensure command palette overlay opens")
+async def _command_palette_open(ctx: StepContext, match: re.Match) -> None:
+    page = await ctx.page_at()
+    await async_api.expect(await resolve(page, "palette_dialog.dialog")).to_be_visible()
+    await async_api.expect(await resolve(page, "palette_dialog.search")).to_be_focused()
+
+
+# -- tool controls ------------------------------------------------------------
+
+
+@step(r"^set blur value to (minimum|maximum)")
+async def _blur_extreme(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object(GlassPage)
+    low, high = await tool.slider_range("blur")
+    await tool.set_blur(low if match.group(1).lower() == "minimum" else high)
+
+
+@step(r"^input valid blur, opacity,? and border values")
+async def _glass_values(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object(GlassPage)
+    values = {"blur": 20, "transparency": 50, "radius": 24}
+    await tool.set_blur(values["blur"])
+    await tool.set_transparency(values["transparency"])
+    await tool.set_radius(values["radius"])
+    ctx.inputs["glass"] = values
+
+
+@step(r"^verify the exported css matches the input parameters")
+async def _glass_export_verified(ctx: StepContext, match: re.Match) -> None:
+    values = ctx.inputs["glass"]
+    for expected in (
+        f"backdrop-filter: blur({values['blur']}px)",
+        f"border-radius: {values['radius']}px;",
+        f",{values['transparency'] / 100:g});",  # the background's rgba() alpha
+    ):
+        if expected not in ctx.exported:
+            raise AssertionError(f"exported CSS lacks {expected!r}:\n{ctx.exported}")
+
+
+# "Export the generated CSS", "Export blob as SVG file", "Export meta tags as HTML", ...
+# but not "Export history ..." steps, which are about the history panel.
+@step(r"^export (the )?(generated |current |final )?(css|palette|blob|meta tags|prompt)\b")
+async def _export(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object()
+    words = set(re.findall(r"\w+", match.string.lower()))
+    if isinstance(tool, BlobPage) and "svg" in words:
+        ctx.exported = await tool.download_svg()
+    else:
+        ctx.exported = await tool.export("CSS" if "css" in words else None)
+    if not ctx.exported.strip():
+        raise AssertionError("export copied nothing to the clipboard")
+
+
+# -- tool pages ---------------------------------------------------------------
+# Each "input" step records what it entered in ctx.inputs; the matching
+# "verify" step checks the UI or the export against it.
+
+
+# Black on white, identical colours, mid greys, and the AA/AAA boundaries, with
+# their ratios as getContrastRatio computes them; harness.color_oracle checks
+# that function itself for every colour.
+CONTRAST_PAIRS = [
+    ("#000000", "#ffffff", 21.00),
+    ("#ffffff", "#ffffff", 1.00),
+    ("#777777", "#ffffff", 4.48),
+    ("#595959", "#ffffff", 7.00),
+    ("#ffffff", "#0f172a", 17.85),
+    ("#ff0000", "#00ff00", 2.91),
+]
+
+
+@step(r"^input multiple foreground and background color pairs")
+async def _contrast_pairs(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object(ContrastPage)
+    shown = []
+    for foreground, background, expected in CONTRAST_PAIRS:
+        await tool.set_colors(foreground, background)
+        # The ratio re-renders on input; wait for it rather than read a stale value.
+        await async_api.expect(await tool.resolve("contrast.ratio")).to_have_text(f"{expected:.2f}:1")
+        shown.append((foreground, background, expected, await tool.ratio()))
+    ctx.inputs["contrast"] = shown
+
+
+@step(r"^verify displayed contrast ratio matches expected values")
+async def _contrast_verified(ctx: StepContext, match: re.Match) -> None:
+    for foreground, background, expected, ratio in ctx.inputs.get("contrast", []):
+        if abs(ratio - expected) > 0.01:
+            raise AssertionError(f"{foreground} on {background}: shown {ratio}:1, expected {expected}:1")
+
+
+@step(r"^input various values for gap, columns,? and rows")
+async def _grid_values(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object(GridPage)
+    values = {"columns": 4, "rows": 3, "gap": 24}
+    await tool.set_columns(values["columns"])
+    await tool.set_rows(values["rows"])
+    await tool.set_gap(values["gap"])
+    ctx.inputs["grid"] = values
+
+
+@step(r"^verify exported css matches input configurations")
+async def _grid_export_verified(ctx: StepContext, match: re.Match) -> None:
+    values = ctx.inputs["grid"]
+    for expected in (
+        f"grid-template-columns: repeat({values['columns']}, 1fr);",
+        f"grid-template-rows: repeat({values['rows']}, ",
+        f"gap: {values['gap']}px;",
+    ):
+        if expected not in ctx.exported:
+            raise AssertionError(f"exported CSS lacks {expected!r}:\n{ctx.exported}")
+
+
+@step(r"^adjust parameters such as complexity, size")
+async def _blob_parameters(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object(BlobPage)
+    await tool.randomize()
+    # Values on each slider's step grid: 10 + 5k and 100 + 8k.
+    values = {"complexity": 60, "size": 292}
+    await tool.set_complexity(values["complexity"])
+    await tool.set_size(values["size"])
+    ctx.inputs["blob"] = values
+
+
+@step(r"^confirm that exported svg is well-formed")
+async def _blob_svg_verified(ctx: StepContext, match: re.Match) -> None:
+    try:
+        root = ElementTree.fromstring(ctx.exported.strip())
+    except ElementTree.ParseError as exc:
+        raise AssertionError(f"exported SVG is not well-formed: {exc}") from None
+    if root.tag != "{http://www.w3.org/2000/svg}svg":
+        raise AssertionError(f"exported root element is {root.tag!r}, not svg")
+    size = ctx.inputs.get("blob", {}).get("size")
+    if size is not None and root.get("width") != str(size):
+        raise AssertionError(f"exported SVG is {root.get('width')} wide, expected {size}")
+
+
+@step(r"^customize start and end colors")
+async def _gradient_colors(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object(GradientTextPage)
+    colors = ("#ff0080", "#7928ca")
+    await tool.set_colors(*colors)
+    ctx.inputs["gradient"] = colors
+
+
+@step(r"^verify exported css defines correct gradient background")
+async def _gradient_export_verified(ctx: StepContext, match: re.Match) -> None:
+    css = ctx.exported.lower()
+    if "gradient(" not in css:
+        raise AssertionError(f"exported CSS defines no gradient:\n{ctx.exported}")
+    missing = [color for color in ctx.inputs.get("gradient", ()) if color not in css]
+    if missing:
+        raise AssertionError(f"exported gradient lacks {', '.join(missing)}")
+
+
+@step(r"^verify that export data matches the displayed colors")
+async def _palette_export_verified(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object(PalettePage)
+    exported = ctx.exported.lower()
+    missing = [color for color in await tool.colors() if color.lower() not in exported]
+    if missing:
+        raise AssertionError(f"export lacks displayed colours {', '.join(missing)}")
+
+
+@step(r"^input webpage title, description, keywords")
+async def _meta_fields(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object(MetaPage)
+    values = {
+        "title": "Nine Hub Tools - Test Page",
+        "description": "A page used to check the generated meta tags.",
+        "keywords": "css, generator, testing",
+    }
+    await tool.set_fields(**values)
+    ctx.inputs["meta"] = values
+
+
+@step(r"^verify generated meta tags reflect user inputs")
+async def _meta_verified(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object(MetaPage)
+    html = await tool.export_html()
+    values = ctx.inputs["meta"]
+    for expected in (
+        f"<title>{values['title']}</title>",
+        f'<meta name="description" content="{values["description"]}">',
+        f'<meta name="keywords" content="{values["keywords"]}">',
+    ):
+        if expected not in html:
+            raise AssertionError(f"meta tags lack {expected!r}")
+
+
+@step(r"^select different prompt templates and fill in customizable fields")
+async def _prompt_fields(ctx: StepContext, match: re.Match) -> None:
+    tool = await ctx.tool_object(PromptPage)
+    values = {"task": "Summarise a CSV file of sales by region", "context": "For a weekly report."}
+    await tool.set_task(values["task"], values["context"])
+    ctx.inputs["prompt"] = values
+
+
+@step(r"^check the exported prompt matches the constructed prompt")
+async def _prompt_export_verified(ctx: StepContext, match: re.Match) -> None:
+    missing = [text for text in ctx.inputs.get("prompt", {}).values() if text not in ctx.exported]
+    if missing:
+        raise AssertionError(f"exported prompt lacks {missing!r}")
+
+
+# -- execution ----------------------------------------------------------------
+
+
+def unsupported_steps(case: PlanCase) -> list[str]:
+    return [plan_step.description for plan_step in case.steps if handler_for(plan_step.description) is None]
+
+
+async def execute(session: SuiteSession, case: PlanCase, endpoint: str | None = None) -> CaseResult:
+    """Run one plan case in a fresh context on ``session``'s browser."""
+    endpoint = endpoint or local_endpoint()
+    result = CaseResult(tc_id=case.tc_id, title=case.result_title, status="PASSED")
+    start = time.perf_counter()
+    context = await session.new_context()
+    context.set_default_timeout(STEP_TIMEOUT_MS)
+    await context.grant_permissions(["clipboard-read", "clipboard-write"], origin=endpoint)
+    ctx = StepContext(case=case, context=context, endpoint=endpoint)
+    try:
+        for number, plan_step in enumerate(case.steps, 1):
+            found = handler_for(plan_step.description)
+            try:
+                if found is None:
+                    raise UnsupportedStep(plan_step.description)
+                handler, match = found
+                await handler(ctx, match)
+            except UnsupportedStep as exc:
+                result.status = "BLOCKED"
+                result.error = f"step {number}: no handler for {str(exc)!r}"
+                break
+            except Exception as exc:
+                result.status = "FAILED"
+                message = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+                result.error = f"step {number} ({plan_step.description}): {message}"
+                break
+    finally:
+        await context.close()
+    result.duration_s = time.perf_counter() - start
+    return result
+
+
+async def run_plan(
+    cases: list[PlanCase], concurrency: int = 1, **session_options
+) -> list[CaseResult]:
+    """Run plan ``cases`` over one shared browser, up to ``concurrency`` at once."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    session_options.setdefault("hook_factories", [])
+
+    async with SuiteSession(**session_options) as session:
+
+        async def run_one(case: PlanCase) -> CaseResult:
+            async with semaphore:
+                return await execute(session, case)
+
+        return list(await asyncio.gather(*(run_one(case) for case in cases)))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.executor", description=__doc__)
+    parser.add_argument("tests", nargs="*", help="plan TC ids to run (default: all)")
+    parser.add_argument("--plan", default=str(PLAN_PATH), help="test plan JSON")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="list steps without a handler instead of running"
+    )
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--profile", choices=profile_names(), help="Chromium launch profile")
+    parser.add_argument("-c", "--concurrency", type=int, default=1, help="cases run at once")
+    args = parser.parse_args(argv)
+
+    cases = load_plan(Path(args.plan), only=args.tests or None)
+    if args.dry_run:
+        total = covered = 0
+        for case in cases:
+            missing = unsupported_steps(case)
+            total += len(case.steps)
+            covered += len(case.steps) - len(missing)
+            marker = "ok " if not missing else "   "
+            print(f"{marker} {case.result_title}")
+            for description in missing:
+                print(f"        no handler: {description}")
+        print(f"\n{covered}/{total} steps have handlers")
+        return 0
+
+    session_options = {"profile": args.profile}
+    if args.headed:
+        session_options["headless"] = False
+    results = asyncio.run(run_plan(cases, args.concurrency, **session_options))
+    for result in results:
+        print(f"{result.status:<7} {result.duration_s:6.1f}s  {result.title}")
+        if result.error:
+            print(f"        {result.error.splitlines()[0]}")
+    passed = sum(result.passed for result in results)
+    print(f"\n{passed} passed, {len(results) - passed} not passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
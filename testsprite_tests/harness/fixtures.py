@@ -0,0 +1,126 @@
+"""Fixtures that skip the homepage boot and the click-through navigation.
+
+* :func:`tool_url` / :func:`open_tool` deep-link straight to a tool route. The
+  routes are read from ``src/lib/toolsConfig.ts``, so they match the app.
+* :class:`StorageSeed` describes the favorites, presets and theme a test
+  expects to find already in place. :func:`storage_state` turns it into a
+  Playwright ``storage_state`` for ``browser.new_context(storage_state=...)``,
+  so none of it has to be rebuilt through the UI.
+"""
+
+import json
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+
+from playwright import async_api
+
+from .config import REPO_ROOT, TMP_DIR, local_endpoint
+
+TOOLS_CONFIG_PATH = REPO_ROOT / "src" / "lib" / "toolsConfig.ts"
+STORAGE_STATE_PATH = TMP_DIR / "storage_state.json"
+
+_TOOL_FIELD = re.compile(r"^\s*(id|path):\s*'([^']*)'", re.MULTILINE)
+
+# Mirrors defaultConfig in src/pages/tools/GlassTool.tsx.
+GLASS_DEFAULTS = {
+    "blur": 16,
+    "transparency": 0.65,
+    "saturation": 180,
+    "borderRadius": 16,
+    "tintColor": "#ffffff",
+    "borderColor": "#ffffff",
+    "showBorder": True,
+    "width": 320,
+    "minHeight": 0,
+    "template": "standard",
+    "title": "Glass UI",
+    "subtitle": "Modern Aesthetics",
+    "buttonText": "Explore",
+    "imageUrl": "",
+    "buttonBgColor": "#0ea5e9",
+}
+
+
+@cache
+def tool_routes() -> dict[str, str]:
+    """Tool id -> route path, e.g. ``{"glass": "/glass", ...}``."""
+    fields = _TOOL_FIELD.findall(TOOLS_CONFIG_PATH.read_text(encoding="utf-8"))
+    routes, current_id = {}, None
+    for name, value in fields:
+        if name == "id":
+            current_id = value
+        elif current_id is not None:
+            routes[current_id] = value
+            current_id = None
+    return routes
+
+
+def tool_url(tool_id: str, endpoint: str | None = None) -> str:
+    routes = tool_routes()
+    if tool_id not in routes:
+        raise KeyError(f"Unknown tool {tool_id!r}; known: {', '.join(routes)}")
+    return (endpoint or local_endpoint()) + routes[tool_id]
+
+
+async def open_tool(
+    context: async_api.BrowserContext, tool_id: str, wait_until: str = "domcontentloaded"
+) -> async_api.Page:
+    """Open a new page directly on ``tool_id``'s route."""
+    page = await context.new_page()
+    await page.goto(tool_url(tool_id), wait_until=wait_until)
+    return page
+
+
+def preset(name: str, data: dict) -> dict:
+    """A preset entry in the shape ``usePresets`` stores."""
+    return {"id": str(uuid.uuid4()), "name": name, "data": data, "createdAt": int(time.time() * 1000)}
+
+
+@dataclass
+class StorageSeed:
+    theme: str = "dark"
+    favorites: list[str] = field(default_factory=lambda: ["glass", "palette", "contrast"])
+    presets: dict[str, list[dict]] = field(
+        default_factory=lambda: {"glass": [preset("Seed Frosted", {**GLASS_DEFAULTS, "blur": 20})]}
+    )
+    export_history: list[dict] = field(default_factory=list)
+    # The exit-intent modal otherwise pops over whatever the test clicks next.
+    dismiss_exit_intent: bool = True
+
+    def local_storage(self) -> dict[str, str]:
+        items = {"theme": self.theme}
+        # Both favorites stores in the app (hooks/useFavorites and lib/storage).
+        items["nineproo_favorites"] = json.dumps(self.favorites)
+        items["nine_hub_favorites"] = json.dumps(self.favorites)
+        for tool, entries in self.presets.items():
+            items[f"nineproo-presets-{tool}"] = json.dumps(entries)
+        if self.export_history:
+            items["nine_hub_export_history"] = json.dumps(self.export_history)
+        if self.dismiss_exit_intent:
+            items["exit_intent_seen"] = "true"
+        return items
+
+
+def storage_state(seed: StorageSeed | None = None, endpoint: str | None = None) -> dict:
+    """Playwright ``storage_state`` dict holding ``seed`` for the app's origin."""
+    seed = StorageSeed() if seed is None else seed
+    items = seed.local_storage()
+    return {
+        "cookies": [],
+        "origins": [
+            {
+                "origin": endpoint or local_endpoint(),
+                "localStorage": [{"name": name, "value": value} for name, value in items.items()],
+            }
+        ],
+    }
+
+
+def bake_storage_state(path: Path = STORAGE_STATE_PATH, seed: StorageSeed | None = None) -> Path:
+    """Write :func:`storage_state` to ``path`` for reuse across runs."""
+    path.write_text(json.dumps(storage_state(seed), indent=2) + "\n", encoding="utf-8")
+    return path
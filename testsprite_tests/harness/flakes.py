@@ -0,0 +1,79 @@
+"""Per-TC flake rates from the results history, and the quarantine derived from them.
+
+A run counts as flaky for a TC when its first attempt failed and a retry in a
+fresh context passed (``CaseResult.flaky``). The flake rate is the share of
+such runs among the TC's last :data:`FLAKE_WINDOW` runs. A TC with at least
+:data:`MIN_RUNS` runs and a rate of :data:`FLAKE_THRESHOLD` or more is
+quarantined. It still runs, in its own shard, but its result no longer
+decides the suite's exit status. Once it stops flaking, its rate falls below
+the threshold and it leaves quarantine on its own.
+
+A TC that fails every attempt is not flaky but broken, and never quarantined.
+
+    python -m harness.flakes             # flake rates, quarantined TCs marked
+"""
+
+import argparse
+import sys
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from .store import RUNS_PATH, iter_rows
+
+FLAKE_WINDOW = 50
+FLAKE_THRESHOLD = 0.2
+MIN_RUNS = 5
+
+
+@dataclass
+class FlakeStats:
+    tc_id: str
+    runs: int = 0
+    flaky: int = 0
+    failed: int = 0
+
+    @property
+    def rate(self) -> float:
+        return self.flaky / self.runs if self.runs else 0.0
+
+
+def flake_rates(path: Path = RUNS_PATH, window: int = FLAKE_WINDOW) -> dict[str, FlakeStats]:
+    """Flake statistics over each TC's last ``window`` runs."""
+    recent: dict[str, deque] = defaultdict(lambda: deque(maxlen=window))
+    for row in iter_rows(path):
+        recent[row.tc_id].append((row.flaky, row.passed))
+    stats = {}
+    for tc_id, outcomes in sorted(recent.items()):
+        stats[tc_id] = FlakeStats(
+            tc_id,
+            runs=len(outcomes),
+            flaky=sum(flaky for flaky, _ in outcomes),
+            failed=sum(not passed for _, passed in outcomes),
+        )
+    return stats
+
+
+def quarantined(
+    stats: dict[str, FlakeStats], threshold: float = FLAKE_THRESHOLD, min_runs: int = MIN_RUNS
+) -> list[str]:
+    return [tc_id for tc_id, tc in stats.items() if tc.runs >= min_runs and tc.rate >= threshold]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.flakes", description=__doc__)
+    parser.add_argument("--window", type=int, default=FLAKE_WINDOW)
+    parser.add_argument("--threshold", type=float, default=FLAKE_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    stats = flake_rates(window=args.window)
+    held = set(quarantined(stats, args.threshold))
+    print("TC      runs  flaky  failed   rate")
+    for tc in stats.values():
+        marker = "  quarantined" if tc.tc_id in held else ""
+        print(f"{tc.tc_id}  {tc.runs:5d}  {tc.flaky:5d}  {tc.failed:6d}  {tc.rate:5.0%}{marker}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
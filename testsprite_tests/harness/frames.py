@@ -0,0 +1,314 @@
+"""Frame cost while a slider is dragged back and forth across its full range.
+
+TC002 drags the Glass blur slider and expects a preview update "without
+performance issues". The heaviest repaints in the app are ``backdrop-filter``
+at maximum blur on Glass and the path regeneration on Blob. This module
+drives a slider under a Chromium trace, ``Browser.start_tracing``, and reads
+from the trace:
+
+* frame cost: for each frame the compositor drew, the time from its
+  ``BeginFrame`` to its ``DrawFrame``, paired by ``frameSeqId``, as
+  p50/p95/p99 and max;
+* dropped frames: the ``DroppedFrame`` events Chromium reports for frames
+  that had an update pending and missed their deadline. Vsyncs with nothing
+  to draw are not frames and are not counted;
+* the longest main-thread tasks (``RunTask`` on ``CrRendererMain``) and how
+  many ran past 50 ms.
+
+The drag is a real pointer drag. The thumb is first set to its minimum with
+:func:`~harness.sliders.set_slider` and pressed. Tracing starts only then.
+The pointer then visits every value on the slider's step grid up to the
+maximum and back, ``--passes`` times, one per 60 Hz frame. Every move
+changes the value, so every move asks for a new frame. The thumb must finish
+back at the minimum, which :func:`~harness.sliders.read_slider` confirms.
+``--cpu 4`` throttles the renderer like a mid-range phone.
+
+    python -m harness.frames --dist                  # every slider in SWEEPS
+    python -m harness.frames --cpu 4 --keep-trace glass.blur
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+
+from .config import TMP_DIR, local_endpoint
+from .pages import PAGES, ToolPage
+from .profiles import profile_names
+from .results import new_run_id, timestamp
+from .session import SuiteSession
+from .sliders import SliderMismatch, SliderState, read_slider, same_value, set_slider
+from .static_server import serve_dist
+
+FRAMES_DIR = TMP_DIR / "frames"
+VSYNC_MS = 1000 / 60
+LONG_TASK_MS = 50
+TRACE_CATEGORIES = [
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame",
+    "toplevel",
+]
+# "tool.slider" -> the sliders with the costliest previews.
+SWEEPS = (
+    "glass.blur",
+    "glass.saturation",
+    "blob.complexity",
+    "blob.size",
+    "shadow.blur",
+    "grid.columns",
+)
+
+
+@dataclass
+class FrameStats:
+    sweep: str
+    passes: int
+    cpu_rate: float
+    # Pointer moves in the trace; each one changes the slider's value.
+    moves: int = 0
+    frames: int = 0
+    dropped: int = 0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+    long_tasks: int = 0
+    # Durations of the longest main-thread tasks, longest first.
+    longest_tasks_ms: list[float] = field(default_factory=list)
+    trace: str = ""
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """The ``pct`` percentile of ``values`` by linear interpolation, 0 if empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _renderer_main_threads(events: list[dict]) -> set[tuple[int, int]]:
+    return {
+        (event["pid"], event["tid"])
+        for event in events
+        if event.get("ph") == "M"
+        and event.get("name") == "thread_name"
+        and event.get("args", {}).get("name") == "CrRendererMain"
+    }
+
+
+def analyse_trace(trace: dict | list, stats: FrameStats, top: int = 5) -> FrameStats:
+    """Fill ``stats`` from a Chromium trace (``{"traceEvents": [...]}`` or a bare list)."""
+    events = trace["traceEvents"] if isinstance(trace, dict) else trace
+    main_threads = _renderer_main_threads(events)
+
+    # (pid, layer tree, frameSeqId) -> timestamp. DrawFrame may be an instant
+    # or an async begin/end pair; count each frame once.
+    begins: dict[tuple, float] = {}
+    draws: dict[tuple, float] = {}
+    dropped: set[tuple] = set()
+    for event in events:
+        name, args = event.get("name"), event.get("args", {})
+        if name not in ("BeginFrame", "DrawFrame", "DroppedFrame") or event.get("ph") == "e":
+            continue
+        if args.get("frameSeqId") is None:
+            continue
+        key = (event["pid"], args.get("layerTreeId"), args["frameSeqId"])
+        if name == "BeginFrame":
+            begins.setdefault(key, event["ts"])
+        elif name == "DrawFrame":
+            draws.setdefault(key, event["ts"])
+        else:
+            dropped.add(key)
+    frame_ms = [(draws[key] - begins[key]) / 1000 for key in draws if key in begins]
+
+    tasks = sorted(
+        (
+            event["dur"] / 1000
+            for event in events
+            if event.get("name") == "RunTask"
+            and event.get("ph") == "X"
+            and (event["pid"], event["tid"]) in main_threads
+        ),
+        reverse=True,
+    )
+
+    stats.frames = len(draws)
+    stats.dropped = len(dropped - draws.keys())
+    stats.p50_ms = round(percentile(frame_ms, 50), 2)
+    stats.p95_ms = round(percentile(frame_ms, 95), 2)
+    stats.p99_ms = round(percentile(frame_ms, 99), 2)
+    stats.max_ms = round(max(frame_ms, default=0.0), 2)
+    stats.long_tasks = sum(1 for duration in tasks if duration > LONG_TASK_MS)
+    stats.longest_tasks_ms = [round(duration, 1) for duration in tasks[:top]]
+    return stats
+
+
+def grid_values(state: SliderState, step: float) -> list[float]:
+    """Every value from the minimum (exclusive) to the maximum on the slider's step grid.
+
+    A maximum off the grid, such as Blob size's 400 with step 8 from 100, is
+    added at the end; Radix reaches it at the end of the track.
+    """
+    count = int((state.max - state.min) / step + 1e-9)
+    values = [state.min + index * step for index in range(1, count + 1)]
+    if not values or not same_value(values[-1], state.max):
+        values.append(state.max)
+    return values
+
+
+async def press_at_minimum(tool: ToolPage, slider: str) -> SliderState:
+    """Set ``slider`` to its minimum and hold the pointer down on its thumb."""
+    name, step = tool.sliders[slider]
+    thumb = await tool.resolve(name)
+    await thumb.scroll_into_view_if_needed()
+    state = await read_slider(thumb)
+    await set_slider(thumb, state.min, step)
+    state = await read_slider(thumb)
+    await tool.page.mouse.move(state.thumb["x"], state.thumb["y"])
+    await tool.page.mouse.down()
+    return state
+
+
+async def sweep_slider(tool: ToolPage, slider: str, state: SliderState, passes: int) -> int:
+    """Drag the pressed ``slider`` to its maximum and back, ``passes`` times; returns the moves.
+
+    Each move goes to the next value on the step grid, one per vsync.
+    """
+    name, step = tool.sliders[slider]
+    upwards = grid_values(state, step)
+    downwards = upwards[-2::-1] + [state.min]
+    mouse = tool.page.mouse
+    moves = 0
+    for _ in range(passes):
+        for value in upwards + downwards:
+            await mouse.move(*state.point_for(value))
+            await asyncio.sleep(VSYNC_MS / 1000)
+            moves += 1
+    await mouse.up()
+
+    now = (await read_slider(await tool.resolve(name))).now
+    if not same_value(now, state.min):
+        raise SliderMismatch(f"{slider} ended at {now}, not its minimum {state.min}")
+    return moves
+
+
+async def profile_sweep(
+    session: SuiteSession,
+    sweep: str,
+    passes: int = 4,
+    cpu_rate: float = 1,
+    keep_trace: str | None = None,
+    endpoint: str | None = None,
+) -> FrameStats:
+    """Trace ``sweep`` ("tool.slider") in a fresh context and return its frame stats."""
+    tool_id, slider = sweep.split(".", 1)
+    stats = FrameStats(sweep, passes, cpu_rate)
+    context = await session.new_context()
+    try:
+        tool = await PAGES[tool_id].open(context, endpoint)
+        await tool.page.wait_for_load_state("networkidle")
+        cdp = await context.new_cdp_session(tool.page)
+        await cdp.send("Emulation.setCPUThrottlingRate", {"rate": cpu_rate})
+        state = await press_at_minimum(tool, slider)
+
+        # Trace the drag only, not the setup above.
+        await session.browser.start_tracing(page=tool.page, categories=TRACE_CATEGORIES)
+        try:
+            stats.moves = await sweep_slider(tool, slider, state, passes)
+        finally:
+            trace = await session.browser.stop_tracing()
+    finally:
+        await context.close()
+
+    if keep_trace:
+        FRAMES_DIR.mkdir(parents=True, exist_ok=True)
+        path = FRAMES_DIR / f"{keep_trace}-{sweep}.json"
+        path.write_bytes(trace)
+        stats.trace = str(path)
+    return analyse_trace(json.loads(trace), stats)
+
+
+async def profile(
+    sweeps: list[str],
+    passes: int = 4,
+    cpu_rate: float = 1,
+    keep_trace: str | None = None,
+    **session_options,
+) -> list[FrameStats]:
+    endpoint = local_endpoint()
+    session_options.setdefault("hook_factories", [])
+    async with SuiteSession(**session_options) as session:
+        return [
+            await profile_sweep(session, sweep, passes, cpu_rate, keep_trace, endpoint)
+            for sweep in sweeps
+        ]
+
+
+def write_results(rows: list[FrameStats], run_id: str) -> str:
+    FRAMES_DIR.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "run_id": run_id,
+        "measured": timestamp(),
+        "vsync_ms": round(VSYNC_MS, 2),
+        "sweeps": [asdict(row) for row in rows],
+    }
+    path = FRAMES_DIR / f"{run_id}.json"
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.frames", description=__doc__)
+    parser.add_argument("sweeps", nargs="*", metavar="TOOL.SLIDER", help=f"default: {' '.join(SWEEPS)}")
+    parser.add_argument("--passes", type=int, default=4, help="min-to-max-and-back drags per slider")
+    parser.add_argument("--cpu", type=float, default=1, help="CPU slowdown, e.g. 4 for a mid-range phone")
+    parser.add_argument("--max-p95", type=float, metavar="MS", help="exit 1 if a p95 frame cost is above MS")
+    parser.add_argument("--keep-trace", action="store_true", help="keep the traces, to open in DevTools")
+    parser.add_argument("--profile", choices=profile_names(), help="Chromium launch profile")
+    parser.add_argument(
+        "--dist", action="store_true",
+        help="build dist/ if stale and serve it like nginx-spa.conf on the localEndpoint port",
+    )
+    args = parser.parse_args(argv)
+    sweeps = args.sweeps or list(SWEEPS)
+    for sweep in sweeps:
+        tool_id, _, slider = sweep.partition(".")
+        if slider not in getattr(PAGES.get(tool_id), "sliders", {}):
+            parser.error(f"unknown slider {sweep!r}; sliders are named like {SWEEPS[0]}")
+
+    run_id = new_run_id()
+    with serve_dist() if args.dist else nullcontext():
+        rows = asyncio.run(
+            profile(
+                sweeps, max(1, args.passes), args.cpu,
+                run_id if args.keep_trace else None, profile=args.profile,
+            )
+        )
+    path = write_results(rows, run_id)
+
+    print(
+        f"{'sweep':<20}{'moves':>7}{'frames':>8}{'dropped':>9}{'p50 ms':>8}{'p95':>8}{'p99':>8}"
+        f"{'max':>8}{'long tasks':>12}"
+    )
+    for row in rows:
+        print(
+            f"{row.sweep:<20}{row.moves:>7}{row.frames:>8}{row.dropped:>9}{row.p50_ms:>8.1f}"
+            f"{row.p95_ms:>8.1f}{row.p99_ms:>8.1f}{row.max_ms:>8.1f}{row.long_tasks:>12}"
+        )
+    print(f"\n{len(rows)} sliders at {args.cpu:g}x CPU: {path}")
+    if args.max_p95 is not None:
+        slow = [row.sweep for row in rows if row.p95_ms > args.max_p95]
+        if slow:
+            print(f"p95 over {args.max_p95:g} ms: {', '.join(slow)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""HAR record/replay cache for the app's asset requests.
+
+Every context otherwise downloads the whole Vite module graph from the dev
+server again, and the first hit after a restart is slow while Vite transforms
+modules on demand. Instead:
+
+* ``record`` opens the homepage and every tool route once in a single
+  context, with ``route_from_har(update=True)``. The result is saved as
+  ``tmp/har/<build hash>-<mode>.har``, where the mode is ``dev`` for the Vite
+  dev server and ``dist`` for the production build: the two serve different
+  module graphs from the same URLs.
+* :class:`HarReplay` loads that HAR into memory once per process and fulfils
+  matching sub-resource requests from it through ``context.route``. Anything
+  not in the HAR, and every document request, falls through to the network.
+
+The build hash covers the app sources and build config. When they change, a
+new HAR has to be recorded, and until then replay simply finds nothing to
+serve.
+
+    python -m harness.har_cache record      # once per build
+    python -m harness.har_cache record --dist   # against a running dist/ server
+    python -m harness --har ...             # replay (records first if missing)
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+from pathlib import Path
+
+from playwright import async_api
+
+from .build import build_hash
+from .config import TMP_DIR, local_endpoint
+from .fixtures import tool_routes
+from .hooks import ContextHook
+
+HAR_DIR = TMP_DIR / "har"
+MODES = ("dev", "dist")
+
+
+def har_path(build: str | None = None, mode: str = "dev") -> Path:
+    return HAR_DIR / f"{build or build_hash()}-{mode}.har"
+
+
+async def record(path: Path | None = None, endpoint: str | None = None) -> Path:
+    """Visit every route once and save the app's requests to ``path``."""
+    path = har_path() if path is None else path
+    endpoint = endpoint or local_endpoint()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch()
+        context = await browser.new_context()
+        await context.route_from_har(
+            path, url=f"{endpoint}/**", update=True, update_content="embed", update_mode="minimal"
+        )
+        page = await context.new_page()
+        for route in ["/", *tool_routes().values()]:
+            await page.goto(endpoint + route, wait_until="networkidle")
+        await context.close()  # The HAR is written on close.
+        await browser.close()
+    return path
+
+
+_loaded: dict[Path, dict[str, tuple[int, dict[str, str], bytes]]] = {}
+
+
+def _load(path: Path) -> dict[str, tuple[int, dict[str, str], bytes]]:
+    """HAR entries keyed by URL, parsed once per process."""
+    if path not in _loaded:
+        entries = {}
+        for entry in json.loads(path.read_text(encoding="utf-8"))["log"]["entries"]:
+            request, response = entry["request"], entry["response"]
+            content = response.get("content", {})
+            if request["method"] != "GET" or "text" not in content:
+                continue
+            text = content["text"]
+            body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode()
+            headers = {
+                header["name"]: header["value"]
+                for header in response["headers"]
+                if header["name"].lower() not in ("content-length", "content-encoding", "transfer-encoding")
+            }
+            entries[request["url"]] = (response["status"], headers, body)
+        _loaded[path] = entries
+    return _loaded[path]
+
+
+class HarReplay(ContextHook):
+    """Serve recorded sub-resources from memory; everything else hits the network."""
+
+    def __init__(self, path: Path | None = None, endpoint: str | None = None):
+        self.path = har_path() if path is None else path
+        self.endpoint = endpoint or local_endpoint()
+        self.hits = 0
+        self.misses = 0
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        if not self.path.exists():
+            return
+        entries = _load(self.path)
+
+        async def serve(route: async_api.Route) -> None:
+            request = route.request
+            cached = entries.get(request.url) if request.resource_type != "document" else None
+            if cached is None or request.method != "GET":
+                self.misses += 1
+                await route.fallback()
+                return
+            self.hits += 1
+            status, headers, body = cached
+            await route.fulfill(status=status, headers=headers, body=body)
+
+        await context.route(f"{self.endpoint}/**", serve)
+
+
+def ensure_recorded(mode: str = "dev") -> Path:
+    """Path of the HAR for the current build, recording it first if needed.
+
+    The server for ``mode`` has to be up on the local endpoint already.
+    """
+    path = har_path(mode=mode)
+    if not path.exists():
+        asyncio.run(record(path))
+    return path
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.har_cache", description=__doc__)
+    parser.add_argument("command", choices=("record", "hash", "prune"))
+    parser.add_argument(
+        "--dist", action="store_true",
+        help="record from the dist/ server (python -m harness.static_server) instead of the dev server",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "hash":
+        print(build_hash())
+    elif args.command == "record":
+        print(asyncio.run(record(har_path(mode="dist" if args.dist else "dev"))))
+    else:
+        build = build_hash()
+        current = {har_path(build, mode) for mode in MODES}
+        for stale in HAR_DIR.glob("*.har"):
+            if stale not in current:
+                os.remove(stale)
+                print(f"removed {stale.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
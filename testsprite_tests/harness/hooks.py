@@ -0,0 +1,37 @@
+"""Per-test extension points for :class:`~harness.session.SuiteSession`.
+
+A hook is created fresh for every test case. It sees each ``BrowserContext``
+the script opens, gets a last look at it before the script closes it, and can
+annotate the :class:`~harness.session.CaseResult` once ``run_test()`` has
+returned or raised.
+"""
+
+from typing import TYPE_CHECKING, Callable
+
+from playwright import async_api
+
+if TYPE_CHECKING:
+    from .loader import TestCase
+    from .session import CaseResult
+
+
+class ContextHook:
+    """Base class with no-op callbacks; override the ones you need."""
+
+    # 1-based attempt of the test this hook runs in, set by the session before start().
+    attempt: int = 1
+
+    def start(self, case: "TestCase") -> None:
+        """Called before the test's ``run_test()`` is awaited."""
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        """Called right after the script's ``browser.new_context()``."""
+
+    async def before_close(self, context: async_api.BrowserContext) -> None:
+        """Called when the script closes ``context``, while its pages are still open."""
+
+    def finish(self, result: "CaseResult") -> None:
+        """Called once per test with its result, after the script finished."""
+
+
+HookFactory = Callable[[], ContextHook]
@@ -0,0 +1,241 @@
+"""Select the TCs a source change can affect, instead of running all 19.
+
+``tmp/code_summary.json`` lists each feature with its files, for example
+"Contrast Checker" -> ``src/pages/tools/ContrastTool.tsx``. A TC belongs to
+a feature when its title names the feature. The TC009 title contains
+"Contrast Checker", so a change to ``ContrastTool.tsx`` selects TC009.
+
+A change to a shared module reaches features through imports, such as
+``src/lib/color-utils.ts`` or ``src/components/tools/ExportButton.tsx``.
+:func:`import_graph` parses the static and ``lazy(() => import(...))``
+imports under ``src``. A changed file affects every feature file that
+imports it, directly or transitively.
+
+The selection errs towards running more:
+
+* A ``src`` file that reaches no feature selects every TC. Examples are
+  ``App.tsx`` and ``index.css``.
+* So do build inputs, ``public/`` and the harness code.
+* Every generated script starts on the hub, so the Homepage feature
+  selects every TC.
+* A change to a TC script selects that TC.
+* Anything else, such as docs, selects nothing.
+
+    python -m harness.impact                 # uncommitted changes vs HEAD
+    python -m harness.impact origin/main     # everything since a branch point
+    python -m harness.impact --files src/pages/tools/ContrastTool.tsx
+    python -m harness --changed origin/main  # run just those TCs
+"""
+
+import argparse
+import fnmatch
+import json
+import re
+import subprocess
+import sys
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+
+from .config import REPO_ROOT, TESTS_DIR, TMP_DIR
+from .loader import discover
+
+CODE_SUMMARY_PATH = TMP_DIR / "code_summary.json"
+SRC_DIR = REPO_ROOT / "src"
+# Features every TC passes through.
+HUB_FEATURES = ("Homepage",)
+# Changes here can affect any page. Paths are relative to the repo root and
+# may be fnmatch patterns. The tsconfig files define the "@/" alias and the
+# compiler settings every src import depends on. eslint.config.js is not
+# here: "npm run build" is only "vite build" and does not lint.
+GLOBAL_PATHS = (
+    "index.html",
+    "package.json",
+    "package-lock.json",
+    "bun.lockb",
+    "vite.config.ts",
+    "tsconfig*.json",
+    "tailwind.config.ts",
+    "postcss.config.js",
+    "public/",
+)
+HARNESS_DIR = f"{TESTS_DIR.name}/harness/"
+
+_IMPORT = re.compile(r"""(?:\bfrom\s+|\bimport\s*\(\s*|^\s*import\s+)['"]([^'"]+)['"]""", re.MULTILINE)
+_EXTENSIONS = ("", ".ts", ".tsx", ".js", ".jsx", "/index.ts", "/index.tsx")
+_TC_SCRIPT = re.compile(rf"^{re.escape(TESTS_DIR.name)}/(TC\d+)_[^/]*\.py$")
+
+
+@dataclass
+class Impact:
+    tc_ids: list[str] = field(default_factory=list)
+    # tc_id -> "changed file (via feature)" lines explaining the selection.
+    reasons: dict[str, list[str]] = field(default_factory=dict)
+    # Changed paths that forced a full run, and those that selected nothing.
+    global_changes: list[str] = field(default_factory=list)
+    ignored: list[str] = field(default_factory=list)
+
+
+def changed_files(ref: str = "HEAD") -> list[str]:
+    """Repo-relative paths that differ from ``ref``, committed or not, plus untracked files."""
+
+    def git(*args: str) -> list[str]:
+        out = subprocess.run(
+            ["git", *args], cwd=REPO_ROOT, check=True, capture_output=True, text=True
+        ).stdout
+        return [line for line in out.splitlines() if line]
+
+    return sorted(set(git("diff", "--name-only", ref)) | set(git("ls-files", "--others", "--exclude-standard")))
+
+
+def _resolve(importer: str, spec: str) -> str | None:
+    """The ``src`` file an import specifier refers to, or None for packages."""
+    if spec.startswith("@/"):
+        base = PurePosixPath("src") / spec[2:]
+    elif spec.startswith("."):
+        base = PurePosixPath(importer).parent / spec
+    else:
+        return None
+    # Normalise "a/./b" and "a/../b" without touching the filesystem.
+    parts: list[str] = []
+    for part in base.parts:
+        if part == "..":
+            parts.pop()
+        elif part != ".":
+            parts.append(part)
+    base = PurePosixPath(*parts)
+    for extension in _EXTENSIONS:
+        candidate = f"{base}{extension}"
+        if (REPO_ROOT / candidate).is_file():
+            return candidate
+    return None
+
+
+def import_graph() -> dict[str, set[str]]:
+    """``src`` file -> the ``src`` files that import it."""
+    importers: dict[str, set[str]] = defaultdict(set)
+    for path in SRC_DIR.rglob("*"):
+        if path.suffix not in (".ts", ".tsx", ".js", ".jsx"):
+            continue
+        importer = path.relative_to(REPO_ROOT).as_posix()
+        for spec in _IMPORT.findall(path.read_text(encoding="utf-8")):
+            target = _resolve(importer, spec)
+            if target is not None:
+                importers[target].add(importer)
+    return importers
+
+
+def dependents(path: str, importers: dict[str, set[str]]) -> set[str]:
+    """``path`` and every file that imports it, directly or transitively."""
+    seen, queue = {path}, deque([path])
+    while queue:
+        for importer in importers.get(queue.popleft(), ()):
+            if importer not in seen:
+                seen.add(importer)
+                queue.append(importer)
+    return seen
+
+
+def load_features(path=CODE_SUMMARY_PATH) -> dict[str, list[str]]:
+    """Feature name -> file and directory paths from ``code_summary.json``."""
+    summary = json.loads(path.read_text(encoding="utf-8"))
+    return {feature["name"]: feature.get("files", []) for feature in summary.get("features", [])}
+
+
+def _covers(feature_path: str, path: str) -> bool:
+    return path == feature_path or path.startswith(feature_path.rstrip("/") + "/")
+
+
+def _is_global(path: str) -> bool:
+    return any(_covers(pattern, path) or fnmatch.fnmatchcase(path, pattern) for pattern in GLOBAL_PATHS)
+
+
+def feature_tcs(features: dict[str, list[str]], titles: dict[str, str]) -> dict[str, list[str]]:
+    """Feature name -> TC ids whose title names it, or its first word."""
+    mapping = {}
+    for name in features:
+        if name in HUB_FEATURES:
+            mapping[name] = list(titles)
+            continue
+        lowered = name.lower()
+        matched = [tc_id for tc_id, title in titles.items() if lowered in title.lower()]
+        if not matched:
+            # "Theme Management" is tested as "Theme toggling ...".
+            word = re.compile(rf"\b{re.escape(lowered.split()[0])}\b")
+            matched = [tc_id for tc_id, title in titles.items() if word.search(title.lower())]
+        mapping[name] = matched
+    return mapping
+
+
+def _titles() -> dict[str, str]:
+    # "TC009_Contrast_Checker_accurately..." -> "Contrast Checker accurately..."
+    return {
+        path.name.split("_", 1)[0]: path.stem.split("_", 1)[1].replace("_", " ")
+        for path in discover(TESTS_DIR)
+    }
+
+
+def select(paths: list[str], features: dict[str, list[str]] | None = None) -> Impact:
+    """The TCs affected by changes to ``paths`` (repo-relative)."""
+    features = load_features() if features is None else features
+    titles = _titles()
+    tcs_of = feature_tcs(features, titles)
+    importers = import_graph()
+    impact = Impact()
+    reasons: dict[str, list[str]] = defaultdict(list)
+
+    for path in paths:
+        script = _TC_SCRIPT.match(path)
+        if script:
+            reasons[script.group(1)].append(f"{path} (the script itself)")
+        elif path.startswith("src/"):
+            affected = dependents(path, importers)
+            reached = [
+                name
+                for name, feature_paths in features.items()
+                if any(_covers(fp, file) for fp in feature_paths for file in affected)
+            ]
+            if not reached:
+                impact.global_changes.append(path)
+            for name in reached:
+                for tc_id in tcs_of[name]:
+                    reasons[tc_id].append(f"{path} (via {name})")
+        elif _is_global(path) or (
+            path.startswith(HARNESS_DIR) and path.endswith(".py")
+        ):
+            impact.global_changes.append(path)
+        else:
+            impact.ignored.append(path)
+
+    if impact.global_changes:
+        for tc_id in titles:
+            reasons[tc_id].extend(f"{path} (no narrower scope)" for path in impact.global_changes)
+    impact.tc_ids = sorted(reasons)
+    impact.reasons = {tc_id: reasons[tc_id] for tc_id in impact.tc_ids}
+    return impact
+
+
+def affected_tcs(ref: str = "HEAD") -> Impact:
+    return select(changed_files(ref))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.impact", description=__doc__)
+    parser.add_argument("ref", nargs="?", default="HEAD", help="git ref to diff against (default: HEAD)")
+    parser.add_argument(
+        "--files", nargs="+", metavar="PATH",
+        help="treat these repo-relative paths as changed instead of running git diff",
+    )
+    args = parser.parse_args(argv)
+
+    impact = select(args.files) if args.files else affected_tcs(args.ref)
+    for tc_id, why in impact.reasons.items():
+        print(f"{tc_id}  {why[0]}" + (f"  (+{len(why) - 1} more)" if len(why) > 1 else ""))
+    for path in impact.ignored:
+        print(f"        ignored: {path}")
+    print(f"\n{len(impact.tc_ids)} of {len(_titles())} TCs affected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
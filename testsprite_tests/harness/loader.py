@@ -0,0 +1,106 @@
+"""Discover and import the generated ``TC*.py`` scripts without running them.
+
+Each script ends with a module-level ``asyncio.run(run_test())``. The loader
+drops that statement from the parsed source before executing it, so the
+script bodies stay exactly as TestSprite generated them and ``run_test`` can
+be awaited by the harness instead. A trailing ``await asyncio.sleep(...)``
+after the final assertions, which TestSprite emits on regeneration, is dropped
+as well; :mod:`harness.artifacts` captures the final state instead.
+"""
+
+import ast
+import re
+import types
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from .config import TESTS_DIR
+
+_TC_NAME = re.compile(r"^(TC\d{3})_(.+)\.py$")
+
+
+@dataclass
+class TestCase:
+    tc_id: str
+    title: str
+    path: Path
+    module: types.ModuleType
+
+    @property
+    def run_test(self) -> Callable[[], Awaitable[None]]:
+        return self.module.run_test
+
+    @property
+    def result_title(self) -> str:
+        """Title in the ``TC001-Validate ...`` form used by ``test_results.json``."""
+        return f"{self.tc_id}-{self.title}"
+
+
+def discover(tests_dir: Path = TESTS_DIR, only: list[str] | None = None) -> list[Path]:
+    """Return the TC script paths in id order, optionally limited to ``only`` ids."""
+    wanted = {tc.upper() for tc in only} if only else None
+    paths = []
+    for path in sorted(tests_dir.glob("TC*.py")):
+        match = _TC_NAME.match(path.name)
+        if match and (wanted is None or match.group(1) in wanted):
+            paths.append(path)
+    return paths
+
+
+def _is_asyncio_call(node: ast.AST, name: str) -> bool:
+    """True for ``asyncio.<name>(...)``."""
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    return (
+        isinstance(func, ast.Attribute)
+        and func.attr == name
+        and isinstance(func.value, ast.Name)
+        and func.value.id == "asyncio"
+    )
+
+
+def _is_entry_point(node: ast.stmt) -> bool:
+    """True for a top-level ``asyncio.run(...)`` statement."""
+    return isinstance(node, ast.Expr) and _is_asyncio_call(node.value, "run")
+
+
+def _drop_trailing_sleep(tree: ast.Module) -> None:
+    """Remove ``await asyncio.sleep(...)`` when it ends ``run_test``'s try body."""
+    for node in tree.body:
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == "run_test":
+            for stmt in node.body:
+                if isinstance(stmt, ast.Try) and len(stmt.body) > 1:
+                    last = stmt.body[-1]
+                    if (
+                        isinstance(last, ast.Expr)
+                        and isinstance(last.value, ast.Await)
+                        and _is_asyncio_call(last.value.value, "sleep")
+                    ):
+                        stmt.body.pop()
+
+
+def load_case(path: Path) -> TestCase:
+    """Import one TC script as a fresh module with its entry point removed."""
+    match = _TC_NAME.match(path.name)
+    if not match:
+        raise ValueError(f"Not a TestSprite test script: {path.name}")
+    tc_id, slug = match.groups()
+
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    tree.body = [node for node in tree.body if not _is_entry_point(node)]
+    _drop_trailing_sleep(tree)
+
+    module = types.ModuleType(f"testsprite_{tc_id.lower()}")
+    module.__file__ = str(path)
+    # Compiled against the real path so tracebacks point at the script lines.
+    exec(compile(tree, str(path), "exec"), module.__dict__)
+    if not callable(getattr(module, "run_test", None)):
+        raise ValueError(f"{path.name} does not define run_test()")
+
+    return TestCase(tc_id=tc_id, title=slug.replace("_", " "), path=path, module=module)
+
+
+def load_cases(only: list[str] | None = None) -> list[TestCase]:
+    return [load_case(path) for path in discover(only=only)]
@@ -0,0 +1,319 @@
+"""Named locators for the app, backed by role, text and ``data-testid`` selectors.
+
+Steps and helpers refer to elements by name (``nav.back_to_hub``,
+``glass.blur_slider``) instead of by absolute XPath. When the layout changes,
+the fix is one line here rather than an edit to every script that clicks the
+element. The generated scripts address elements by paths such as
+``html/body/div/div[2]/main/div/div/div[2]/div/div[2]/div[3]/div[2]/span/span[2]/span``.
+Those are slow to evaluate, and they break whenever a wrapper ``div`` is added
+or removed. The report gives this as the cause of the "Back to Hub" timeouts:
+the button is no longer inside an ``<a>``.
+
+* :data:`LOCATORS` maps each name to one or more candidate selectors, most
+  stable first.
+* :class:`LocatorResolver` remembers, per route, which candidate matched, so
+  later lookups go straight to it. :func:`resolve` uses the shared resolver;
+  the page objects and the plan executor look elements up through it.
+  :func:`locate` is the synchronous variant: it reuses what ``resolve`` has
+  learnt but never resolves anything itself.
+* :data:`XPATH_ALIASES` maps the XPaths found in the TC scripts to names.
+  ``python -m harness.locators migrate`` rewrites the scripts to use the
+  named selectors. Each rewritten line is tagged ``# locator: <name>``, and
+  running ``migrate`` again updates tagged lines after a registry change.
+
+The rewritten scripts still run standalone; they contain the selector text,
+not an import of this module.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from playwright import async_api
+
+from .config import TESTS_DIR
+from .fixtures import tool_routes
+from .loader import discover
+
+
+def _slider_labelled(label: str) -> str:
+    """The thumb of the Radix slider under a ``<Label>`` with text ``label``."""
+    return f"div:has(> div > label:text-is('{label}')) [role=slider]"
+
+
+def _number_labelled(label: str) -> str:
+    """The number ``<Input>`` next to the ``<Label>`` with text ``label``."""
+    return f"div:has(> label:text-is('{label}')) input[type=number]"
+
+
+def _hex_labelled(label: str) -> str:
+    """The text input beside the colour picker under the ``<Label>`` ``label``."""
+    return f"div:has(> label:text-is('{label}')) input:not([type=color])"
+
+
+def _tool_link(path: str) -> str:
+    # The hub cards, footer and mobile menu all link to tools; take the visible one.
+    return f"a[href='{path}'] >> visible=true"
+
+
+LOCATORS: dict[str, tuple[str, ...]] = {
+    # Layout (src/components/layout, src/components/tools/ToolLayout.tsx)
+    "nav.main": ("nav[aria-label='Main navigation']",),
+    "nav.back_to_hub": ("role=button[name='Back to Hub']", "text=Back to Hub"),
+    "nav.theme_toggle": ("role=button[name='Toggle theme']",),
+    "nav.menu_toggle": ("role=button[name=/^(Open|Close) menu$/]",),
+    "hub.explore_tools": ("role=button[name='Explore Tools']", "text=Explore Tools"),
+    # Command palette (src/components/CommandPalette.tsx)
+    "palette_dialog.dialog": ("role=dialog",),
+    "palette_dialog.search": ("input[placeholder='Type a command or search...']",),
+    # ExportButton renders "Copy" (or its label), then "Copied" for two seconds.
+    "tool.copy": ("role=button[name=/^Cop(y|ied)/]",),
+    "tool.randomize": ("role=button[name=/Randomize/]",),
+    "tool.reset": ("role=button[name=/^Reset/]",),
+    # The export tabs keep every panel mounted; only the active one is shown.
+    "tool.active_panel": ("[role=tabpanel][data-state=active]",),
+    # GlassTool
+    "glass.blur_slider": ("[data-testid=blur-slider] [role=slider]", _slider_labelled("Blur")),
+    "glass.transparency_slider": ("[data-testid=transparency-slider] [role=slider]",),
+    "glass.saturation_slider": ("[data-testid=saturation-slider] [role=slider]",),
+    "glass.radius_slider": ("[data-testid=radius-slider] [role=slider]",),
+    "glass.title": ("input[placeholder='Enter title...']",),
+    "glass.subtitle": ("input[placeholder='Enter subtitle...']",),
+    "glass.button_text": ("input[placeholder='Enter button text...']",),
+    # PaletteTool
+    "palette.generate": ("role=button[name='Generate']",),
+    "palette.lock": ("role=button[name=/^(Lock|Unlock) Color$/]",),
+    "palette.color": ("input[type=color][aria-label='Edit Color Hex']",),
+    # GradientTextTool
+    "gradient.text": ("input[placeholder='Enter your text']",),
+    "gradient.highlight": ("input[placeholder='Word to highlight with gradient']",),
+    "gradient.color1": (_hex_labelled("Color 1"),),
+    "gradient.color2": (_hex_labelled("Color 2"),),
+    # ShadowTool
+    "shadow.size": (_number_labelled("Shape Size"),),
+    "shadow.distance": (_number_labelled("Distance"),),
+    "shadow.blur": (_number_labelled("Blur"),),
+    "shadow.intensity": (_number_labelled("Intensity"),),
+    "shadow.radius": (_number_labelled("Border Radius"),),
+    "shadow.size_slider": (_slider_labelled("Shape Size"),),
+    "shadow.distance_slider": (_slider_labelled("Distance"),),
+    "shadow.blur_slider": (_slider_labelled("Blur"),),
+    "shadow.intensity_slider": (_slider_labelled("Intensity"),),
+    "shadow.radius_slider": (_slider_labelled("Border Radius"),),
+    "shadow.background": (_hex_labelled("Background Color"),),
+    "shadow.raised": ("role=button[name='Raised']",),
+    "shadow.pressed": ("role=button[name='Pressed']",),
+    # BlobTool
+    "blob.complexity_slider": ("[data-testid=complexity-slider] [role=slider]",),
+    "blob.size_slider": ("[data-testid=size-slider] [role=slider]",),
+    "blob.angle_slider": ("[data-testid=angle-slider] [role=slider]",),
+    "blob.rotation_slider": ("[data-testid=rotation-slider] [role=slider]",),
+    "blob.download_svg": ("role=button[name='Download SVG']",),
+    # GridTool
+    "grid.columns_slider": (_slider_labelled("Columns"),),
+    "grid.rows_slider": (_slider_labelled("Rows"),),
+    "grid.gap_slider": (_slider_labelled("Gap"),),
+    # ContrastTool
+    "contrast.foreground_hex": ("input[placeholder='#ffffff']",),
+    "contrast.background_hex": ("input[placeholder='#0f172a']",),
+    "contrast.ratio": ("text=/^\\d+(\\.\\d+)?:1$/",),
+    # MetaTool
+    "meta.title": ("input[placeholder='Page title']",),
+    "meta.description": ("[placeholder='Page description']",),
+    "meta.keywords": ("input[placeholder='keyword1, keyword2, keyword3']",),
+    "meta.export": ("[data-testid=meta-export-button]", "role=button[name=/^Cop(y|ied)/]"),
+    # PromptTool
+    "prompt.task": ("textarea[placeholder^='e.g. Write a Python script']",),
+    "prompt.context": ("textarea[placeholder^='e.g. This script is for']",),
+    "prompt.add_example": ("role=button[name='Add Example']",),
+    "prompt.example_input": ("input[placeholder='Input example...']",),
+    "prompt.example_output": ("input[placeholder='Expected output...']",),
+}
+# One "tool_link.<id>" per tool in src/lib/toolsConfig.ts.
+LOCATORS.update({f"tool_link.{tool_id}": (_tool_link(path),) for tool_id, path in tool_routes().items()})
+
+_MAIN = "html/body/div/div[2]/main/div/div/div[2]/div/div[2]"
+# XPaths used by the TC scripts -> locator names. An XPath is listed only where
+# every script that uses it means the same element.
+XPATH_ALIASES: dict[str, str] = {
+    "html/body/div/div[2]/nav/div/div/div[2]/button": "nav.theme_toggle",
+    "html/body/div/div[2]/main/div/div/div/a/button": "nav.back_to_hub",
+    "html/body/div/div[2]/main/section/div[3]/button": "hub.explore_tools",
+    # The navbar tool buttons and hub tool cards, both in toolsConfig order.
+    **{
+        f"html/body/div/div[2]/nav/div/div/div/div/a{'' if index == 1 else f'[{index}]'}/button": (
+            f"tool_link.{tool_id}"
+        )
+        for index, tool_id in enumerate(tool_routes(), 1)
+    },
+    **{
+        f"html/body/div/div[2]/main/section[3]/div/div[2]/a{'' if index == 1 else f'[{index}]'}": (
+            f"tool_link.{tool_id}"
+        )
+        for index, tool_id in enumerate(tool_routes(), 1)
+    },
+    f"{_MAIN}/div[3]/div[2]/span/span[2]/span": "glass.blur_slider",
+    f"{_MAIN}/div[3]/div[3]/span/span[2]/span": "glass.transparency_slider",
+    f"{_MAIN}/div[3]/div[4]/span/span[2]/span": "glass.saturation_slider",
+    f"{_MAIN}/div[3]/div[5]/span/span[2]/span": "glass.radius_slider",
+    f"{_MAIN}/div[2]/div/span/span[2]/span": "blob.complexity_slider",
+    f"{_MAIN}/div[2]/div[2]/span/span[2]/span": "blob.size_slider",
+    f"{_MAIN}/div[2]/div/div/span/span[2]/span": "grid.columns_slider",
+    f"{_MAIN}/div[2]/div/div[2]/span/span[2]/span": "grid.rows_slider",
+    f"{_MAIN}/div[2]/div[2]/div[2]/span/span[2]/span": "grid.gap_slider",
+    f"{_MAIN}/div[2]/div/div/input[2]": "contrast.foreground_hex",
+    f"{_MAIN}/div[2]/div[2]/div/input[2]": "contrast.background_hex",
+    f"{_MAIN}/div/div/button": "tool.randomize",
+    f"{_MAIN}/div/div/button[2]": "tool.reset",
+    f"{_MAIN}/div[3]/div/div[2]/div/div/button": "tool.copy",
+    "html/body/div/div[2]/main/div/div/div[2]/div/div[3]/div/div[2]/div/div/button": "tool.copy",
+    "html/body/div/div[2]/main/div/div/div[2]/div/div/div[2]/div/input": "meta.title",
+    "html/body/div/div[2]/main/div/div/div[2]/div/div/div[2]/div[3]/input": "meta.keywords",
+}
+
+
+def candidates(name: str) -> tuple[str, ...]:
+    try:
+        return LOCATORS[name]
+    except KeyError:
+        raise KeyError(f"Unknown locator {name!r}") from None
+
+
+def selector(name: str) -> str:
+    """The preferred selector for ``name``."""
+    return candidates(name)[0]
+
+
+def _route(scope: async_api.Page | async_api.Locator) -> str:
+    page = scope if isinstance(scope, async_api.Page) else scope.page
+    return urlsplit(page.url).path
+
+
+class LocatorResolver:
+    """Resolve locator names, remembering per route which candidate matched."""
+
+    def __init__(self):
+        self._resolved: dict[tuple[str, str], str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def locate(self, scope: async_api.Page | async_api.Locator, name: str) -> async_api.Locator:
+        """A locator for ``name`` without a round trip.
+
+        Uses the candidate already resolved for this route. Otherwise it is
+        the ``or`` of all candidates, which Playwright evaluates on use.
+        """
+        resolved = self._resolved.get((_route(scope), name))
+        if resolved is not None:
+            self.hits += 1
+            return scope.locator(resolved).first
+        self.misses += 1
+        return self._any(scope, name)
+
+    @staticmethod
+    def _any(scope: async_api.Page | async_api.Locator, name: str) -> async_api.Locator:
+        first, *rest = candidates(name)
+        locator = scope.locator(first)
+        for alternative in rest:
+            locator = locator.or_(scope.locator(alternative))
+        return locator.first
+
+    async def resolve(
+        self, scope: async_api.Page | async_api.Locator, name: str
+    ) -> async_api.Locator:
+        """Like :meth:`locate`, but settle on the first candidate present now and remember it."""
+        key = (_route(scope), name)
+        if key in self._resolved:
+            self.hits += 1
+            return scope.locator(self._resolved[key]).first
+        self.misses += 1
+        for candidate in candidates(name):
+            if await scope.locator(candidate).count():
+                self._resolved[key] = candidate
+                return scope.locator(candidate).first
+        # Nothing there yet; let the action's own waiting pick whichever appears.
+        return self._any(scope, name)
+
+
+resolver = LocatorResolver()
+
+
+async def resolve(scope: async_api.Page | async_api.Locator, name: str) -> async_api.Locator:
+    """The first element matching locator ``name`` within ``scope``, through the shared resolver."""
+    return await resolver.resolve(scope, name)
+
+
+def locate(scope: async_api.Page | async_api.Locator, name: str) -> async_api.Locator:
+    """Like :func:`resolve`, without a round trip; uses only candidates already resolved."""
+    return resolver.locate(scope, name)
+
+
+# -- migration ----------------------------------------------------------------
+
+_XPATH_CALL = re.compile(r"""\.locator\((['"])xpath=(?P<xpath>[^'"]*)\1\)(?P<rest>.*?)(\s*# locator: [\w.-]+)?$""")
+_TAGGED_CALL = re.compile(r"""\.locator\((?P<quoted>'[^']*'|"[^"]*")\)(?P<rest>.*?)\s*# locator: (?P<name>[\w.-]+)$""")
+
+
+def migrate_line(line: str) -> tuple[str, str | None]:
+    """Rewrite one script line; returns the new line and the locator name used."""
+    match = _TAGGED_CALL.search(line)
+    if match:
+        name = match.group("name")
+        new = f".locator({selector(name)!r}){match.group('rest')}  # locator: {name}"
+        return line[: match.start()] + new, name
+    match = _XPATH_CALL.search(line)
+    if match and match.group("xpath") in XPATH_ALIASES:
+        name = XPATH_ALIASES[match.group("xpath")]
+        new = f".locator({selector(name)!r}){match.group('rest')}  # locator: {name}"
+        return line[: match.start()] + new, name
+    return line, None
+
+
+def migrate_script(path: Path, write: bool = False) -> tuple[int, list[str]]:
+    """Rewrite ``path``; returns (lines changed, XPaths left without an alias)."""
+    source = path.read_text(encoding="utf-8")
+    lines = source.splitlines(keepends=True)
+    changed, unmapped = 0, []
+    for index, line in enumerate(lines):
+        body = line.rstrip("\r\n")
+        new, _ = migrate_line(body)
+        if new != body:
+            lines[index] = new + line[len(body):]
+            changed += 1
+        elif "xpath=" in body:
+            unmapped.extend(m.group("xpath") for m in _XPATH_CALL.finditer(body))
+    if write and changed:
+        path.write_text("".join(lines), encoding="utf-8")
+    return changed, unmapped
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.locators", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    migrate = commands.add_parser("migrate", help="rewrite the TC scripts to the named selectors")
+    migrate.add_argument("tests", nargs="*", help="TC ids (default: all)")
+    migrate.add_argument("--write", action="store_true", help="write the changes (default: dry run)")
+    commands.add_parser("list", help="print the registry")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, selectors in LOCATORS.items():
+            print(f"{name:<28} {' | '.join(selectors)}")
+        return 0
+
+    total, left = 0, 0
+    for path in discover(TESTS_DIR, only=args.tests or None):
+        changed, unmapped = migrate_script(path, write=args.write)
+        total += changed
+        left += len(unmapped)
+        if changed or unmapped:
+            print(f"{path.name}: {changed} lines {'rewritten' if args.write else 'to rewrite'}, "
+                  f"{len(unmapped)} XPaths without an alias")
+    print(f"\n{total} lines {'rewritten' if args.write else 'to rewrite'}; {left} XPaths left")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Long tasks, layout shifts and input latency of every test, recorded as it runs.
+
+PromptTool rescores the prompt on every keystroke and PaletteTool recomputes
+its contrast scores on every generate, and no TC times either. Without a
+dedicated perf test, :class:`MainThreadMonitor` adds an init script to each
+context the script opens. The script registers performance observers for:
+
+* ``longtask`` - main-thread tasks over 50 ms;
+* ``layout-shift`` - grouped into session windows, as CLS defines them;
+* ``event`` - the input-to-next-paint duration of each interaction, the
+  entries INP is built from.
+
+Entries are batched in the page and sent every :data:`FLUSH_MS` through a
+context binding, ``expose_binding``. The rest are sent before the script
+closes the context. The test's :class:`~harness.session.CaseResult` then
+carries:
+
+* ``tbt_ms`` - the blocking part of every long task in the test, that is,
+  the time past 50 ms. It is summed over the whole test rather than between
+  FCP and TTI, so it grows with the number of interactions a TC makes;
+* ``worst_inp_ms`` and ``worst_input`` - the slowest interaction and what it
+  was;
+* ``long_tasks`` and ``cls``.
+"""
+
+from playwright import async_api
+
+from .hooks import ContextHook
+
+BINDING = "__harnessMainThread"
+FLUSH_MS = 250
+LONG_TASK_BLOCKING_MS = 50
+# Interactions faster than this are not reported by the browser at all.
+EVENT_DURATION_THRESHOLD_MS = 16
+
+_MONITOR_JS = """(() => {
+    if (window.__harnessMainThreadFlush) return;
+    let pending = [];
+    const flush = () => {
+        const send = window.__BINDING__;
+        if (!pending.length || typeof send !== "function") return Promise.resolve();
+        const batch = pending;
+        pending = [];
+        return send(batch);
+    };
+    window.__harnessMainThreadFlush = flush;
+    const observe = (type, onEntry, options = {}) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(onEntry))
+                .observe({type, buffered: true, ...options});
+        } catch (error) {}  // Entry type not supported by this browser.
+    };
+    const describe = target => {
+        if (!target || !target.tagName) return "";
+        const label = target.getAttribute("aria-label") || (target.textContent || "").trim().slice(0, 40);
+        return label ? `${target.tagName.toLowerCase()} "${label}"` : target.tagName.toLowerCase();
+    };
+    observe("longtask", entry => pending.push({type: "longtask", duration: entry.duration}));
+    let windowValue = 0, windowStart = 0, lastShift = 0;
+    observe("layout-shift", entry => {
+        if (entry.hadRecentInput) return;
+        if (windowValue && entry.startTime - lastShift < 1000 && entry.startTime - windowStart < 5000) {
+            windowValue += entry.value;
+        } else {
+            windowValue = entry.value;
+            windowStart = entry.startTime;
+        }
+        lastShift = entry.startTime;
+        pending.push({type: "layout-shift", window: windowValue});
+    });
+    observe("event", entry => {
+        if (!entry.interactionId) return;
+        pending.push({
+            type: "event", duration: entry.duration, name: entry.name, target: describe(entry.target),
+        });
+    }, {durationThreshold: __THRESHOLD__});
+    setInterval(flush, __FLUSH_MS__);
+    addEventListener("pagehide", flush);
+})();""".replace("__BINDING__", BINDING).replace(
+    "__THRESHOLD__", str(EVENT_DURATION_THRESHOLD_MS)
+).replace("__FLUSH_MS__", str(FLUSH_MS))
+
+
+class MainThreadMonitor(ContextHook):
+    def __init__(self):
+        self.long_tasks: list[float] = []
+        self.cls = 0.0
+        self.worst_inp_ms = 0.0
+        self.worst_input = ""
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        await context.expose_binding(BINDING, self.receive)
+        await context.add_init_script(_MONITOR_JS)
+
+    def receive(self, source: dict, batch: list[dict]) -> None:
+        """Binding callback: fold one batch of entries from a page into the totals."""
+        for entry in batch:
+            kind = entry.get("type")
+            if kind == "longtask":
+                self.long_tasks.append(entry["duration"])
+            elif kind == "layout-shift":
+                self.cls = max(self.cls, entry["window"])
+            elif kind == "event" and entry["duration"] > self.worst_inp_ms:
+                self.worst_inp_ms = entry["duration"]
+                self.worst_input = entry["name"] + (f" on {entry['target']}" if entry["target"] else "")
+
+    async def before_close(self, context: async_api.BrowserContext) -> None:
+        for page in context.pages:
+            try:
+                await page.evaluate("() => window.__harnessMainThreadFlush?.()")
+            except async_api.Error:
+                pass  # Page closed or mid-navigation; its last batch is lost.
+
+    @property
+    def tbt_ms(self) -> float:
+        return sum(max(0.0, duration - LONG_TASK_BLOCKING_MS) for duration in self.long_tasks)
+
+    def finish(self, result) -> None:
+        result.tbt_ms = round(self.tbt_ms, 1)
+        result.long_tasks = len(self.long_tasks)
+        result.worst_inp_ms = round(self.worst_inp_ms, 1)
+        result.worst_input = self.worst_input
+        result.cls = round(self.cls, 4)
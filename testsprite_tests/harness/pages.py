@@ -0,0 +1,344 @@
+"""Page objects for the tool pages: one class per tool, one method per intent.
+
+The generated scripts reach a state through sequences of clicks. For example,
+TC001 clicks a slider thumb three times at three-second intervals and hopes
+the value moves. A page object sets that state directly and checks it:
+
+    glass = await GlassPage.open(context)
+    await glass.set_blur(20)            # keys on the Radix thumb, checked via aria-valuenow
+    css = await glass.export_css()      # CSS tab, Copy, clipboard text
+
+* Sliders are set by :func:`harness.sliders.set_slider`. It sends the
+  shortest key sequence to the target and checks ``aria-valuenow`` in the
+  same round trip.
+* Text, number and colour inputs are filled in a single ``fill``.
+* ``export_*`` opens the tab for the format, clicks its Copy button, and
+  returns the clipboard text. The context needs the ``clipboard-read``
+  permission for this; the plan executor grants it.
+
+Elements are addressed through :mod:`~harness.locators` names, so a layout
+change is fixed in the registry rather than here.
+"""
+
+from pathlib import Path
+from typing import ClassVar
+
+from playwright import async_api
+
+from .fixtures import tool_url
+from .locators import resolve, selector
+from .sliders import read_slider, set_slider, wait_for_value
+
+
+class ToolPage:
+    """A tool route open in ``page``. Subclasses set :attr:`tool_id` and :attr:`sliders`."""
+
+    tool_id: ClassVar[str]
+    # slider name -> (locator name, step) as declared on the <Slider> in src/pages/tools.
+    sliders: ClassVar[dict[str, tuple[str, float]]] = {}
+
+    def __init__(self, page: async_api.Page):
+        self.page = page
+
+    @classmethod
+    async def open(
+        cls, context: async_api.BrowserContext, endpoint: str | None = None
+    ) -> "ToolPage":
+        """Open a new page in ``context`` directly on this tool's route."""
+        page = await context.new_page()
+        return await cls.goto(page, endpoint)
+
+    @classmethod
+    async def goto(cls, page: async_api.Page, endpoint: str | None = None) -> "ToolPage":
+        await page.goto(tool_url(cls.tool_id, endpoint), wait_until="domcontentloaded")
+        return cls(page)
+
+    async def resolve(self, name: str) -> async_api.Locator:
+        return await resolve(self.page, name)
+
+    # -- sliders ----------------------------------------------------------------
+
+    async def slider_value(self, slider: str) -> float:
+        name, _ = self.sliders[slider]
+        return (await read_slider(await self.resolve(name))).now
+
+    async def slider_range(self, slider: str) -> tuple[float, float]:
+        name, _ = self.sliders[slider]
+        state = await read_slider(await self.resolve(name))
+        return state.min, state.max
+
+    async def set_slider(self, slider: str, value: float) -> None:
+        """Move ``slider`` to exactly ``value``; SliderMismatch if it does not stick."""
+        name, step = self.sliders[slider]
+        await set_slider(await self.resolve(name), value, step)
+
+    # -- inputs -----------------------------------------------------------------
+
+    async def click(self, name: str) -> None:
+        await (await self.resolve(name)).click()
+
+    async def fill(self, name: str, text: str) -> None:
+        await (await self.resolve(name)).fill(text)
+
+    async def randomize(self) -> None:
+        await self.click("tool.randomize")
+
+    async def reset(self) -> None:
+        await self.click("tool.reset")
+
+    # -- export -----------------------------------------------------------------
+
+    async def export(self, tab: str | None = None) -> str:
+        """Copy the code of export ``tab`` (the visible one if None) and return it."""
+        scope: async_api.Page | async_api.Locator = self.page
+        if tab is not None:
+            await self.page.get_by_role("tab", name=tab, exact=True).click()
+            scope = await self.resolve("tool.active_panel")
+        await (await resolve(scope, "tool.copy")).click()
+        return await self.page.evaluate("() => navigator.clipboard.readText()")
+
+    async def export_css(self) -> str:
+        return await self.export("CSS")
+
+
+class GlassPage(ToolPage):
+    tool_id = "glass"
+    sliders = {
+        "blur": ("glass.blur_slider", 1),
+        "transparency": ("glass.transparency_slider", 1),
+        "saturation": ("glass.saturation_slider", 5),
+        "radius": ("glass.radius_slider", 1),
+    }
+
+    async def set_blur(self, px: int) -> None:
+        await self.set_slider("blur", px)
+
+    async def set_transparency(self, percent: int) -> None:
+        await self.set_slider("transparency", percent)
+
+    async def set_saturation(self, percent: int) -> None:
+        await self.set_slider("saturation", percent)
+
+    async def set_radius(self, px: int) -> None:
+        await self.set_slider("radius", px)
+
+    async def set_content(
+        self, title: str | None = None, subtitle: str | None = None, button_text: str | None = None
+    ) -> None:
+        for name, text in (
+            ("glass.title", title),
+            ("glass.subtitle", subtitle),
+            ("glass.button_text", button_text),
+        ):
+            if text is not None:
+                await self.fill(name, text)
+
+    async def export_tailwind(self) -> str:
+        return await self.export("Tailwind")
+
+
+class PalettePage(ToolPage):
+    tool_id = "palette"
+
+    async def generate(self) -> None:
+        await self.click("palette.generate")
+
+    async def colors(self) -> list[str]:
+        """The palette's hex colours, left to right."""
+        return await self.page.locator(selector("palette.color")).evaluate_all(
+            "inputs => inputs.map(input => input.value)"
+        )
+
+    async def set_color(self, index: int, hex_color: str) -> None:
+        # A colour input takes a lowercase #rrggbb.
+        await self.page.locator(selector("palette.color")).nth(index).fill(hex_color.lower())
+
+    async def toggle_lock(self, index: int) -> None:
+        await self.page.locator(selector("palette.lock")).nth(index).click()
+
+    async def export_json(self) -> str:
+        return await self.export("JSON")
+
+
+class GradientTextPage(ToolPage):
+    tool_id = "gradient-text"
+
+    async def set_text(self, text: str, highlight: str | None = None) -> None:
+        await self.fill("gradient.text", text)
+        if highlight is not None:
+            await self.fill("gradient.highlight", highlight)
+
+    async def set_colors(self, start: str, end: str) -> None:
+        await self.fill("gradient.color1", start)
+        await self.fill("gradient.color2", end)
+
+    async def export_tailwind(self) -> str:
+        return await self.export("Tailwind")
+
+
+class ShadowPage(ToolPage):
+    """The neumorphism editor: one light/dark shadow pair.
+
+    The ``set_*`` methods type into the number inputs. ``set_slider("distance", 12)``
+    moves the shadow offset through its slider instead.
+    """
+
+    tool_id = "shadow"
+    sliders = {
+        "size": ("shadow.size_slider", 10),
+        "distance": ("shadow.distance_slider", 1),
+        "blur": ("shadow.blur_slider", 1),
+        "intensity": ("shadow.intensity_slider", 1),
+        "radius": ("shadow.radius_slider", 5),
+    }
+
+    async def _set_number(self, name: str, value: int) -> None:
+        # The number input clamps on change and mirrors its slider.
+        await self.fill(f"shadow.{name}", str(value))
+        await wait_for_value(await self.resolve(f"shadow.{name}_slider"), value)
+
+    async def set_size(self, px: int) -> None:
+        await self._set_number("size", px)
+
+    async def set_distance(self, px: int) -> None:
+        await self._set_number("distance", px)
+
+    async def set_blur(self, px: int) -> None:
+        await self._set_number("blur", px)
+
+    async def set_intensity(self, percent: int) -> None:
+        await self._set_number("intensity", percent)
+
+    async def set_radius(self, px: int) -> None:
+        await self._set_number("radius", px)
+
+    async def set_background(self, hex_color: str) -> None:
+        await self.fill("shadow.background", hex_color)
+
+    async def set_pressed(self, pressed: bool = True) -> None:
+        await self.click("shadow.pressed" if pressed else "shadow.raised")
+
+
+class BlobPage(ToolPage):
+    tool_id = "blob"
+    sliders = {
+        "complexity": ("blob.complexity_slider", 5),
+        "size": ("blob.size_slider", 8),
+        "angle": ("blob.angle_slider", 15),
+        "rotation": ("blob.rotation_slider", 5),
+    }
+
+    async def set_complexity(self, value: int) -> None:
+        await self.set_slider("complexity", value)
+
+    async def set_size(self, px: int) -> None:
+        await self.set_slider("size", px)
+
+    async def set_angle(self, degrees: int) -> None:
+        await self.set_slider("angle", degrees)
+
+    async def set_rotation(self, degrees: int) -> None:
+        await self.set_slider("rotation", degrees)
+
+    async def download_svg(self) -> str:
+        """The SVG markup of "Download SVG"; the preview itself is a styled div."""
+        async with self.page.expect_download() as download_info:
+            await self.click("blob.download_svg")
+        download = await download_info.value
+        return Path(await download.path()).read_text(encoding="utf-8")
+
+
+class GridPage(ToolPage):
+    tool_id = "grid"
+    sliders = {
+        "columns": ("grid.columns_slider", 1),
+        "rows": ("grid.rows_slider", 1),
+        "gap": ("grid.gap_slider", 4),
+    }
+
+    async def set_columns(self, count: int) -> None:
+        await self.set_slider("columns", count)
+
+    async def set_rows(self, count: int) -> None:
+        await self.set_slider("rows", count)
+
+    async def set_gap(self, px: int) -> None:
+        await self.set_slider("gap", px)
+
+
+class ContrastPage(ToolPage):
+    tool_id = "contrast"
+
+    async def set_colors(self, foreground: str, background: str) -> None:
+        await self.fill("contrast.foreground_hex", foreground)
+        await self.fill("contrast.background_hex", background)
+
+    async def ratio(self) -> float:
+        """The displayed contrast ratio, ``4.5`` for "4.50:1"."""
+        text = await (await self.resolve("contrast.ratio")).inner_text()
+        return float(text.split(":")[0])
+
+
+class MetaPage(ToolPage):
+    tool_id = "meta"
+
+    async def set_fields(
+        self, title: str | None = None, description: str | None = None, keywords: str | None = None
+    ) -> None:
+        for name, text in (
+            ("meta.title", title),
+            ("meta.description", description),
+            ("meta.keywords", keywords),
+        ):
+            if text is not None:
+                await self.fill(name, text)
+
+    async def export(self, tab: str | None = None) -> str:
+        # One export for the whole page; there are no format tabs.
+        await self.click("meta.export")
+        return await self.page.evaluate("() => navigator.clipboard.readText()")
+
+    async def export_html(self) -> str:
+        return await self.export()
+
+
+class PromptPage(ToolPage):
+    tool_id = "prompt"
+
+    async def set_task(self, task: str, context: str | None = None) -> None:
+        await self.fill("prompt.task", task)
+        if context is not None:
+            await self.fill("prompt.context", context)
+
+    async def add_example(self, example_input: str, expected_output: str) -> None:
+        """Append a few-shot example and fill it in; new examples go last."""
+        await self.click("prompt.add_example")
+        await self.page.locator(selector("prompt.example_input")).last.fill(example_input)
+        await self.page.locator(selector("prompt.example_output")).last.fill(expected_output)
+
+    async def export_prompt(self) -> str:
+        return await self.export()
+
+
+PAGES: dict[str, type[ToolPage]] = {
+    page.tool_id: page
+    for page in (
+        GlassPage,
+        PromptPage,
+        PalettePage,
+        GridPage,
+        GradientTextPage,
+        ShadowPage,
+        BlobPage,
+        ContrastPage,
+        MetaPage,
+    )
+}
+
+
+def page_for(page: async_api.Page, tool_id: str) -> ToolPage:
+    """The page object for ``tool_id`` on an already open ``page``."""
+    try:
+        return PAGES[tool_id](page)
+    except KeyError:
+        raise KeyError(f"No page object for tool {tool_id!r}; known: {', '.join(PAGES)}") from None
@@ -0,0 +1,75 @@
+"""Load ``testsprite_frontend_test_plan.json`` into plan cases and steps."""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config import TESTS_DIR
+
+PLAN_PATH = TESTS_DIR / "testsprite_frontend_test_plan.json"
+
+# Phrases in plan titles and steps that name a tool, checked in this order.
+TOOL_KEYWORDS = [
+    ("glass", ("glassmorphism", "glass")),
+    ("gradient-text", ("gradient text",)),
+    ("palette", ("color palette", "palette generator")),
+    ("shadow", ("box shadow", "shadow")),
+    ("blob", ("blob",)),
+    ("grid", ("css grid", "grid generator")),
+    ("contrast", ("contrast",)),
+    ("meta", ("meta tags",)),
+    ("prompt", ("prompt generator", "ai prompt")),
+]
+
+
+def infer_tool(text: str) -> str | None:
+    """Tool id named in ``text``, e.g. ``"Open Box Shadow Generator tool"`` -> ``"shadow"``."""
+    text = text.lower()
+    for tool_id, phrases in TOOL_KEYWORDS:
+        if any(phrase in text for phrase in phrases):
+            return tool_id
+    return None
+
+
+@dataclass
+class PlanStep:
+    type: str
+    description: str
+
+
+@dataclass
+class PlanCase:
+    tc_id: str
+    title: str
+    description: str = ""
+    category: str = ""
+    priority: str = ""
+    steps: list[PlanStep] = field(default_factory=list)
+
+    @property
+    def result_title(self) -> str:
+        return f"{self.tc_id}-{self.title}"
+
+    @property
+    def tool(self) -> str | None:
+        """The tool the case is about, if its title names one."""
+        return infer_tool(self.title)
+
+
+def load_plan(path: Path = PLAN_PATH, only: list[str] | None = None) -> list[PlanCase]:
+    wanted = {tc_id.upper() for tc_id in only} if only else None
+    cases = []
+    for entry in json.loads(path.read_text(encoding="utf-8")):
+        if wanted is not None and entry["id"] not in wanted:
+            continue
+        cases.append(
+            PlanCase(
+                tc_id=entry["id"],
+                title=entry["title"],
+                description=entry.get("description", ""),
+                category=entry.get("category", ""),
+                priority=entry.get("priority", ""),
+                steps=[PlanStep(step["type"], step["description"]) for step in entry.get("steps", [])],
+            )
+        )
+    return cases
@@ -0,0 +1,78 @@
+"""Chromium launch profiles.
+
+The generated scripts hard-code ``--single-process``, which serialises
+renderer and GPU work and lets one crashed page take down the whole browser.
+Under the harness the launch options come from a named profile instead,
+selected by ``launchProfile`` in ``tmp/config.json``. ``launchProfiles`` in the
+same file can add profiles or override fields of the built-in ones, e.g.::
+
+    "launchProfile": "throughput",
+    "launchProfiles": {"throughput": {"args": ["--renderer-process-limit=8"]}}
+"""
+
+from .config import load_config
+
+DEFAULT_PROFILE = "throughput"
+
+LAUNCH_PROFILES: dict[str, dict] = {
+    # What the generated scripts launch with, kept for comparison.
+    "single-process": {
+        "headless": True,
+        "args": [
+            "--window-size=1280,720",
+            "--disable-dev-shm-usage",
+            "--ipc=host",
+            "--single-process",
+        ],
+    },
+    # Multi-process, but with few renderers and no GPU process for small CI boxes.
+    "ci-lowmem": {
+        "headless": True,
+        "args": [
+            "--window-size=1280,720",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+            "--disable-extensions",
+            "--renderer-process-limit=2",
+            "--mute-audio",
+        ],
+    },
+    # Default multi-process model: one renderer per context, crashes stay local.
+    "throughput": {
+        "headless": True,
+        "args": [
+            "--window-size=1280,720",
+            "--disable-dev-shm-usage",
+            "--disable-extensions",
+            "--mute-audio",
+        ],
+    },
+    # Visible, slowed-down browser for stepping through a failing script.
+    "debug": {
+        "headless": False,
+        "slow_mo": 250,
+        "args": ["--window-size=1280,720"],
+    },
+}
+
+
+def profile_names(config: dict | None = None) -> list[str]:
+    config = load_config() if config is None else config
+    return sorted({*LAUNCH_PROFILES, *config.get("launchProfiles", {})})
+
+
+def launch_options(name: str | None = None, config: dict | None = None) -> dict:
+    """Keyword arguments for ``chromium.launch()`` for the profile ``name``.
+
+    ``name`` defaults to ``launchProfile`` from the config, then to
+    :data:`DEFAULT_PROFILE`.
+    """
+    config = load_config() if config is None else config
+    name = name or config.get("launchProfile") or DEFAULT_PROFILE
+    overrides = config.get("launchProfiles", {}).get(name)
+    if name not in LAUNCH_PROFILES and overrides is None:
+        raise ValueError(f"Unknown launch profile {name!r}; known: {', '.join(profile_names(config))}")
+    options = dict(LAUNCH_PROFILES.get(name, {}))
+    options.update(overrides or {})
+    options["args"] = list(options.get("args", []))
+    return options
@@ -0,0 +1,372 @@
+"""Build ``raw_report.md`` and an HTML report from the results history.
+
+Both reports are rebuilt incrementally from ``tmp/results/runs.jsonl``:
+
+* The history is append-only, so ``tmp/report/state.json`` records the byte
+  offset read so far. Each build parses only the rows appended since the last
+  one.
+* Each TC section is rendered from that TC's newest row and its recent
+  statuses. A section is re-rendered only when those inputs change, and the
+  cached Markdown and HTML are reused otherwise.
+* Run history is split into pages of :data:`RUNS_PER_PAGE` runs,
+  ``history-<n>.html``. A page links only to its neighbours, not to every
+  page, so a page that is full never changes again and a build rewrites at
+  most the newest one.
+
+The *Analysis* and *Key Gaps / Risks* parts that TestSprite leaves as
+placeholders are filled from the history: recent outcomes per TC, when a
+failure started, and which TCs keep failing or flip between outcomes.
+
+    python -m harness.report              # tmp/report/raw_report.md + index.html
+    python -m harness.report --rebuild    # ignore the cached state
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import sys
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+from .config import TESTS_DIR, TMP_DIR, load_config
+from .loader import discover
+from .plan import load_plan
+from .results import write_json
+from .store import RUNS_PATH, ResultRow
+
+REPORT_DIR = TMP_DIR / "report"
+STATE_PATH = REPORT_DIR / "state.json"
+RUNS_PER_PAGE = 50
+# Statuses kept per TC for the history strip and the flakiness check.
+RECENT_RUNS = 20
+# A TC whose outcome changed at least this often within RECENT_RUNS is "flipping".
+FLIP_THRESHOLD = 3
+
+_MARK = {"PASSED": "✅", "FAILED": "❌"}
+_STATE_VERSION = 1
+
+_CSS = """
+body { font-family: system-ui, sans-serif; background: #0f172a; color: #e2e8f0; margin: 0 auto;
+       max-width: 1000px; padding: 2rem; line-height: 1.5; }
+a { color: #38bdf8; } h1, h2 { color: #f8fafc; } table { border-collapse: collapse; width: 100%; }
+th, td { border-bottom: 1px solid #334155; padding: .4rem .6rem; text-align: left; vertical-align: top; }
+section.tc { border: 1px solid #334155; border-radius: 8px; margin: 1rem 0; padding: .5rem 1rem; }
+.PASSED { color: #4ade80; } .FAILED { color: #f87171; } .BLOCKED { color: #facc15; }
+pre { white-space: pre-wrap; background: #1e293b; padding: .6rem; border-radius: 6px; }
+.strip { font-family: monospace; letter-spacing: 2px; }
+"""
+
+
+def _digest(*parts) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _empty_state() -> dict:
+    return {"version": _STATE_VERSION, "offset": 0, "tcs": {}, "runs": {}, "sections": {}, "pages": {}}
+
+
+def load_state(path: Path = STATE_PATH) -> dict:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return _empty_state()
+    return state if state.get("version") == _STATE_VERSION else _empty_state()
+
+
+def read_new_rows(state: dict, runs_path: Path = RUNS_PATH) -> int:
+    """Fold rows appended since ``state["offset"]`` into ``state``; returns how many."""
+    try:
+        size = runs_path.stat().st_size
+    except FileNotFoundError:
+        return 0
+    if size < state["offset"]:
+        state.clear()
+        state.update(_empty_state())  # The history was reset; start over.
+
+    count = 0
+    with open(runs_path, "rb") as source:
+        source.seek(state["offset"])
+        for line in source:
+            if not line.endswith(b"\n"):
+                break  # An append still in progress; pick it up next time.
+            state["offset"] += len(line)
+            try:
+                row = ResultRow.from_json(json.loads(line))
+            except (json.JSONDecodeError, TypeError):
+                continue
+            tc = state["tcs"].setdefault(row.tc_id, {"latest": {}, "recent": [], "failing_since": ""})
+            if row.passed:
+                tc["failing_since"] = ""
+            elif not tc["failing_since"]:
+                tc["failing_since"] = row.run_id
+            tc["latest"] = {
+                "run_id": row.run_id, "title": row.title, "status": row.status,
+                "error": row.error, "duration_s": row.duration_s, "started": row.started,
+            }
+            tc["recent"] = (tc["recent"] + [row.status])[-RECENT_RUNS:]
+            run = state["runs"].setdefault(row.run_id, {"started": row.started, "passed": 0, "failed": []})
+            if row.passed:
+                run["passed"] += 1
+            else:
+                run["failed"].append(row.tc_id)
+            count += 1
+    return count
+
+
+def _flips(statuses: list[str]) -> int:
+    return sum(a != b for a, b in zip(statuses, statuses[1:]))
+
+
+def _strip(statuses: list[str]) -> str:
+    return "".join(_MARK.get(status, "⚠️") for status in statuses)
+
+
+# -- sections -----------------------------------------------------------------
+
+
+def _analysis(tc: dict) -> str:
+    latest, recent = tc["latest"], tc["recent"]
+    passed = recent.count("PASSED")
+    parts = [f"{passed}/{len(recent)} of the last runs passed", f"last run took {latest['duration_s']:.1f}s"]
+    if tc["failing_since"] and tc["failing_since"] != latest["run_id"]:
+        parts.append(f"failing since run {tc['failing_since']}")
+    if _flips(recent) >= FLIP_THRESHOLD:
+        parts.append(f"outcome changed {_flips(recent)} times, likely flaky")
+    return "; ".join(parts)
+
+
+def _render_md(tc_id: str, tc: dict, code_link: str) -> str:
+    latest = tc["latest"]
+    lines = [f"#### Test {tc_id} {latest['title']}"]
+    if code_link:
+        lines.append(f"- **Test Code:** [{Path(code_link).name}]({code_link})")
+    if latest["error"]:
+        lines.append(f"- **Test Error:** {latest['error']}")
+    status = {"PASSED": "✅ Passed", "FAILED": "❌ Failed"}.get(latest["status"], f"⚠️ {latest['status'].title()}")
+    lines.append(f"- **Status:** {status}")
+    lines.append(f"- **Recent Runs:** {_strip(tc['recent'])}")
+    lines.append(f"- **Analysis / Findings:** {_analysis(tc)}.")
+    return "\n".join(lines) + "\n---\n"
+
+
+def _render_html(tc_id: str, tc: dict, code_link: str) -> str:
+    latest = tc["latest"]
+    status = html.escape(latest["status"])
+    title = html.escape(latest["title"])
+    parts = [
+        f'<section class="tc" id="{tc_id}"><h3><span class="{status}">{status}</span> {title}</h3>',
+        f'<p class="strip">{_strip(tc["recent"])}</p>',
+        f"<p>{html.escape(_analysis(tc))}.</p>",
+    ]
+    if code_link:
+        parts.append(f'<p><a href="{html.escape(code_link)}">{html.escape(Path(code_link).name)}</a></p>')
+    if latest["error"]:
+        parts.append(f"<pre>{html.escape(latest['error'])}</pre>")
+    parts.append("</section>")
+    return "\n".join(parts) + "\n"
+
+
+def _link(script: Path | None, from_dir: Path) -> str:
+    return Path(os.path.relpath(script, from_dir)).as_posix() if script else ""
+
+
+def render_sections(state: dict, md_dir: Path, html_dir: Path) -> int:
+    """Re-render the sections whose inputs changed; returns how many."""
+    scripts = {path.name.split("_", 1)[0]: path for path in discover()}
+    rendered = 0
+    for tc_id, tc in sorted(state["tcs"].items()):
+        md_link = _link(scripts.get(tc_id), md_dir)
+        html_link = _link(scripts.get(tc_id), html_dir)
+        key = _digest(tc, md_link, html_link)
+        cached = state["sections"].get(tc_id)
+        if cached and cached["key"] == key:
+            continue
+        state["sections"][tc_id] = {
+            "key": key,
+            "md": _render_md(tc_id, tc, md_link),
+            "html": _render_html(tc_id, tc, html_link),
+        }
+        rendered += 1
+    return rendered
+
+
+# -- summary ------------------------------------------------------------------
+
+
+def _coverage(state: dict) -> list[tuple[str, int, int, int]]:
+    categories = {case.tc_id: case.category or "uncategorized" for case in load_plan()}
+    totals: Counter = Counter()
+    passed: Counter = Counter()
+    for tc_id, tc in state["tcs"].items():
+        category = categories.get(tc_id, "uncategorized")
+        totals[category] += 1
+        passed[category] += tc["latest"]["status"] == "PASSED"
+    return [(name, totals[name], passed[name], totals[name] - passed[name]) for name in sorted(totals)]
+
+
+def _risks(state: dict) -> list[str]:
+    risks = []
+    for tc_id, tc in sorted(state["tcs"].items()):
+        recent, title = tc["recent"], tc["latest"]["title"]
+        if _flips(recent) >= FLIP_THRESHOLD:
+            risks.append(f"{title}: flips between outcomes ({_strip(recent)}).")
+        elif len(recent) >= 3 and "PASSED" not in recent[-3:]:
+            risks.append(f"{title}: has not passed in its last {len(recent) - _last_pass(recent)} runs.")
+    return risks
+
+
+def _last_pass(statuses: list[str]) -> int:
+    for index in range(len(statuses) - 1, -1, -1):
+        if statuses[index] == "PASSED":
+            return index + 1
+    return 0
+
+
+def _project_name() -> str:
+    return load_config().get("executionArgs", {}).get("projectName") or TESTS_DIR.parent.name
+
+
+def render_markdown(state: dict) -> str:
+    tcs = state["tcs"]
+    passed = sum(tc["latest"]["status"] == "PASSED" for tc in tcs.values())
+    rate = 100 * passed / len(tcs) if tcs else 0.0
+    out = [
+        "\n# TestSprite AI Testing Report(MCP)\n\n---\n",
+        "## 1️⃣ Document Metadata",
+        f"- **Project Name:** {_project_name()}",
+        f"- **Date:** {date.today().isoformat()}",
+        "- **Prepared by:** harness.report\n\n---\n",
+        "## 2️⃣ Requirement Validation Summary\n",
+    ]
+    out.extend(state["sections"][tc_id]["md"] for tc_id in sorted(tcs))
+    out.append("\n## 3️⃣ Coverage & Matching Metrics\n")
+    out.append(f"- **{rate:.2f}** of tests passed\n")
+    out.append("| Requirement        | Total Tests | ✅ Passed | ❌ Failed  |")
+    out.append("|--------------------|-------------|-----------|------------|")
+    for name, total, ok, failed in _coverage(state):
+        out.append(f"| {name:<18} | {total:<11} | {ok:<9} | {failed:<10} |")
+    out.append("---\n\n\n## 4️⃣ Key Gaps / Risks")
+    out.extend(f"- {risk}" for risk in _risks(state) or ["No persistent or flipping failures."])
+    out.append("---\n")
+    return "\n".join(out)
+
+
+def _page(title: str, body: str) -> str:
+    return (
+        f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8" />\n'
+        f"<title>{html.escape(title)}</title>\n<style>{_CSS}</style>\n</head>\n<body>\n{body}</body>\n</html>\n"
+    )
+
+
+def _page_count(state: dict) -> int:
+    return max(1, -(-len(state["runs"]) // RUNS_PER_PAGE))
+
+
+def render_html(state: dict) -> str:
+    tcs = state["tcs"]
+    passed = sum(tc["latest"]["status"] == "PASSED" for tc in tcs.values())
+    rows = "".join(
+        f"<tr><td>{html.escape(name)}</td><td>{total}</td><td>{ok}</td><td>{failed}</td></tr>"
+        for name, total, ok, failed in _coverage(state)
+    )
+    risks = "".join(f"<li>{html.escape(risk)}</li>" for risk in _risks(state)) or "<li>None.</li>"
+    body = (
+        f"<h1>{html.escape(_project_name())} test report</h1>\n"
+        f"<p>{date.today().isoformat()} &middot; {passed}/{len(tcs)} passed &middot; "
+        f'<a href="history-{_page_count(state)}.html">run history</a></p>\n'
+        "<h2>Coverage</h2>\n<table><tr><th>Requirement</th><th>Total</th><th>Passed</th>"
+        f"<th>Failed</th></tr>{rows}</table>\n"
+        f"<h2>Key gaps / risks</h2>\n<ul>{risks}</ul>\n<h2>Tests</h2>\n"
+        + "".join(state["sections"][tc_id]["html"] for tc_id in sorted(tcs))
+    )
+    return _page("Test report", body)
+
+
+def _page_runs(state: dict, number: int) -> list:
+    return list(state["runs"].items())[(number - 1) * RUNS_PER_PAGE:number * RUNS_PER_PAGE]
+
+
+def render_history_page(state: dict, number: int) -> str:
+    """History page ``number``; it depends only on its own runs, so a full page is final."""
+    run_items = _page_runs(state, number)
+    rows = "".join(
+        f"<tr><td>{html.escape(run_id)}</td><td>{html.escape(run['started'])}</td>"
+        f"<td>{run['passed']}</td><td>{len(run['failed'])}</td>"
+        f"<td>{html.escape(' '.join(sorted(run['failed'])))}</td></tr>"
+        for run_id, run in reversed(run_items)
+    )
+    links = ['<a href="index.html">report</a>']
+    if number > 1:
+        links.append(f'<a href="history-{number - 1}.html">older</a>')
+    # The next page exists as soon as one more run is recorded.
+    if len(run_items) == RUNS_PER_PAGE:
+        links.append(f'<a href="history-{number + 1}.html">newer</a>')
+    body = (
+        f"<h1>Run history, page {number}</h1>\n<p>{' &middot; '.join(links)}</p>\n"
+        "<table><tr><th>Run</th><th>Started</th><th>Passed</th><th>Failed</th><th>Failing TCs</th></tr>"
+        f"{rows}</table>\n"
+    )
+    return _page(f"Run history {number}", body)
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
+def build_report(
+    runs_path: Path = RUNS_PATH,
+    out_dir: Path = REPORT_DIR,
+    md_path: Path | None = None,
+    rebuild: bool = False,
+) -> dict:
+    """Update the reports under ``out_dir``; returns counts of what was redone."""
+    state_path = out_dir / STATE_PATH.name
+    state = _empty_state() if rebuild else load_state(state_path)
+    md_path = out_dir / "raw_report.md" if md_path is None else md_path
+    new_rows = read_new_rows(state, runs_path)
+    sections = render_sections(state, md_path.parent, out_dir)
+
+    pages = _page_count(state)
+    pages_written = 0
+    for number in range(1, pages + 1):
+        key = _digest(_page_runs(state, number))
+        if state["pages"].get(str(number)) == key and (out_dir / f"history-{number}.html").exists():
+            continue
+        _write_if_changed(out_dir / f"history-{number}.html", render_history_page(state, number))
+        state["pages"][str(number)] = key
+        pages_written += 1
+
+    _write_if_changed(md_path, render_markdown(state))
+    _write_if_changed(out_dir / "index.html", render_html(state))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    write_json(state_path, state)
+    return {"rows": new_rows, "sections": sections, "pages": pages_written}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.report", description=__doc__)
+    parser.add_argument("--out", type=Path, default=REPORT_DIR, help="report directory")
+    parser.add_argument("--md", type=Path, help="raw_report.md path (default: <out>/raw_report.md)")
+    parser.add_argument("--rebuild", action="store_true", help="re-read the whole history")
+    args = parser.parse_args(argv)
+
+    counts = build_report(out_dir=args.out, md_path=args.md, rebuild=args.rebuild)
+    print(
+        f"{counts['rows']} new rows, {counts['sections']} sections and "
+        f"{counts['pages']} history pages re-rendered in {args.out}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""Read and update ``tmp/test_results.json`` and the per-TC duration history."""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .config import RESULTS_PATH, TMP_DIR
+
+DURATIONS_PATH = TMP_DIR / "durations.json"
+# Weight of the newest run in the duration moving average.
+DURATION_SMOOTHING = 0.5
+
+
+def timestamp() -> str:
+    """UTC time in the ``2026-01-13T09:31:38.942Z`` form TestSprite writes."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def new_run_id() -> str:
+    """Sortable, filename-safe id for one suite run, e.g. ``20260113T093138Z``."""
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def tc_id_of(title: str) -> str:
+    """``"TC001-Validate ..."`` -> ``"TC001"``."""
+    return title.split("-", 1)[0]
+
+
+def write_json(path: Path, data) -> None:
+    # Write-then-rename so a crashed run never leaves a truncated file behind.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_results(path: Path = RESULTS_PATH) -> list[dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+
+
+def last_statuses(path: Path = RESULTS_PATH) -> dict[str, str]:
+    """``testStatus`` per TC id from the last results, e.g. ``{"TC003": "FAILED"}``."""
+    return {tc_id_of(entry["title"]): entry.get("testStatus", "") for entry in load_results(path)}
+
+
+def merge_results(
+    results,
+    sources: dict[str, str],
+    path: Path = RESULTS_PATH,
+    modified: dict[str, str] | None = None,
+) -> list[dict]:
+    """Fold harness ``CaseResult``s into the TestSprite results array.
+
+    Existing entries keep their ids, description and ``created`` time; status,
+    error, code and ``modified`` are refreshed. TCs with no entry yet get a new
+    one. ``sources`` maps TC id to the script source stored under ``code``.
+    ``modified`` maps TC id to the time its result was recorded, for results
+    that are not from the current run; the others are stamped with now.
+    """
+    entries = load_results(path)
+    by_id = {tc_id_of(entry["title"]): entry for entry in entries}
+    now = timestamp()
+    modified = modified or {}
+
+    for result in results:
+        recorded = modified.get(result.tc_id) or now
+        entry = by_id.get(result.tc_id)
+        if entry is None:
+            entry = {
+                "title": result.title,
+                "description": "",
+                "testType": "FRONTEND",
+                "createFrom": "harness",
+                "created": recorded,
+            }
+            entries.append(entry)
+            by_id[result.tc_id] = entry
+        entry["code"] = sources.get(result.tc_id, entry.get("code", ""))
+        entry["testStatus"] = result.status
+        entry["testError"] = result.error
+        entry["modified"] = recorded
+
+    entries.sort(key=lambda entry: entry["title"])
+    write_json(path, entries)
+    return entries
+
+
+def load_durations(path: Path = DURATIONS_PATH) -> dict[str, float]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def record_durations(results, path: Path = DURATIONS_PATH) -> dict[str, float]:
+    """Update the smoothed per-TC wall-clock history used to balance shards."""
+    durations = load_durations(path)
+    for result in results:
+        previous = durations.get(result.tc_id)
+        if previous is None:
+            durations[result.tc_id] = round(result.duration_s, 3)
+        else:
+            smoothed = DURATION_SMOOTHING * result.duration_s + (1 - DURATION_SMOOTHING) * previous
+            durations[result.tc_id] = round(smoothed, 3)
+    write_json(path, dict(sorted(durations.items())))
+    return durations
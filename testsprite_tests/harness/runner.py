@@ -0,0 +1,89 @@
+"""Shard the TC scripts across worker processes and merge their results.
+
+Each worker process owns one :class:`~harness.session.SuiteSession` (one
+Chromium) and runs its shard with up to ``concurrency`` tests in flight.
+Shards are balanced on the historical wall-clock of each TC from
+``tmp/durations.json``, using the longest-first greedy assignment; TCs with
+no history are assumed to take the median of the known ones. Within a shard,
+TCs keep the order they were given in, so ``--failed-first`` holds per worker.
+"""
+
+import asyncio
+import heapq
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing import get_context
+
+from .loader import discover, load_cases
+from .results import load_durations
+from .session import CaseResult, FailureBudget, run_concurrent
+
+# Assumed duration for a TC when there is no history at all.
+DEFAULT_DURATION_S = 60.0
+
+
+def plan_shards(tc_ids: list[str], workers: int, durations: dict[str, float]) -> list[list[str]]:
+    """Split ``tc_ids`` into at most ``workers`` shards of similar total duration.
+
+    Each shard lists its TCs in their order in ``tc_ids``.
+    """
+    known = [durations[tc] for tc in tc_ids if tc in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION_S
+    cost = {tc: durations.get(tc, fallback) for tc in tc_ids}
+
+    workers = max(1, min(workers, len(tc_ids)))
+    heap = [(0.0, shard) for shard in range(workers)]
+    shards: list[list[str]] = [[] for _ in range(workers)]
+    for tc in sorted(tc_ids, key=lambda tc: (-cost[tc], tc)):
+        total, shard = heapq.heappop(heap)
+        shards[shard].append(tc)
+        heapq.heappush(heap, (total + cost[tc], shard))
+    position = {tc: index for index, tc in enumerate(tc_ids)}
+    return [sorted(shard, key=position.__getitem__) for shard in shards if shard]
+
+
+def _run_shard(
+    tc_ids: list[str], concurrency: int, session_options: dict, budget: FailureBudget | None = None
+) -> list[CaseResult]:
+    """Worker-process entry point."""
+    by_id = {case.tc_id: case for case in load_cases(only=tc_ids)}
+    cases = [by_id[tc_id] for tc_id in tc_ids if tc_id in by_id]
+    return asyncio.run(run_concurrent(cases, concurrency, budget=budget, **session_options))
+
+
+def run_sharded(
+    tc_ids: list[str],
+    workers: int,
+    concurrency: int = 1,
+    max_failures: int | None = None,
+    **session_options,
+) -> list[CaseResult]:
+    """Run ``tc_ids`` over ``workers`` processes; results come back in TC order.
+
+    With ``max_failures``, no further TC starts in any worker once that many
+    have failed; TCs that never started have no result.
+    """
+    shards = plan_shards(tc_ids, workers, load_durations())
+    if len(shards) == 1:
+        budget = FailureBudget(max_failures) if max_failures is not None else None
+        return _run_shard(shards[0], concurrency, session_options, budget)
+
+    # "spawn" keeps each worker free of the parent's event loop and driver.
+    context = get_context("spawn")
+    with ExitStack() as stack:
+        budget = None
+        if max_failures is not None:
+            manager = stack.enter_context(context.Manager())
+            budget = FailureBudget(max_failures, manager.Value("i", 0), manager.Lock())
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=len(shards), mp_context=context))
+        futures = [
+            pool.submit(_run_shard, shard, concurrency, session_options, budget) for shard in shards
+        ]
+        results = [result for future in futures for result in future.result()]
+    return sorted(results, key=lambda result: result.tc_id)
+
+
+def sources_for(tc_ids: list[str]) -> dict[str, str]:
+    """Script source per TC id, as stored in the results ``code`` field."""
+    return {path.name.split("_", 1)[0]: path.read_text(encoding="utf-8") for path in discover(only=tc_ids)}
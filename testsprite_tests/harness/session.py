@@ -0,0 +1,323 @@
+"""Suite-level browser session shared by every TC script.
+
+The generated scripts each start Playwright, launch Chromium, open a context
+and tear all of it down again. ``SuiteSession`` launches Chromium once and
+binds a stand-in for ``playwright.async_api`` into each script's module, so
+the unchanged ``run_test()`` bodies receive:
+
+* ``async_playwright().start()`` / ``pw.stop()`` - no-ops on the shared driver;
+* ``pw.chromium.launch(...)`` - a handle on the already running browser;
+* ``browser.new_context()`` - a brand-new ``BrowserContext``, which has its own
+  cookies, storage and cache, so tests stay isolated from each other, and
+  whose ``close()`` first lets the hooks flush their artifacts;
+* ``browser.close()`` - closes only the contexts that test opened.
+"""
+
+import asyncio
+import time
+import traceback
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+from .artifacts import ArtifactFlush
+from .hooks import ContextHook, HookFactory
+from .loader import TestCase
+from .profiles import launch_options
+from .results import timestamp
+from .waits import SmartWaits
+
+
+@dataclass
+class CaseResult:
+    tc_id: str
+    title: str
+    status: str
+    error: str = ""
+    duration_s: float = 0.0
+    waits: int = 0
+    wait_budget_s: float = 0.0
+    waited_s: float = 0.0
+    artifacts: str = ""
+    started: str = field(default_factory=timestamp)
+    attempts: int = 1
+    # Failed at first, then passed when retried in a fresh context.
+    flaky: bool = False
+    # Main-thread cost, from MainThreadMonitor.
+    tbt_ms: float = 0.0
+    long_tasks: int = 0
+    worst_inp_ms: float = 0.0
+    worst_input: str = ""
+    cls: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        return self.status == "PASSED"
+
+
+class _BoundBrowser:
+    """What a script sees as ``browser``: the shared one, scoped to this test."""
+
+    def __init__(self, session: "SuiteSession", hooks: list[ContextHook]):
+        self._session = session
+        self._hooks = hooks
+        self._contexts: list[async_api.BrowserContext] = []
+
+    @property
+    def contexts(self) -> list[async_api.BrowserContext]:
+        return list(self._contexts)
+
+    async def new_context(self, **kwargs) -> async_api.BrowserContext:
+        context = await self._session.new_context(**kwargs)
+        self._contexts.append(context)
+        for hook in self._hooks:
+            await hook.on_context(context)
+
+        close = context.close
+        hooks = self._hooks
+        closed = False
+
+        async def close_after_hooks(*args, **kwargs) -> None:
+            nonlocal closed
+            if not closed:
+                closed = True
+                for hook in hooks:
+                    await hook.before_close(context)
+            await close(*args, **kwargs)
+
+        context.close = close_after_hooks
+        return context
+
+    async def new_page(self, **kwargs) -> async_api.Page:
+        context = await self.new_context(**kwargs)
+        return await context.new_page()
+
+    async def close(self) -> None:
+        # Contexts the script already closed are tolerated by Playwright.
+        for context in self._contexts:
+            await context.close()
+        self._contexts.clear()
+
+    def __getattr__(self, name):
+        return getattr(self._session.browser, name)
+
+
+class _BoundBrowserType:
+    def __init__(self, session: "SuiteSession", hooks: list[ContextHook]):
+        self._session = session
+        self._hooks = hooks
+
+    async def launch(self, **_script_options) -> _BoundBrowser:
+        # The script's own launch options are ignored; the suite owns the browser.
+        return _BoundBrowser(self._session, self._hooks)
+
+
+class _BoundPlaywright:
+    """What a script sees as ``pw``; ``start``/``stop`` never touch the driver."""
+
+    def __init__(self, session: "SuiteSession", hooks: list[ContextHook]):
+        self._session = session
+        self.chromium = _BoundBrowserType(session, hooks)
+
+    async def start(self) -> "_BoundPlaywright":
+        return self
+
+    async def stop(self) -> None:
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._session.playwright, name)
+
+
+class _AsyncApiProxy:
+    """Replaces the ``async_api`` global of a loaded TC module."""
+
+    def __init__(self, session: "SuiteSession", hooks: list[ContextHook]):
+        self._session = session
+        self._hooks = hooks
+
+    def async_playwright(self) -> _BoundPlaywright:
+        return _BoundPlaywright(self._session, self._hooks)
+
+    def __getattr__(self, name):
+        return getattr(async_api, name)
+
+
+class SuiteSession:
+    """Owns the Playwright driver and one Chromium for a whole suite run.
+
+    Use as ``async with SuiteSession() as session:`` and call
+    :meth:`run_case` for each loaded :class:`TestCase`. Chromium is launched
+    with the :mod:`~harness.profiles` launch profile ``profile``; every
+    context starts from ``storage_state`` when one is given.
+
+    ``hook_factories`` build the :class:`~harness.hooks.ContextHook` instances
+    given to each test; by default the fixed sleeps are replaced with
+    :class:`SmartWaits` and failing tests leave their artifacts behind via
+    :class:`ArtifactFlush`.
+
+    A failing case is run again up to ``retries`` times. Each retry is a new
+    run of the script, so it gets new contexts and new hooks.
+    """
+
+    def __init__(
+        self,
+        profile: str | None = None,
+        headless: bool | None = None,
+        hook_factories: list[HookFactory] | None = None,
+        storage_state: dict | str | None = None,
+        retries: int = 0,
+    ):
+        self.launch_options = launch_options(profile)
+        if headless is not None:
+            self.launch_options["headless"] = headless
+        self.storage_state = storage_state
+        self.retries = retries
+        if hook_factories is None:
+            hook_factories = [SmartWaits, ArtifactFlush]
+        self.hook_factories = list(hook_factories)
+        self.playwright: async_api.Playwright | None = None
+        self.browser: async_api.Browser | None = None
+
+    async def __aenter__(self) -> "SuiteSession":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        self.playwright = await async_api.async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(**self.launch_options)
+
+    async def stop(self) -> None:
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def new_context(self, **kwargs) -> async_api.BrowserContext:
+        """A fresh, isolated context on the shared browser.
+
+        Unless the caller passes its own, the context starts from the
+        session's ``storage_state`` (see :mod:`harness.fixtures`).
+        """
+        if self.browser is None:
+            raise RuntimeError("SuiteSession is not started")
+        if self.storage_state is not None:
+            kwargs.setdefault("storage_state", self.storage_state)
+        return await self.browser.new_context(**kwargs)
+
+    def bind(self, case: TestCase, hooks: list[ContextHook] | None = None) -> None:
+        """Point the script's ``async_api`` global at this session."""
+        case.module.async_api = _AsyncApiProxy(self, [] if hooks is None else hooks)
+
+    async def run_case(self, case: TestCase, extra_hooks: list[ContextHook] | None = None) -> CaseResult:
+        """Run one script, retrying on failure; ``extra_hooks`` apply to this case only.
+
+        The result is that of the last attempt. Its duration covers all of them.
+        """
+        result = await self._attempt(case, extra_hooks, 1)
+        while not result.passed and result.attempts <= self.retries:
+            retry = await self._attempt(case, extra_hooks, result.attempts + 1)
+            retry.duration_s += result.duration_s
+            retry.started = result.started
+            retry.flaky = retry.passed
+            result = retry
+        return result
+
+    async def _attempt(
+        self, case: TestCase, extra_hooks: list[ContextHook] | None, attempt: int
+    ) -> CaseResult:
+        hooks = [factory() for factory in self.hook_factories] + list(extra_hooks or [])
+        for hook in hooks:
+            hook.attempt = attempt
+            hook.start(case)
+        self.bind(case, hooks)
+        result = CaseResult(tc_id=case.tc_id, title=case.result_title, status="PASSED", attempts=attempt)
+        start = time.perf_counter()
+        try:
+            await case.run_test()
+        except Exception as exc:
+            result.status = "FAILED"
+            result.error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+        result.duration_s = time.perf_counter() - start
+        for hook in hooks:
+            hook.finish(result)
+        return result
+
+
+class FailureBudget:
+    """Stop starting tests once ``limit`` of them have failed.
+
+    Within one process the count is a plain integer. Worker processes share
+    one budget through a ``multiprocessing.Manager`` value and lock, passed as
+    ``counter`` and ``lock``.
+    """
+
+    def __init__(self, limit: int, counter=None, lock=None):
+        self.limit = limit
+        self._counter = counter
+        self._lock = lock
+        self._spent = 0
+
+    @property
+    def spent(self) -> int:
+        return self._counter.value if self._counter is not None else self._spent
+
+    @property
+    def exhausted(self) -> bool:
+        return self.spent >= self.limit
+
+    def charge(self, result: CaseResult) -> None:
+        if result.passed:
+            return
+        if self._counter is None:
+            self._spent += 1
+            return
+        with self._lock:
+            self._counter.value += 1
+
+
+async def run_sequential(
+    cases: list[TestCase], budget: FailureBudget | None = None, **session_options
+) -> list[CaseResult]:
+    """Run ``cases`` one after another over a single shared browser."""
+    async with SuiteSession(**session_options) as session:
+        results = []
+        for case in cases:
+            if budget is not None and budget.exhausted:
+                break
+            result = await session.run_case(case)
+            if budget is not None:
+                budget.charge(result)
+            results.append(result)
+        return results
+
+
+async def run_concurrent(
+    cases: list[TestCase], concurrency: int, budget: FailureBudget | None = None, **session_options
+) -> list[CaseResult]:
+    """Run up to ``concurrency`` cases at once, each in its own context, on one browser.
+
+    Cases start in the order given, and results are returned in that order.
+    Once ``budget`` is exhausted no further case starts; those already
+    running finish, and the cases never started have no result.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async with SuiteSession(**session_options) as session:
+
+        async def run_one(case: TestCase) -> CaseResult | None:
+            async with semaphore:
+                if budget is not None and budget.exhausted:
+                    return None
+                result = await session.run_case(case)
+                if budget is not None:
+                    budget.charge(result)
+                return result
+
+        results = await asyncio.gather(*(run_one(case) for case in cases))
+        return [result for result in results if result is not None]
@@ -0,0 +1,210 @@
+"""Set Radix sliders to an exact value instead of clicking the thumb and hoping.
+
+TC001, TC002 and TC007 click a slider thumb over and over, three seconds
+apart, and never reach the value they are after. The report puts this down to
+"Radix UI Slider drag". :func:`set_slider` reads the thumb's
+``aria-valuemin``, ``aria-valuemax`` and ``aria-valuenow``, works out the
+input that lands exactly on the target, and returns once the thumb reports
+that value.
+
+* With the slider's ``step`` known, the input is a key sequence. Radix
+  snaps Home/End to the bounds, moves PageUp/PageDown by ten steps and
+  ArrowUp/ArrowDown by one, in either orientation or direction.
+  :func:`key_plan` picks the shortest sequence. The keys are dispatched on
+  the thumb inside the page, and the resulting ``aria-valuenow`` comes back
+  in the same round trip.
+* Without a step, the thumb is dragged from its centre to the point on the
+  slider that maps to the target. Radix maps pointer positions linearly over
+  the slider root, then snaps to the step, so a target on the step grid is
+  reached exactly.
+
+Both paths take milliseconds. A value that does not stick raises
+:class:`SliderMismatch` with the value the thumb reports.
+
+Values are compared as numbers with a tolerance, :func:`same_value`, never
+as exact floats or ``aria-valuenow`` strings. A tool that scales its state
+for display reports float artefacts: GlassTool renders
+``value={[config.transparency * 100]}``, so 57 comes back as
+``56.99999999999999``.
+"""
+
+import math
+from dataclasses import dataclass
+
+from playwright import async_api
+
+# Radix moves PageUp/PageDown (and Shift+Arrow) ten steps at a time.
+PAGE_STEPS = 10
+# If a re-render lags behind the in-page check, poll this long before failing.
+SETTLE_TIMEOUT_MS = 1000
+# Relative tolerance of same_value(): far above float noise, far below any step.
+VALUE_RTOL = 1e-9
+
+_READ_JS = """thumb => {
+    // Radix renders Root > span (thumb wrapper) > Thumb; pointer values map over Root.
+    const root = thumb.parentElement.parentElement.getBoundingClientRect();
+    const box = thumb.getBoundingClientRect();
+    return {
+        min: Number(thumb.getAttribute("aria-valuemin")),
+        max: Number(thumb.getAttribute("aria-valuemax")),
+        now: Number(thumb.getAttribute("aria-valuenow")),
+        vertical: thumb.getAttribute("aria-orientation") === "vertical",
+        rtl: getComputedStyle(thumb).direction === "rtl",
+        disabled: thumb.hasAttribute("data-disabled"),
+        root: {x: root.x, y: root.y, width: root.width, height: root.height},
+        thumb: {x: box.x + box.width / 2, y: box.y + box.height / 2},
+    };
+}"""
+
+# Each key waits a macrotask, so React has re-rendered before the next one
+# reads the slider's value.
+_PRESS_JS = """async (thumb, keys) => {
+    thumb.focus();
+    for (const key of keys) {
+        thumb.dispatchEvent(new KeyboardEvent("keydown", {key, bubbles: true, cancelable: true}));
+        await new Promise(resolve => setTimeout(resolve, 0));
+    }
+    return Number(thumb.getAttribute("aria-valuenow"));
+}"""
+
+
+# Polls the thumb in the page until it reports the target, or the timeout passes.
+_WAIT_JS = """async (thumb, [target, tolerance, timeoutMs]) => {
+    const deadline = performance.now() + timeoutMs;
+    for (;;) {
+        const now = Number(thumb.getAttribute("aria-valuenow"));
+        if (Math.abs(now - target) <= tolerance || performance.now() > deadline) return now;
+        await new Promise(resolve => setTimeout(resolve, 16));
+    }
+}"""
+
+
+class SliderMismatch(AssertionError):
+    """A slider did not end up at the requested value."""
+
+
+@dataclass
+class SliderState:
+    min: float
+    max: float
+    now: float
+    vertical: bool = False
+    rtl: bool = False
+    disabled: bool = False
+    root: dict | None = None
+    thumb: dict | None = None
+
+    def point_for(self, value: float) -> tuple[float, float]:
+        """The viewport point that the slider maps to ``value``."""
+        fraction = (value - self.min) / (self.max - self.min)
+        box = self.root
+        if self.vertical:
+            # Vertical sliders grow upwards.
+            return box["x"] + box["width"] / 2, box["y"] + (1 - fraction) * box["height"]
+        if self.rtl:
+            fraction = 1 - fraction
+        return box["x"] + fraction * box["width"], box["y"] + box["height"] / 2
+
+
+async def read_slider(thumb: async_api.Locator) -> SliderState:
+    return SliderState(**await thumb.evaluate(_READ_JS))
+
+
+def _moves(steps: int) -> list[str]:
+    """Keys that move ``steps`` steps (negative: down), fewest keys first."""
+    up = steps > 0
+    pages, rest = divmod(abs(steps), PAGE_STEPS)
+    page, arrow = ("PageUp", "ArrowUp") if up else ("PageDown", "ArrowDown")
+    return [page] * pages + [arrow] * rest
+
+
+def key_plan(state: SliderState, target: float, step: float) -> list[str]:
+    """The shortest key sequence taking the slider from ``state.now`` to ``target``.
+
+    Candidates start from the current value, from Home (minimum) or from End
+    (maximum), and either step up to the target or overshoot by one page and
+    step back. A start off the step grid is skipped, as are overshoots past a
+    bound, because Radix snaps and clamps there.
+    """
+    def on_grid(value: float) -> bool:
+        steps = (value - state.min) / step
+        return abs(steps - round(steps)) < 1e-9
+
+    if not state.min <= target <= state.max:
+        raise ValueError(f"{target} is outside the slider's range {state.min}..{state.max}")
+    if not on_grid(target):
+        raise ValueError(f"{target} is not on the slider's step grid ({state.min} + k * {step})")
+
+    best: list[str] | None = None
+    for prefix, start in (([], state.now), (["Home"], state.min), (["End"], state.max)):
+        if not on_grid(start):
+            continue  # e.g. Blob size: max 400 is not 100 + k * 8, and steps from it snap.
+        steps = round((target - start) / step)
+        options = [prefix + _moves(steps)]
+        if steps % PAGE_STEPS:
+            direction = 1 if steps > 0 else -1
+            overshoot = direction * (abs(steps) // PAGE_STEPS + 1) * PAGE_STEPS
+            if state.min <= start + overshoot * step <= state.max:
+                back = overshoot - steps
+                options.append(prefix + _moves(overshoot) + _moves(-back))
+        for keys in options:
+            if best is None or len(keys) < len(best):
+                best = keys
+    return best
+
+
+def aria_value(value: float) -> str:
+    """``value`` as Radix writes it into ``aria-valuenow``, for messages."""
+    # Radix writes aria-valuenow as a JS number: 20, not 20.0.
+    return f"{value:g}"
+
+
+def _tolerance(target: float) -> float:
+    return VALUE_RTOL * max(1.0, abs(target))
+
+
+def same_value(now: float, target: float) -> bool:
+    """Whether a reported slider value is ``target``, allowing for float artefacts."""
+    return math.isclose(now, target, rel_tol=VALUE_RTOL, abs_tol=VALUE_RTOL)
+
+
+async def wait_for_value(
+    thumb: async_api.Locator, target: float, timeout_ms: float = SETTLE_TIMEOUT_MS
+) -> float:
+    """Wait until ``thumb`` reports ``target`` and return the value; SliderMismatch if it does not."""
+    now = await thumb.evaluate(_WAIT_JS, [target, _tolerance(target), timeout_ms])
+    if not same_value(now, target):
+        raise SliderMismatch(f"slider is at {aria_value(now)}, not {aria_value(target)}")
+    return now
+
+
+async def _drag_to(thumb: async_api.Locator, state: SliderState, target: float) -> None:
+    mouse = thumb.page.mouse
+    # Pressing on the thumb only focuses it; the move under pointer capture sets the value.
+    await mouse.move(state.thumb["x"], state.thumb["y"])
+    await mouse.down()
+    await mouse.move(*state.point_for(target))
+    await mouse.up()
+
+
+async def set_slider(
+    thumb: async_api.Locator, target: float, step: float | None = None
+) -> float:
+    """Move the Radix slider ``thumb`` to ``target`` and return the value it reports."""
+    state = await read_slider(thumb)
+    if state.disabled:
+        raise SliderMismatch(f"slider is disabled at {aria_value(state.now)}")
+    if same_value(state.now, target):
+        return state.now
+
+    if step is not None:
+        value = await thumb.evaluate(_PRESS_JS, key_plan(state, target, step))
+        if same_value(value, target):
+            return value
+    else:
+        if not state.min <= target <= state.max:
+            raise ValueError(f"{target} is outside the slider's range {state.min}..{state.max}")
+        await thumb.scroll_into_view_if_needed()
+        await _drag_to(thumb, await read_slider(thumb), target)
+
+    return await wait_for_value(thumb, target)
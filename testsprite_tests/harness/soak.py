@@ -0,0 +1,323 @@
+"""Soak a tool page with its own interactions and fail when memory keeps growing.
+
+A tool tab may stay open for hours while sliders are dragged non-stop. No
+TC runs long enough to show a leak, so this module repeats one page-object
+interaction per tool thousands of times in a single page. Every
+``--sample-every`` iterations it collects garbage and then records from CDP
+``Performance.getMetrics``:
+
+* ``JSHeapUsedSize``, the live JS heap;
+* ``Nodes``, DOM nodes, including detached ones still referenced;
+* ``JSEventListeners``.
+
+The first ``--warmup`` iterations are excluded, because caches, lazy chunks
+and the toast queue fill there. A least-squares line through the remaining
+samples gives growth per 1000 iterations. A tool fails when its heap or node
+slope exceeds :data:`HEAP_SLOPE_LIMIT_KIB` or :data:`NODE_SLOPE_LIMIT`.
+
+Two heap snapshots are taken for each tool: one after the warm-up and one at
+the end. Load both in DevTools (Memory, Load, then the Comparison view) to see
+what was retained. Only the worst offender's pair is kept, with its metrics,
+in ``tmp/soak/<run id>.json``.
+
+    python -m harness.soak --dist                    # every tool, 2000 iterations
+    python -m harness.soak -n 5000 gradient-text shadow
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from playwright import async_api
+
+from .config import TMP_DIR, local_endpoint
+from .pages import (
+    PAGES,
+    BlobPage,
+    ContrastPage,
+    GlassPage,
+    GradientTextPage,
+    GridPage,
+    MetaPage,
+    PalettePage,
+    PromptPage,
+    ShadowPage,
+    ToolPage,
+)
+from .profiles import profile_names
+from .results import new_run_id, timestamp
+from .session import SuiteSession
+from .static_server import serve_dist
+
+SOAK_DIR = TMP_DIR / "soak"
+# Retained growth allowed per 1000 iterations after the warm-up.
+HEAP_SLOPE_LIMIT_KIB = 256
+NODE_SLOPE_LIMIT = 10
+
+
+async def _glass(page: GlassPage, i: int) -> None:
+    await page.set_blur(4 if i % 2 else 20)
+    await page.set_transparency(30 if i % 2 else 70)
+
+
+async def _gradient_text(page: GradientTextPage, i: int) -> None:
+    await page.set_text(f"Soak iteration {i}")
+    await page.set_colors(*(("#ff0080", "#7928ca") if i % 2 else ("#00dfd8", "#007cf0")))
+
+
+async def _shadow(page: ShadowPage, i: int) -> None:
+    await page.set_slider("distance", 12 if i % 2 else 20)
+    await page.set_slider("blur", 30 if i % 2 else 60)
+    await page.set_pressed(i % 2 == 0)
+
+
+async def _blob(page: BlobPage, i: int) -> None:
+    await page.set_complexity(30 if i % 2 else 60)
+    await page.randomize()
+
+
+async def _palette(page: PalettePage, i: int) -> None:
+    await page.generate()
+
+
+async def _grid(page: GridPage, i: int) -> None:
+    await page.set_columns(3 if i % 2 else 6)
+    await page.set_gap(8 if i % 2 else 24)
+
+
+async def _contrast(page: ContrastPage, i: int) -> None:
+    await page.set_colors(*(("#000000", "#ffffff") if i % 2 else ("#767676", "#ffffff")))
+
+
+async def _meta(page: MetaPage, i: int) -> None:
+    await page.set_fields(title=f"Soak iteration {i}", description="Retained memory check " * (i % 5 + 1))
+
+
+async def _prompt(page: PromptPage, i: int) -> None:
+    await page.set_task(f"Summarise document {i}", context="Retained memory check " * (i % 5 + 1))
+
+
+# tool id -> one iteration of the soak loop.
+SCENARIOS: dict[str, Callable[[ToolPage, int], Awaitable[None]]] = {
+    "glass": _glass,
+    "gradient-text": _gradient_text,
+    "shadow": _shadow,
+    "blob": _blob,
+    "palette": _palette,
+    "grid": _grid,
+    "contrast": _contrast,
+    "meta": _meta,
+    "prompt": _prompt,
+}
+
+
+@dataclass
+class Sample:
+    iteration: int
+    heap_kib: float
+    nodes: int
+    listeners: int
+
+
+@dataclass
+class SoakResult:
+    tool_id: str
+    iterations: int
+    samples: list[Sample] = field(default_factory=list)
+    # Growth per 1000 iterations, fitted over the samples after the warm-up.
+    heap_slope_kib: float = 0.0
+    node_slope: float = 0.0
+    listener_slope: float = 0.0
+    snapshots: list[str] = field(default_factory=list)
+
+    @property
+    def leaking(self) -> bool:
+        return self.heap_slope_kib > HEAP_SLOPE_LIMIT_KIB or self.node_slope > NODE_SLOPE_LIMIT
+
+    @property
+    def severity(self) -> float:
+        """How far past its limits the worse of the two slopes is; above 1 is a leak."""
+        return max(self.heap_slope_kib / HEAP_SLOPE_LIMIT_KIB, self.node_slope / NODE_SLOPE_LIMIT)
+
+
+def slope(points: list[tuple[float, float]]) -> float:
+    """Least-squares slope of ``(x, y)`` points, 0 with fewer than two."""
+    if len(points) < 2:
+        return 0.0
+    xs, ys = zip(*points)
+    return statistics.linear_regression(xs, ys).slope
+
+
+async def _sample(cdp: async_api.CDPSession, iteration: int) -> Sample:
+    # Measure what is retained, not garbage that has yet to be collected.
+    await cdp.send("HeapProfiler.collectGarbage")
+    metrics = {m["name"]: m["value"] for m in (await cdp.send("Performance.getMetrics"))["metrics"]}
+    return Sample(
+        iteration=iteration,
+        heap_kib=round(metrics.get("JSHeapUsedSize", 0) / 1024, 1),
+        nodes=int(metrics.get("Nodes", 0)),
+        listeners=int(metrics.get("JSEventListeners", 0)),
+    )
+
+
+async def take_heap_snapshot(cdp: async_api.CDPSession, path: Path) -> str:
+    """Write a ``.heapsnapshot`` of the page behind ``cdp`` to ``path``."""
+    chunks: list[str] = []
+
+    def on_chunk(event: dict) -> None:
+        chunks.append(event["chunk"])
+
+    cdp.on("HeapProfiler.addHeapSnapshotChunk", on_chunk)
+    try:
+        # Every chunk has been emitted by the time the command returns.
+        await cdp.send("HeapProfiler.takeHeapSnapshot", {"reportProgress": False})
+    finally:
+        cdp.remove_listener("HeapProfiler.addHeapSnapshotChunk", on_chunk)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(chunks), encoding="utf-8")
+    return str(path)
+
+
+async def soak_tool(
+    session: SuiteSession,
+    tool_id: str,
+    iterations: int,
+    sample_every: int,
+    warmup: int,
+    snapshot_prefix: Path,
+    endpoint: str | None = None,
+) -> SoakResult:
+    """Run ``tool_id``'s scenario ``iterations`` times in one page and fit its growth."""
+    step = SCENARIOS[tool_id]
+    result = SoakResult(tool_id, iterations)
+    context = await session.new_context()
+    try:
+        tool = await PAGES[tool_id].open(context, endpoint)
+        await tool.page.wait_for_load_state("networkidle")
+        cdp = await context.new_cdp_session(tool.page)
+        await cdp.send("Performance.enable")
+        await cdp.send("HeapProfiler.enable")
+
+        for i in range(iterations + 1):
+            if i:
+                await step(tool, i)
+            if i == warmup:
+                result.snapshots.append(
+                    await take_heap_snapshot(cdp, Path(f"{snapshot_prefix}-{tool_id}-warm.heapsnapshot"))
+                )
+            if i % sample_every == 0 or i == iterations:
+                result.samples.append(await _sample(cdp, i))
+        result.snapshots.append(
+            await take_heap_snapshot(cdp, Path(f"{snapshot_prefix}-{tool_id}-end.heapsnapshot"))
+        )
+    finally:
+        await context.close()
+
+    steady = [sample for sample in result.samples if sample.iteration >= warmup]
+    for attribute, name in (
+        ("heap_kib", "heap_slope_kib"),
+        ("nodes", "node_slope"),
+        ("listeners", "listener_slope"),
+    ):
+        fitted = slope([(sample.iteration, getattr(sample, attribute)) for sample in steady])
+        setattr(result, name, round(fitted * 1000, 2))
+    return result
+
+
+async def soak(
+    tool_ids: list[str],
+    iterations: int = 2000,
+    sample_every: int = 50,
+    warmup: int = 100,
+    run_id: str | None = None,
+    **session_options,
+) -> list[SoakResult]:
+    """Soak each tool in a fresh context; keep the heap snapshots of the worst one only."""
+    run_id = run_id or new_run_id()
+    endpoint = local_endpoint()
+    session_options.setdefault("hook_factories", [])
+    results = []
+    async with SuiteSession(**session_options) as session:
+        for tool_id in tool_ids:
+            results.append(
+                await soak_tool(
+                    session, tool_id, iterations, sample_every, min(warmup, iterations),
+                    SOAK_DIR / run_id, endpoint,
+                )
+            )
+
+    worst = max(results, key=lambda result: result.severity, default=None)
+    for result in results:
+        if result is not worst:
+            for path in result.snapshots:
+                Path(path).unlink(missing_ok=True)
+            result.snapshots = []
+    return results
+
+
+def write_results(results: list[SoakResult], run_id: str) -> str:
+    SOAK_DIR.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "run_id": run_id,
+        "measured": timestamp(),
+        "limits": {"heap_slope_kib": HEAP_SLOPE_LIMIT_KIB, "node_slope": NODE_SLOPE_LIMIT},
+        "tools": [{**asdict(result), "leaking": result.leaking} for result in results],
+    }
+    path = SOAK_DIR / f"{run_id}.json"
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.soak", description=__doc__)
+    parser.add_argument("tools", nargs="*", metavar="TOOL", help=f"tool ids (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("-n", "--iterations", type=int, default=2000)
+    parser.add_argument("--sample-every", type=int, default=50, help="iterations between heap samples")
+    parser.add_argument("--warmup", type=int, default=100, help="iterations left out of the fit")
+    parser.add_argument("--profile", choices=profile_names(), help="Chromium launch profile")
+    parser.add_argument(
+        "--dist", action="store_true",
+        help="build dist/ if stale and serve it like nginx-spa.conf on the localEndpoint port",
+    )
+    args = parser.parse_args(argv)
+    unknown = [tool_id for tool_id in args.tools if tool_id not in SCENARIOS]
+    if unknown:
+        parser.error(f"no soak scenario for {', '.join(unknown)}")
+
+    run_id = new_run_id()
+    with serve_dist() if args.dist else nullcontext():
+        results = asyncio.run(
+            soak(
+                args.tools or list(SCENARIOS),
+                max(1, args.iterations),
+                max(1, args.sample_every),
+                max(0, args.warmup),
+                run_id,
+                profile=args.profile,
+            )
+        )
+    path = write_results(results, run_id)
+
+    print(f"{'tool':<16}{'heap KiB/1k':>13}{'nodes/1k':>10}{'listeners/1k':>14}  final heap")
+    for result in results:
+        print(
+            f"{result.tool_id:<16}{result.heap_slope_kib:>13.1f}{result.node_slope:>10.1f}"
+            f"{result.listener_slope:>14.1f}  {result.samples[-1].heap_kib / 1024:.1f} MiB"
+            + ("  LEAK" if result.leaking else "")
+        )
+    for result in results:
+        for snapshot in result.snapshots:
+            print(f"heap snapshot ({result.tool_id}): {snapshot}")
+    leaking = [result.tool_id for result in results if result.leaking]
+    print(f"\n{len(leaking)} of {len(results)} tools leaking: {path}")
+    return 1 if leaking else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
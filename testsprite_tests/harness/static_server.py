@@ -0,0 +1,183 @@
+"""Serve the production ``dist/`` build the way ``nginx-spa.conf`` does.
+
+The Vite dev server transforms modules on demand and ships none of the
+production chunking (``react-vendor``, ``ui-vendor``, ``utils-vendor``).
+:func:`serve_dist` builds once with :func:`~harness.build.build_dist` and serves
+``dist/`` from memory with the same behaviour as the nginx config:
+
+* ``try_files $uri $uri/ /index.html`` SPA fallback, but a real 404 for
+  ``robots.txt`` / ``sitemap.xml`` and for missing static assets (their
+  ``location`` block has no ``try_files``), and 403 for hidden files;
+* ``Cache-Control: public, immutable`` + one-year expiry on static assets,
+  ``no-store`` on HTML;
+* gzip for the same text types, and the same security headers.
+
+By default it listens on the port of ``localEndpoint``, so the scripts'
+hard-coded ``http://localhost:8080`` reach it. Stop the dev server first.
+
+    python -m harness.static_server          # build if needed, then serve
+    python -m harness --dist ...             # run the suite against it
+"""
+
+import argparse
+import gzip
+import mimetypes
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from .build import DIST_DIR, build_dist
+from .config import local_endpoint
+
+_ASSET = re.compile(r"\.(js|css|png|jpg|jpeg|gif|ico|svg|woff|woff2|ttf|eot|webp)$", re.IGNORECASE)
+_GZIP_TYPES = {
+    "text/plain",
+    "text/css",
+    "text/xml",
+    "text/javascript",
+    "application/javascript",
+    "application/x-javascript",
+    "application/xml",
+    "application/xml+rss",
+    "application/json",
+    "image/svg+xml",
+}
+_GZIP_MIN_LENGTH = 1024
+_NO_FALLBACK = {"/robots.txt", "/sitemap.xml"}
+
+SECURITY_HEADERS = {
+    "X-Frame-Options": "SAMEORIGIN",
+    "X-Content-Type-Options": "nosniff",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "no-referrer-when-downgrade",
+    "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
+    "Content-Security-Policy": (
+        "default-src 'self'; script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
+        "style-src 'self' 'unsafe-inline'; img-src 'self' data: https:; "
+        "font-src 'self' data:; connect-src 'self';"
+    ),
+}
+
+
+class _File:
+    __slots__ = ("body", "gzipped", "content_type", "cache_headers")
+
+    def __init__(self, path: Path):
+        self.body = path.read_bytes()
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        self.content_type = content_type
+        compressible = content_type in _GZIP_TYPES and len(self.body) >= _GZIP_MIN_LENGTH
+        self.gzipped = gzip.compress(self.body, compresslevel=6) if compressible else None
+        if _ASSET.search(path.name):
+            # nginx's "expires 1y" plus its explicit "public, immutable".
+            self.cache_headers = {"Cache-Control": "max-age=31536000, public, immutable"}
+        elif path.suffix == ".html":
+            self.cache_headers = {
+                "Cache-Control": "no-store, no-cache, must-revalidate, proxy-revalidate, max-age=0"
+            }
+        else:
+            self.cache_headers = {}
+
+
+def _load_site(root: Path) -> dict[str, _File]:
+    """Every file under ``root`` keyed by URL path, read into memory once."""
+    site = {}
+    for path in root.rglob("*"):
+        if path.is_file():
+            site["/" + path.relative_to(root).as_posix()] = _File(path)
+    return site
+
+
+def _make_handler(site: dict[str, _File]):
+    index = site.get("/index.html")
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _resolve(self, url_path: str) -> tuple[HTTPStatus, _File | None]:
+            if any(part.startswith(".") for part in url_path.split("/") if part):
+                return HTTPStatus.FORBIDDEN, None
+            if url_path in site:
+                return HTTPStatus.OK, site[url_path]
+            directory_index = url_path.rstrip("/") + "/index.html"
+            if directory_index in site:
+                return HTTPStatus.OK, site[directory_index]
+            if url_path in _NO_FALLBACK or _ASSET.search(url_path) or index is None:
+                return HTTPStatus.NOT_FOUND, None
+            return HTTPStatus.OK, index
+
+        def _send(self, head_only: bool) -> None:
+            status, file = self._resolve(unquote(urlsplit(self.path).path))
+            if file is None:
+                body, headers = status.phrase.encode(), {"Content-Type": "text/plain"}
+            else:
+                body, headers = file.body, {"Content-Type": file.content_type, **file.cache_headers}
+                if file.gzipped is not None:
+                    headers["Vary"] = "Accept-Encoding"
+                    if "gzip" in self.headers.get("Accept-Encoding", ""):
+                        body = file.gzipped
+                        headers["Content-Encoding"] = "gzip"
+
+            self.send_response(status)
+            for name, value in {**headers, **SECURITY_HEADERS}.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if not head_only:
+                self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            self._send(head_only=False)
+
+        def do_HEAD(self) -> None:
+            self._send(head_only=True)
+
+        def log_message(self, format, *args) -> None:
+            pass  # nginx has access_log off for assets; keep test output clean.
+
+    return Handler
+
+
+def _default_port() -> int:
+    return urlsplit(local_endpoint()).port or 80
+
+
+@contextmanager
+def serve_dist(port: int | None = None, build: bool = True, root: Path = DIST_DIR):
+    """Serve ``root`` on ``port`` in a background thread; yields the base URL."""
+    if build:
+        build_dist()
+    port = _default_port() if port is None else port
+    server = ThreadingHTTPServer(("127.0.0.1", port), _make_handler(_load_site(root)))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="dist-server", daemon=True)
+    thread.start()
+    try:
+        yield f"http://localhost:{port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.static_server", description=__doc__)
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--no-build", action="store_true", help="serve dist/ as it is")
+    args = parser.parse_args(argv)
+
+    with serve_dist(args.port, build=not args.no_build) as url:
+        print(f"serving {DIST_DIR} at {url} (Ctrl+C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""Per-step timing for the TC scripts, written as JSONL.
+
+A script is a flat list of ``click()`` / ``fill()`` / ``expect(...)`` calls,
+each under a comment saying what it does. :class:`StepTimer` records one row
+per Playwright action with:
+
+* ``step`` - the nearest comment above the calling line of the script;
+* ``wait_ms`` - time in the ``page.wait_for_timeout`` that precedes it, fixed
+  or settle wait;
+* ``action_ms`` - time inside the action itself, including Playwright's own
+  actionability waiting;
+* ``wall_ms`` - wall-clock since the previous action ended.
+
+Actions are intercepted once on the Playwright classes and attributed to the
+test whose task is running, so concurrent tests do not mix. Rows go to
+``tmp/step_timings-<run id>.jsonl``, next to ``test_results.json``.
+"""
+
+import contextvars
+import functools
+import io
+import json
+import sys
+import time
+import tokenize
+from pathlib import Path
+
+from playwright import async_api
+
+from .config import TMP_DIR
+from .hooks import ContextHook
+
+_ACTIONS = {
+    "Locator": (
+        "click", "dblclick", "fill", "type", "press", "press_sequentially", "check",
+        "uncheck", "select_option", "hover", "set_input_files", "focus", "drag_to",
+    ),
+    "Page": ("goto", "reload", "go_back", "go_forward"),
+    "Mouse": ("wheel", "click", "move", "down", "up"),
+    "Keyboard": ("press", "type", "insert_text"),
+}
+_ASSERTION_CLASSES = ("LocatorAssertions", "PageAssertions")
+
+_current: contextvars.ContextVar["StepTimer | None"] = contextvars.ContextVar("step_timer", default=None)
+_installed = False
+
+
+def timings_path(run_id: str) -> Path:
+    return TMP_DIR / f"step_timings-{run_id}.jsonl"
+
+
+@functools.cache
+def step_labels(path: str) -> list[tuple[int, str]]:
+    """``(line, comment)`` pairs of the script, in line order."""
+    with open(path, encoding="utf-8") as source:
+        tokens = tokenize.generate_tokens(io.StringIO(source.read()).readline)
+        return [
+            (token.start[0], token.string.lstrip("#").strip().lstrip("->").strip())
+            for token in tokens
+            # Whole-line comments only; trailing ones are tags such as "# locator: ...".
+            if token.type == tokenize.COMMENT and token.line.lstrip().startswith("#")
+        ]
+
+
+def _label_for(path: str, line: int) -> str:
+    label = ""
+    for comment_line, comment in step_labels(path):
+        if comment_line >= line:
+            break
+        if comment:
+            label = comment
+    return label
+
+
+def _wrap(name: str, method):
+    @functools.wraps(method)
+    async def timed(self, *args, **kwargs):
+        timer = _current.get()
+        # Nested calls (e.g. not_to_* delegating to to_*) belong to the outer row.
+        if timer is None or timer.in_action:
+            return await method(self, *args, **kwargs)
+        line = timer.call_site()
+        if timer.before_action(name, line) is False:
+            return None
+        start = time.perf_counter()
+        ok = False
+        timer.in_action = True
+        try:
+            result = await method(self, *args, **kwargs)
+            ok = True
+            return result
+        finally:
+            timer.in_action = False
+            timer.record_action(name, line, start, time.perf_counter(), ok)
+
+    return timed
+
+
+def install() -> None:
+    """Patch the Playwright action and assertion methods once per process."""
+    global _installed
+    if _installed:
+        return
+    for class_name, methods in _ACTIONS.items():
+        cls = getattr(async_api, class_name)
+        for method in methods:
+            if hasattr(cls, method):
+                setattr(cls, method, _wrap(method, getattr(cls, method)))
+    for class_name in _ASSERTION_CLASSES:
+        cls = getattr(async_api, class_name)
+        for method in dir(cls):
+            if method.startswith(("to_", "not_to_")):
+                setattr(cls, method, _wrap(f"expect.{method}", getattr(cls, method)))
+    _installed = True
+
+
+class StepTimer(ContextHook):
+    def __init__(self, run_id: str, path: Path | None = None):
+        self.run_id = run_id
+        self.path = timings_path(run_id) if path is None else path
+        self.rows: list[dict] = []
+        self._script = ""
+        self._tc_id = ""
+        self._mark = 0.0
+        self._pending_wait = 0.0
+        self.in_action = False
+
+    def start(self, case) -> None:
+        install()
+        self._script = str(case.path)
+        self._tc_id = case.tc_id
+        self._mark = time.perf_counter()
+        _current.set(self)
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        new_page = context.new_page
+
+        async def new_page_timed(*args, **kwargs) -> async_api.Page:
+            page = await new_page(*args, **kwargs)
+            self._time_waits(page)
+            return page
+
+        context.new_page = new_page_timed
+        context.on("page", self._time_waits)
+
+    def _time_waits(self, page: async_api.Page) -> None:
+        """Wrap whatever ``wait_for_timeout`` the page has now (fixed or settle wait)."""
+        if getattr(page, "_harness_steps", None) is self:
+            return
+        page._harness_steps = self
+        wait = page.wait_for_timeout
+
+        async def wait_for_timeout(timeout: float) -> None:
+            start = time.perf_counter()
+            try:
+                await wait(timeout)
+            finally:
+                self._pending_wait += time.perf_counter() - start
+
+        page.wait_for_timeout = wait_for_timeout
+
+    def call_site(self) -> int:
+        """Line of the script that issued the current call, or 0."""
+        frame = sys._getframe(1)
+        while frame is not None:
+            if frame.f_code.co_filename == self._script:
+                return frame.f_lineno
+            frame = frame.f_back
+        return 0
+
+    def before_action(self, action: str, line: int) -> bool | None:
+        """Called just before each action starts; return False to skip it, or raise to stop there."""
+
+    def record_action(self, action: str, line: int, start: float, end: float, ok: bool) -> None:
+        self.rows.append({
+            "run_id": self.run_id,
+            "tc_id": self._tc_id,
+            "line": line,
+            "step": _label_for(self._script, line) if line else "",
+            "action": action,
+            "wall_ms": round((end - self._mark) * 1000, 1),
+            "wait_ms": round(self._pending_wait * 1000, 1),
+            "action_ms": round((end - start) * 1000, 1),
+            "ok": ok,
+        })
+        self._mark = end
+        self._pending_wait = 0.0
+
+    def finish(self, result) -> None:
+        _current.set(None)
+        self.flush()
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One append per test keeps rows from concurrent workers on separate lines.
+        with open(self.path, "a", encoding="utf-8") as out:
+            out.write("".join(json.dumps(row) + "\n" for row in self.rows))
@@ -0,0 +1,230 @@
+"""Append-only results history: ``tmp/results/runs.jsonl`` plus code blobs.
+
+``tmp/test_results.json`` embeds the full script source in every entry and is
+rewritten as a whole each run, so it grows and slows down with the suite.
+Here each run appends one JSON line per result instead, and the script source
+is stored once under ``tmp/results/code/<hash>.py``. A row refers to it by
+content hash, so an unchanged script costs 16 bytes per run.
+
+:func:`iter_rows` streams the history line by line without loading it whole,
+and :func:`latest` folds it into the newest row per TC. ``test_results.json``
+stays in its TestSprite shape as an export view built from :func:`latest`,
+written by :func:`export_view`.
+
+    python -m harness.store import      # seed history from test_results.json
+    python -m harness.store history TC001
+    python -m harness.store export
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+from .config import RESULTS_PATH, TMP_DIR
+from .results import load_results, merge_results, tc_id_of, timestamp
+
+STORE_DIR = TMP_DIR / "results"
+RUNS_PATH = STORE_DIR / "runs.jsonl"
+CODE_DIR = STORE_DIR / "code"
+
+
+@dataclass
+class ResultRow:
+    """One TC result of one run, as stored in ``runs.jsonl``."""
+
+    run_id: str
+    tc_id: str
+    title: str
+    status: str
+    error: str = ""
+    duration_s: float = 0.0
+    started: str = ""
+    code: str = ""
+    artifacts: str = ""
+    attempts: int = 1
+    flaky: bool = False
+    quarantined: bool = False
+    tbt_ms: float = 0.0
+    worst_inp_ms: float = 0.0
+    cls: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        return self.status == "PASSED"
+
+    @classmethod
+    def from_json(cls, data: dict) -> "ResultRow":
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+def code_hash(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+
+def store_code(source: str, code_dir: Path = CODE_DIR) -> str:
+    """Store ``source`` once under its content hash and return the hash."""
+    digest = code_hash(source)
+    path = code_dir / f"{digest}.py"
+    if not path.exists():
+        code_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(source, encoding="utf-8")
+        os.replace(tmp, path)
+    return digest
+
+
+def read_code(digest: str, code_dir: Path = CODE_DIR) -> str:
+    if not digest:
+        return ""
+    try:
+        return (code_dir / f"{digest}.py").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
+
+
+def _append(path: Path, rows: list[ResultRow]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A single append per run keeps a run's rows contiguous.
+    with open(path, "a", encoding="utf-8") as out:
+        out.write("".join(json.dumps(asdict(row), ensure_ascii=False) + "\n" for row in rows))
+
+
+def append_results(
+    results,
+    sources: dict[str, str],
+    run_id: str,
+    path: Path = RUNS_PATH,
+    quarantined: Iterable[str] = (),
+) -> list[ResultRow]:
+    """Append one row per ``CaseResult`` of run ``run_id``."""
+    code_dir = path.parent / CODE_DIR.name
+    quarantined = set(quarantined)
+    rows = []
+    for result in results:
+        source = sources.get(result.tc_id)
+        rows.append(
+            ResultRow(
+                run_id=run_id,
+                tc_id=result.tc_id,
+                title=result.title,
+                status=result.status,
+                error=result.error,
+                duration_s=round(result.duration_s, 3),
+                started=getattr(result, "started", ""),
+                code=store_code(source, code_dir) if source else "",
+                artifacts=getattr(result, "artifacts", ""),
+                attempts=getattr(result, "attempts", 1),
+                flaky=getattr(result, "flaky", False),
+                quarantined=result.tc_id in quarantined,
+                tbt_ms=getattr(result, "tbt_ms", 0.0),
+                worst_inp_ms=getattr(result, "worst_inp_ms", 0.0),
+                cls=getattr(result, "cls", 0.0),
+            )
+        )
+    _append(path, rows)
+    return rows
+
+
+def iter_rows(path: Path = RUNS_PATH, tc_ids: Iterable[str] | None = None) -> Iterator[ResultRow]:
+    """Stream rows oldest first, optionally only those of ``tc_ids``."""
+    wanted = set(tc_ids) if tc_ids is not None else None
+    # Cheap substring test first, so filtered reads skip json.loads on most lines.
+    needles = [f'"tc_id": "{tc_id}"' for tc_id in wanted] if wanted is not None else None
+    try:
+        source = open(path, encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with source:
+        for line in source:
+            if needles is not None and not any(needle in line for needle in needles):
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # A line torn by a crash mid-append.
+            if wanted is None or data.get("tc_id") in wanted:
+                yield ResultRow.from_json(data)
+
+
+def latest(path: Path = RUNS_PATH, tc_ids: Iterable[str] | None = None) -> dict[str, ResultRow]:
+    """Newest row per TC id."""
+    rows = {}
+    for row in iter_rows(path, tc_ids):
+        rows[row.tc_id] = row
+    return dict(sorted(rows.items()))
+
+
+def run_ids(path: Path = RUNS_PATH) -> list[str]:
+    """Distinct run ids, oldest first."""
+    seen: dict[str, None] = {}
+    for row in iter_rows(path):
+        seen.setdefault(row.run_id)
+    return list(seen)
+
+
+def export_view(path: Path = RUNS_PATH, results_path: Path = RESULTS_PATH) -> list[dict]:
+    """Rewrite ``test_results.json`` from the newest row of every TC.
+
+    Each entry's ``modified`` is the time its row was recorded, so exporting
+    does not make results of older runs look new.
+    """
+    rows = list(latest(path).values())
+    code_dir = path.parent / CODE_DIR.name
+    sources = {row.tc_id: read_code(row.code, code_dir) for row in rows if row.code}
+    recorded = {row.tc_id: row.started for row in rows if row.started}
+    return merge_results(rows, sources, results_path, recorded)
+
+
+def import_array(
+    results_path: Path = RESULTS_PATH, path: Path = RUNS_PATH, run_id: str = "imported"
+) -> list[ResultRow]:
+    """Seed the history with the entries already in ``test_results.json``."""
+    entries = load_results(results_path)
+    code_dir = path.parent / CODE_DIR.name
+    rows = [
+        ResultRow(
+            run_id=run_id,
+            tc_id=tc_id_of(entry["title"]),
+            title=entry["title"],
+            status=entry.get("testStatus", ""),
+            error=entry.get("testError", ""),
+            started=entry.get("modified") or entry.get("created") or timestamp(),
+            code=store_code(entry["code"], code_dir) if entry.get("code") else "",
+        )
+        for entry in entries
+    ]
+    _append(path, rows)
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.store", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("import", help="append the entries of test_results.json as one run")
+    commands.add_parser("export", help="rewrite test_results.json from the newest rows")
+    history = commands.add_parser("history", help="print the stored results of TCs")
+    history.add_argument("tests", nargs="*")
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        print(f"imported {len(import_array())} results into {RUNS_PATH}")
+    elif args.command == "export":
+        print(f"wrote {len(export_view())} entries to {RESULTS_PATH}")
+    else:
+        for row in iter_rows(tc_ids=[tc_id.upper() for tc_id in args.tests] or None):
+            error = f"  {row.error.splitlines()[0]}" if row.error else ""
+            print(
+                f"{row.run_id:<18} {row.tc_id}  {row.status:<7} {row.duration_s:6.1f}s"
+                f"  TBT {row.tbt_ms:5.0f}ms  INP {row.worst_inp_ms:4.0f}ms{error}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+from harness.artifacts import ArtifactFlush
+from harness.session import CaseResult
+
+CASE = SimpleNamespace(tc_id="TC004")
+
+
+def run_attempt(root, attempt: int, passed: bool, mode: str = "failed") -> CaseResult:
+    """Start a hook for ``attempt``, leave a screenshot as before_close would, and finish."""
+    hook = ArtifactFlush(mode=mode, root=root)
+    hook.attempt = attempt
+    hook.start(CASE)
+    hook.directory.mkdir(parents=True)
+    (hook.directory / "page0.png").write_bytes(b"png")
+    result = CaseResult("TC004", "", "PASSED" if passed else "FAILED", attempts=attempt)
+    hook.finish(result)
+    return result
+
+
+def test_a_passing_test_leaves_nothing(tmp_path):
+    assert run_attempt(tmp_path, 1, passed=True).artifacts == ""
+    assert not (tmp_path / "TC004").exists()
+
+
+def test_a_retry_keeps_the_failed_attempt(tmp_path):
+    failed = run_attempt(tmp_path, 1, passed=False)
+    assert failed.artifacts == str(tmp_path / "TC004" / "attempt-1")
+    retried = run_attempt(tmp_path, 2, passed=True)
+    assert retried.artifacts == str(tmp_path / "TC004")
+    assert [path.name for path in (tmp_path / "TC004").iterdir()] == ["attempt-1"]
+
+
+def test_every_failed_attempt_is_kept(tmp_path):
+    for attempt in (1, 2, 3):
+        result = run_attempt(tmp_path, attempt, passed=False)
+    assert result.artifacts == str(tmp_path / "TC004" / "attempt-3")
+    assert sorted(path.name for path in (tmp_path / "TC004").iterdir()) == ["attempt-1", "attempt-2", "attempt-3"]
+
+
+def test_a_new_run_clears_the_previous_one(tmp_path):
+    run_attempt(tmp_path, 1, passed=False)
+    run_attempt(tmp_path, 2, passed=False)
+    run_attempt(tmp_path, 1, passed=False, mode="always")
+    assert [path.name for path in (tmp_path / "TC004").iterdir()] == ["attempt-1"]
@@ -0,0 +1,103 @@
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from harness.bisect_steps import ActionLimit, bisect_case
+from harness.session import CaseResult
+
+ASSERT_LINE = 90
+
+
+@dataclass
+class Case:
+    tc_id: str
+    path: Path
+
+
+class StubSession:
+    """Plays a script of ``actions`` clicks and a final assertion through the limiter.
+
+    The assertion fails once action ``culprit`` has run (never if 0). Action
+    ``broken`` raises instead. ``bare`` makes the assertion a plain ``assert``,
+    which records no row.
+    """
+
+    def __init__(self, actions: int, culprit: int = 0, broken: int = 0, bare: bool = False):
+        self.actions, self.culprit, self.broken, self.bare = actions, culprit, broken, bare
+        self.runs = 0
+
+    async def run_case(self, case, extra_hooks=()) -> CaseResult:
+        (limiter,) = extra_hooks
+        limiter._script, limiter._tc_id = str(case.path), case.tc_id
+        self.runs += 1
+        ran = set()
+        for number in range(1, self.actions + 1):
+            # Each action sits on the line after its "# Step n" comment.
+            if limiter.before_action("click", 2 * number) is False:
+                continue
+            ok = number != self.broken
+            limiter.record_action("click", 2 * number, 0.0, 0.0, ok)
+            if not ok:
+                return CaseResult(case.tc_id, "", "FAILED", "TimeoutError: click\n")
+            ran.add(number)
+        failed = self.culprit in ran
+        if self.bare:
+            error = "AssertionError: wrong theme\n" if failed else ""
+        else:
+            assert limiter.before_action("expect.to_have_text", ASSERT_LINE) is True
+            limiter.record_action("expect.to_have_text", ASSERT_LINE, 0.0, 0.0, not failed)
+            error = "AssertionError: Locator expected to have text\n" if failed else ""
+        return CaseResult(case.tc_id, "", "FAILED" if failed else "PASSED", error)
+
+
+@pytest.fixture
+def case(tmp_path):
+    script = tmp_path / "TC001_test.py"
+    script.write_text("".join(f"# Step {number}\nclick()\n" for number in range(1, 40)), encoding="utf-8")
+    return Case("TC001", script)
+
+
+def test_action_limit_skips_actions_past_the_limit_but_never_expects():
+    limiter = ActionLimit(2)
+    assert [limiter.before_action("click", line) for line in (1, 2, 3)] == [True, True, False]
+    assert limiter.before_action("expect.to_be_visible", 4) is True
+    assert limiter.before_action("fill", 5) is False
+    assert limiter.taken == 2
+
+
+def test_action_limit_without_a_limit_runs_everything():
+    limiter = ActionLimit()
+    assert all(limiter.before_action("click", line) for line in range(50))
+
+
+@pytest.mark.parametrize("culprit", [1, 5, 7, 12])
+def test_bisect_finds_the_action_an_expect_fails_after(case, culprit):
+    session = StubSession(actions=12, culprit=culprit)
+    bisected = asyncio.run(bisect_case(session, case))
+    assert bisected.assertion
+    assert (bisected.first_failing, bisected.actions) == (culprit, 12)
+    assert (bisected.line, bisected.action, bisected.step) == (2 * culprit, "click", f"Step {culprit}")
+    assert bisected.runs == session.runs <= 1 + 4
+
+
+def test_bisect_a_bare_assert_compares_errors(case):
+    bisected = asyncio.run(bisect_case(StubSession(actions=9, culprit=4, bare=True), case))
+    assert bisected.assertion
+    assert bisected.first_failing == 4
+    assert "action 4/9" in bisected.describe()
+
+
+def test_bisect_names_a_failing_action_without_rerunning(case):
+    session = StubSession(actions=8, culprit=2, broken=6)
+    bisected = asyncio.run(bisect_case(session, case))
+    assert not bisected.assertion
+    assert (bisected.first_failing, bisected.line, bisected.runs) == (6, 12, 1)
+    assert bisected.describe().startswith("TC001: action 6/6 fails (1 run) - line 12 click: Step 6")
+
+
+def test_bisect_a_passing_rerun(case):
+    bisected = asyncio.run(bisect_case(StubSession(actions=3), case))
+    assert not bisected.error
+    assert "passed on rerun" in bisected.describe()
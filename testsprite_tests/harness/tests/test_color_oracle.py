@@ -0,0 +1,69 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from harness.color_oracle import (  # noqa: E402
+    generate_shades,
+    get_contrast_ratio,
+    get_wcag_level,
+    hex_to_hsl,
+    hex_to_rgb,
+    hsl_to_hex,
+    js_round,
+)
+
+# Expected values are what src/lib/color-utils.ts returns for the same inputs.
+
+
+def test_js_round_rounds_halves_up():
+    values = np.array([0.5, 1.5, 2.5, -0.5, -1.5, 2.4999999999999996, -2.5000000000000004])
+    assert js_round(values).tolist() == [1, 2, 3, 0, -1, 2, -3]
+
+
+@pytest.mark.parametrize("hex_color", ["#f0a", "f0a", "#F0A", "#ff00aa", "FF00AA"])
+def test_hex_to_rgb_handles_shorthand_and_hash(hex_color):
+    assert hex_to_rgb([hex_color]).tolist() == [[255, 0, 170]]
+
+
+def test_hex_to_rgb_mixed_lengths():
+    assert hex_to_rgb(["#1e90ff", "#000", "fff"]).tolist() == [[30, 144, 255], [0, 0, 0], [255, 255, 255]]
+
+
+@pytest.mark.parametrize("hex_color", ["#ff00", "#ff00aa0", "#gg0000", ""])
+def test_hex_to_rgb_rejects_what_the_oracle_does_not_model(hex_color):
+    with pytest.raises(ValueError):
+        hex_to_rgb([hex_color])
+
+
+def test_hex_to_hsl():
+    rgb = np.array([[30, 144, 255], [128, 128, 128], [255, 0, 0]])
+    assert hex_to_hsl(rgb).tolist() == [[210, 100, 56], [0, 0, 50], [0, 100, 50]]
+
+
+def test_hsl_to_hex():
+    hexes = hsl_to_hex(np.array([210, 0, 360, 120]), np.array([50, 0, 100, 100]), np.array([40, 50, 50, 25]))
+    assert hexes.tolist() == ["#336699", "#808080", "#ff0000", "#008000"]
+
+
+def test_hsl_to_hex_rejects_out_of_range_input():
+    with pytest.raises(ValueError):
+        hsl_to_hex(0, 100, 150)
+
+
+def test_contrast_ratio_and_wcag_level():
+    white = hex_to_rgb(["#ffffff"] * 3)
+    ratio = get_contrast_ratio(hex_to_rgb(["#777777", "#000000", "#ffffff"]), white)
+    assert ratio.tolist() == pytest.approx([4.478089453577214, 21, 1], rel=1e-12)
+    level, passes = get_wcag_level(ratio)
+    assert level.tolist() == ["fail", "aaa", "fail"]
+    assert get_wcag_level(ratio, "large")[0].tolist() == ["aa", "aaa", "fail"]
+    assert passes.tolist() == [False, True, False]
+
+
+def test_generate_shades():
+    assert generate_shades(hex_to_rgb(["#1e90ff"])).tolist() == [
+        [
+            "#e5f2ff", "#cce5ff", "#99ccff", "#66b2ff", "#3399ff", "#007fff",
+            "#0066cc", "#004c99", "#003366", "#001933", "#000d1a",
+        ]
+    ]
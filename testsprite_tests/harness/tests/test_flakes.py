@@ -0,0 +1,63 @@
+import pytest
+
+from harness.flakes import FLAKE_THRESHOLD, FLAKE_WINDOW, MIN_RUNS, FlakeStats, flake_rates, quarantined
+from harness.session import CaseResult
+from harness.store import append_results
+
+# One letter per run, oldest first: pass, flaky (passed on retry), broken (failed every attempt).
+_OUTCOMES = {"p": ("PASSED", False), "f": ("PASSED", True), "b": ("FAILED", False)}
+
+
+@pytest.fixture
+def history(tmp_path):
+    path = tmp_path / "runs.jsonl"
+
+    def write(**runs: str):
+        for index in range(max(len(outcomes) for outcomes in runs.values())):
+            results = []
+            for tc_id, outcomes in runs.items():
+                if index < len(outcomes):
+                    status, flaky = _OUTCOMES[outcomes[index]]
+                    results.append(CaseResult(tc_id, tc_id, status, flaky=flaky, attempts=1 + flaky))
+            append_results(results, {}, f"run-{index}", path)
+        return path
+
+    return write
+
+
+def test_rates_count_flaky_and_failed_runs(history):
+    stats = flake_rates(history(TC001="ppfpb", TC002="pp"))
+    assert (stats["TC001"].runs, stats["TC001"].flaky, stats["TC001"].failed) == (5, 1, 1)
+    assert stats["TC001"].rate == 0.2
+    assert stats["TC002"].rate == 0.0
+
+
+def test_only_the_window_counts(history):
+    path = history(TC001="f" * 10 + "p" * FLAKE_WINDOW)
+    assert flake_rates(path)["TC001"].flaky == 0
+    assert flake_rates(path, window=FLAKE_WINDOW + 5)["TC001"].flaky == 5
+
+
+def test_quarantine_at_the_threshold():
+    at = FlakeStats("TC001", runs=10, flaky=round(10 * FLAKE_THRESHOLD))
+    below = FlakeStats("TC002", runs=10, flaky=round(10 * FLAKE_THRESHOLD) - 1)
+    assert quarantined({"TC001": at, "TC002": below}) == ["TC001"]
+    assert quarantined({"TC001": at}, threshold=0.5) == []
+
+
+def test_too_few_runs_are_never_quarantined(history):
+    stats = flake_rates(history(TC001="f" * (MIN_RUNS - 1), TC002="f" * MIN_RUNS))
+    assert quarantined(stats) == ["TC002"]
+
+
+def test_a_broken_tc_is_not_flaky(history):
+    stats = flake_rates(history(TC001="b" * 10))
+    assert stats["TC001"].failed == 10
+    assert quarantined(stats) == []
+
+
+def test_a_tc_leaves_quarantine_once_it_stops_flaking(history):
+    path = history(TC001="fff" + "p" * 5)
+    assert quarantined(flake_rates(path)) == ["TC001"]
+    path = history(TC001="p" * FLAKE_WINDOW)
+    assert quarantined(flake_rates(path)) == []
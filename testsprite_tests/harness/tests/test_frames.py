@@ -0,0 +1,71 @@
+import pytest
+
+from harness.frames import FrameStats, analyse_trace, grid_values, percentile
+from harness.sliders import SliderState
+
+RENDERER = {"ph": "M", "name": "thread_name", "pid": 1, "tid": 10, "args": {"name": "CrRendererMain"}}
+
+
+def _frame(name: str, seq: int, ts_ms: float, ph: str = "I", **fields) -> dict:
+    args = {"frameSeqId": seq, "layerTreeId": 1}
+    return {"name": name, "ph": ph, "pid": 1, "tid": 20, "ts": ts_ms * 1000, "args": args, **fields}
+
+
+def _task(duration_ms: float, tid: int = 10) -> dict:
+    return {"name": "RunTask", "ph": "X", "pid": 1, "tid": tid, "ts": 0, "dur": duration_ms * 1000}
+
+
+def test_percentile_interpolates():
+    assert percentile([], 95) == 0.0
+    assert percentile([5], 50) == 5
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([10, 0, 20], 100) == 20
+
+
+def test_analyse_trace_measures_begin_to_draw():
+    events = [
+        RENDERER,
+        _frame("BeginFrame", 1, 0),
+        _frame("DrawFrame", 1, 4),
+        _frame("BeginFrame", 2, 16.7),
+        # An async DrawFrame pair counts once, from its begin.
+        _frame("DrawFrame", 2, 36.7, ph="b", id="0x1"),
+        _frame("DrawFrame", 2, 40, ph="e", id="0x1"),
+        _frame("BeginFrame", 3, 33.3),
+        _frame("DroppedFrame", 3, 45),
+        # Idle vsyncs: a BeginFrame with nothing drawn or dropped is not a frame.
+        _frame("BeginFrame", 4, 50),
+        _frame("BeginFrame", 5, 66.7),
+        _task(120),
+        _task(30),
+        _task(500, tid=99),  # not the renderer main thread
+    ]
+    stats = analyse_trace({"traceEvents": events}, FrameStats("glass.blur", 1, 1))
+    assert stats.frames == 2
+    assert stats.dropped == 1
+    assert stats.max_ms == 20
+    assert stats.p50_ms == 12
+    assert stats.long_tasks == 1
+    assert stats.longest_tasks_ms == [120, 30]
+
+
+def test_analyse_trace_ignores_frames_without_a_sequence_number():
+    events = [{"name": "DrawFrame", "ph": "I", "pid": 1, "tid": 20, "ts": 0, "args": {}}]
+    stats = analyse_trace(events, FrameStats("glass.blur", 1, 1))
+    assert (stats.frames, stats.dropped, stats.max_ms) == (0, 0, 0)
+
+
+def test_grid_values_visit_every_step():
+    assert grid_values(SliderState(min=1, max=12, now=1), 1) == list(range(2, 13))
+    assert grid_values(SliderState(min=0, max=100, now=0), 5) == list(range(5, 101, 5))
+
+
+def test_grid_values_end_on_an_off_grid_maximum():
+    values = grid_values(SliderState(min=100, max=400, now=100), 8)
+    assert values[-2:] == [396, 400]
+    assert len(values) == 38
+
+
+def test_grid_values_tolerate_float_steps():
+    assert grid_values(SliderState(min=0, max=1, now=0), 0.1)[-1] == pytest.approx(1)
+    assert len(grid_values(SliderState(min=0, max=1, now=0), 0.1)) == 10
@@ -0,0 +1,50 @@
+from harness.impact import feature_tcs, select
+
+FEATURES = {
+    "Contrast Checker": ["src/pages/tools/ContrastTool.tsx"],
+    "Color Palette Generator": ["src/pages/tools/PaletteTool.tsx", "src/components/palette"],
+    "Theme Management": ["src/components/ThemeProvider.tsx"],
+    "Homepage": ["src/pages/Index.tsx"],
+}
+TITLES = {
+    "TC003": "Color Palette Generator creates harmonious palettes",
+    "TC009": "Contrast Checker accurately calculates contrast ratios",
+    "TC015": "Theme toggling respects system preferences and manual override",
+}
+
+
+def test_feature_tcs_matches_titles_then_first_word():
+    mapping = feature_tcs(FEATURES, TITLES)
+    assert mapping["Contrast Checker"] == ["TC009"]
+    assert mapping["Theme Management"] == ["TC015"]
+    assert mapping["Homepage"] == list(TITLES)
+
+
+def test_feature_file_selects_its_tc():
+    impact = select(["src/pages/tools/ContrastTool.tsx"], FEATURES)
+    assert impact.tc_ids == ["TC009"]
+    assert not impact.global_changes
+
+
+def test_shared_module_reaches_importing_features():
+    impact = select(["src/lib/color-utils.ts"], FEATURES)
+    assert "TC003" in impact.tc_ids
+    assert "TC009" not in impact.tc_ids
+
+
+def test_tc_script_selects_itself():
+    impact = select(["testsprite_tests/TC009_Contrast_Checker_accurately_calculates_contrast_ratios.py"], FEATURES)
+    assert impact.tc_ids == ["TC009"]
+
+
+def test_build_config_selects_everything():
+    for path in ("tsconfig.json", "tsconfig.app.json", "tsconfig.node.json", "vite.config.ts", "public/robots.txt"):
+        impact = select([path], FEATURES)
+        assert impact.global_changes == [path]
+        assert len(impact.tc_ids) == 19
+
+
+def test_docs_select_nothing():
+    impact = select(["README.md", "eslint.config.js"], FEATURES)
+    assert impact.tc_ids == []
+    assert impact.ignored == ["README.md", "eslint.config.js"]
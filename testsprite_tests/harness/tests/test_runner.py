@@ -0,0 +1,45 @@
+import pytest
+
+from harness.runner import plan_shards
+
+
+def totals(shards, durations):
+    return sorted(sum(durations[tc] for tc in shard) for shard in shards)
+
+
+def test_longest_first_balances_shards():
+    durations = {"TC001": 50, "TC002": 40, "TC003": 30, "TC004": 30, "TC005": 20, "TC006": 10}
+    shards = plan_shards(list(durations), 2, durations)
+    assert totals(shards, durations) == [90, 90]
+
+
+def test_each_tc_lands_once_and_shards_keep_input_order():
+    tc_ids = [f"TC{number:03d}" for number in range(1, 20)]
+    durations = {tc: (number * 7) % 11 + 1 for number, tc in enumerate(tc_ids)}
+    shards = plan_shards(tc_ids, 4, durations)
+    assert sorted(tc for shard in shards for tc in shard) == tc_ids
+    for shard in shards:
+        assert shard == sorted(shard, key=tc_ids.index)
+
+
+def test_a_long_tc_gets_a_shard_of_its_own():
+    durations = {"TC001": 300, "TC002": 20, "TC003": 20, "TC004": 20}
+    shards = plan_shards(list(durations), 2, durations)
+    assert ["TC001"] in shards
+
+
+@pytest.mark.parametrize("workers, expected", [(0, 1), (1, 1), (3, 3), (10, 3)])
+def test_never_more_shards_than_tcs(workers, expected):
+    assert len(plan_shards(["TC001", "TC002", "TC003"], workers, {})) == expected
+
+
+def test_unknown_tcs_cost_the_median_of_known_ones():
+    # TC004 and TC005 are new: each costs 10, the median, so they pair with TC003.
+    durations = {"TC001": 40, "TC002": 10, "TC003": 10}
+    shards = plan_shards(["TC001", "TC002", "TC003", "TC004", "TC005"], 2, durations)
+    assert sorted(shards) == [["TC001"], ["TC002", "TC003", "TC004", "TC005"]]
+
+
+def test_with_no_history_every_tc_costs_the_default():
+    shards = plan_shards(["TC001", "TC002", "TC003", "TC004"], 2, {})
+    assert [len(shard) for shard in shards] == [2, 2]
@@ -0,0 +1,94 @@
+import math
+from collections import deque
+
+import pytest
+
+from harness.sliders import SliderState, aria_value, key_plan, same_value
+
+KEYS = ("Home", "End", "PageUp", "PageDown", "ArrowUp", "ArrowDown")
+_MOVES = {"PageUp": 10, "PageDown": -10, "ArrowUp": 1, "ArrowDown": -1}
+
+
+def press(value: float, key: str, low: float, high: float, step: float) -> float:
+    """What a Radix slider does with ``key``: move, snap to the grid from ``low``, clamp."""
+    if key == "Home":
+        return low
+    if key == "End":
+        return high
+    moved = value + _MOVES[key] * step
+    snapped = math.floor((moved - low) / step + 0.5) * step + low
+    return min(high, max(low, snapped))
+
+
+def fewest_keys(start: float, target: float, low: float, high: float, step: float) -> int:
+    """Breadth-first search over key presses, staying on the step grid as key_plan does."""
+    seen, queue = {start}, deque([(start, 0)])
+    while queue:
+        value, depth = queue.popleft()
+        if value == target:
+            return depth
+        for key in KEYS:
+            after = press(value, key, low, high, step)
+            if after not in seen and (after - low) % step == 0:
+                seen.add(after)
+                queue.append((after, depth + 1))
+    raise AssertionError(f"{target} unreachable")
+
+
+@pytest.mark.parametrize(
+    "low, high, step, now",
+    [
+        (0, 100, 1, 0),  # Glass transparency
+        (0, 100, 1, 63),
+        (0, 50, 5, 20),  # Shadow radius
+        (100, 400, 8, 300),  # Blob size: the maximum is off the grid
+    ],
+)
+def test_key_plan_lands_on_target_in_fewest_keys(low, high, step, now):
+    state = SliderState(min=low, max=high, now=now)
+    for target in range(low, high + 1, step):
+        keys = key_plan(state, target, step)
+        value = now
+        for key in keys:
+            value = press(value, key, low, high, step)
+        assert value == target, keys
+        assert len(keys) == fewest_keys(now, target, low, high, step), (target, keys)
+
+
+def test_key_plan_never_starts_from_an_off_grid_bound():
+    state = SliderState(min=100, max=400, now=100)
+    assert key_plan(state, 396, 8)[0] != "End"
+
+
+def test_key_plan_from_a_float_artefact():
+    # GlassTool reports transparency 57 as 56.99999999999999.
+    state = SliderState(min=0, max=100, now=(57 / 100) * 100)
+    assert key_plan(state, 60, 1) == ["ArrowUp"] * 3
+
+
+@pytest.mark.parametrize("target", [101, -1, 4.5])
+def test_key_plan_rejects_unreachable_targets(target):
+    with pytest.raises(ValueError):
+        key_plan(SliderState(min=0, max=100, now=0), target, 1)
+
+
+def test_same_value_allows_scaling_artefacts():
+    artefacts = [value for value in range(101) if (value / 100) * 100 != value]
+    assert artefacts  # 7, 14, 28, 29, 55-58, ...
+    for value in artefacts:
+        assert same_value((value / 100) * 100, value)
+    assert not same_value(56, 57)
+    assert not same_value(0.5, 0.6)
+
+
+def test_aria_value_formats_like_a_js_number():
+    assert aria_value(20.0) == "20"
+    assert aria_value(0.5) == "0.5"
+
+
+def test_point_for():
+    root = {"x": 100, "y": 50, "width": 200, "height": 20}
+    assert SliderState(0, 100, 0, root=root).point_for(25) == (150, 60)
+    assert SliderState(0, 100, 0, rtl=True, root=root).point_for(25) == (250, 60)
+    vertical = {"x": 0, "y": 0, "width": 10, "height": 100}
+    assert SliderState(0, 10, 0, vertical=True, root=vertical).point_for(10) == (5, 0)
@@ -0,0 +1,25 @@
+import pytest
+
+from harness.soak import HEAP_SLOPE_LIMIT_KIB, NODE_SLOPE_LIMIT, SoakResult, slope
+
+
+def test_slope_of_a_line():
+    assert slope([(0, 10), (100, 30), (200, 50)]) == pytest.approx(0.2)
+
+
+def test_slope_ignores_noise_around_a_flat_line():
+    assert slope([(0, 10), (50, 12), (100, 10), (150, 12), (200, 10), (250, 12)]) == pytest.approx(
+        0.0, abs=0.01
+    )
+
+
+@pytest.mark.parametrize("points", [[], [(0, 5)]])
+def test_slope_needs_two_points(points):
+    assert slope(points) == 0.0
+
+
+def test_leaking_and_severity_use_the_worse_slope():
+    result = SoakResult("glass", 2000, heap_slope_kib=HEAP_SLOPE_LIMIT_KIB / 2, node_slope=NODE_SLOPE_LIMIT * 2)
+    assert result.leaking
+    assert result.severity == pytest.approx(2)
+    assert not SoakResult("glass", 2000, heap_slope_kib=HEAP_SLOPE_LIMIT_KIB).leaking
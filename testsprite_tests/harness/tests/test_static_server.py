@@ -0,0 +1,39 @@
+from http import HTTPStatus
+
+import pytest
+
+from harness.static_server import _load_site, _make_handler
+
+
+@pytest.fixture
+def resolve(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<div id=root></div>", encoding="utf-8")
+    (tmp_path / "assets" / "index-abc123.js").write_text("export {}", encoding="utf-8")
+    (tmp_path / ".env").write_text("SECRET=1", encoding="utf-8")
+    handler = _make_handler(_load_site(tmp_path))
+    # _resolve only needs the site, so skip the socket handling in __init__.
+    request = handler.__new__(handler)
+    return request._resolve
+
+
+def test_files_are_served(resolve):
+    status, file = resolve("/assets/index-abc123.js")
+    assert status == HTTPStatus.OK
+    assert file.body == b"export {}"
+
+
+@pytest.mark.parametrize("path", ["/", "/glass", "/tools/blob/"])
+def test_routes_fall_back_to_index(resolve, path):
+    status, file = resolve(path)
+    assert status == HTTPStatus.OK
+    assert file.content_type == "text/html"
+
+
+@pytest.mark.parametrize("path", ["/assets/index-old999.js", "/logo.svg", "/fonts/x.WOFF2", "/robots.txt"])
+def test_missing_assets_are_not_found(resolve, path):
+    assert resolve(path) == (HTTPStatus.NOT_FOUND, None)
+
+
+def test_hidden_files_are_forbidden(resolve):
+    assert resolve("/.env") == (HTTPStatus.FORBIDDEN, None)
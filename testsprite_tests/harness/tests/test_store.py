@@ -0,0 +1,93 @@
+import json
+
+from harness.session import CaseResult
+from harness.store import (
+    append_results,
+    export_view,
+    import_array,
+    iter_rows,
+    latest,
+    read_code,
+    run_ids,
+)
+
+SOURCE = "async def run_test():\n    pass\n"
+
+
+def result(tc_id: str, status: str = "PASSED", started: str = "2026-01-01T00:00:00") -> CaseResult:
+    return CaseResult(tc_id, f"{tc_id}-Title", status, started=started)
+
+
+def test_rows_round_trip(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    failed = result("TC001", "FAILED")
+    failed.error, failed.attempts, failed.duration_s = "TimeoutError: click", 2, 1.23456
+    written = append_results([failed, result("TC002")], {"TC001": SOURCE}, "run-1", path, quarantined=["TC002"])
+    assert list(iter_rows(path)) == written
+    first, second = written
+    assert (first.status, first.error, first.attempts, first.duration_s) == ("FAILED", "TimeoutError: click", 2, 1.235)
+    assert read_code(first.code, tmp_path / "code") == SOURCE
+    assert (second.code, second.quarantined) == ("", True)
+
+
+def test_history_is_append_only(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    append_results([result("TC001", "FAILED"), result("TC002")], {}, "run-1", path)
+    append_results([result("TC001")], {}, "run-2", path)
+    assert [(row.run_id, row.tc_id) for row in iter_rows(path)] == [
+        ("run-1", "TC001"),
+        ("run-1", "TC002"),
+        ("run-2", "TC001"),
+    ]
+    assert run_ids(path) == ["run-1", "run-2"]
+    assert {tc: row.run_id for tc, row in latest(path).items()} == {"TC001": "run-2", "TC002": "run-1"}
+    assert [row.run_id for row in iter_rows(path, ["TC002"])] == ["run-1"]
+
+
+def test_an_unchanged_script_is_stored_once(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    append_results([result("TC001")], {"TC001": SOURCE}, "run-1", path)
+    append_results([result("TC001")], {"TC001": SOURCE}, "run-2", path)
+    assert len(list((tmp_path / "code").iterdir())) == 1
+
+
+def test_a_torn_line_is_skipped(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    append_results([result("TC001")], {}, "run-1", path)
+    with open(path, "a", encoding="utf-8") as out:
+        out.write('{"run_id": "run-2", "tc_id": "TC0')
+    assert [row.run_id for row in iter_rows(path)] == ["run-1"]
+
+
+def test_export_writes_the_newest_row_per_tc(tmp_path):
+    path, results_path = tmp_path / "runs.jsonl", tmp_path / "test_results.json"
+    append_results([result("TC002", "FAILED", "2026-01-01T00:00:00")], {"TC002": SOURCE}, "run-1", path)
+    append_results([result("TC002", started="2026-01-02T00:00:00")], {}, "run-2", path)
+    append_results([result("TC001", started="2026-01-03T00:00:00")], {}, "run-3", path)
+    export_view(path, results_path)
+    entries = json.loads(results_path.read_text(encoding="utf-8"))
+    assert [(entry["title"], entry["testStatus"], entry["modified"]) for entry in entries] == [
+        ("TC001-Title", "PASSED", "2026-01-03T00:00:00"),
+        ("TC002-Title", "PASSED", "2026-01-02T00:00:00"),
+    ]
+
+
+def test_import_then_export_keeps_the_array(tmp_path):
+    results_path = tmp_path / "test_results.json"
+    entries = [
+        {
+            "title": "TC001-Title",
+            "description": "kept",
+            "code": SOURCE,
+            "testStatus": "FAILED",
+            "testError": "AssertionError",
+            "testType": "FRONTEND",
+            "createFrom": "mcp",
+            "created": "2025-12-01T00:00:00",
+            "modified": "2025-12-02T00:00:00",
+        }
+    ]
+    results_path.write_text(json.dumps(entries), encoding="utf-8")
+    path = tmp_path / "results" / "runs.jsonl"
+    import_array(results_path, path)
+    assert export_view(path, results_path) == entries
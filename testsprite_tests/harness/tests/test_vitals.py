@@ -0,0 +1,54 @@
+import pytest
+
+from harness.vitals import THRESHOLDS, THROTTLING, _median, rating
+
+
+@pytest.mark.parametrize(
+    "metric, value, expected",
+    [
+        ("lcp_ms", 2500, "good"),
+        ("lcp_ms", 2501, "needs-improvement"),
+        ("lcp_ms", 4000, "needs-improvement"),
+        ("lcp_ms", 4001, "poor"),
+        ("cls", 0.1, "good"),
+        ("cls", 0.26, "poor"),
+        ("inp_ms", 0, "good"),
+    ],
+)
+def test_rating_boundaries(metric, value, expected):
+    assert rating(metric, value) == expected
+
+
+def _sample(**values) -> dict:
+    sample = {"route": "/tools/glass", "fcp_ms": 0, "lcp_ms": 0, "cls": 0, "inp_ms": 0, "tbt_ms": 0}
+    sample.update(values)
+    return sample
+
+
+def test_median_takes_each_metric_separately_and_rates_it():
+    merged = _median(
+        [
+            _sample(lcp_ms=1000, cls=0.3, tbt_ms=700),
+            _sample(lcp_ms=5000, cls=0.0, tbt_ms=100),
+            _sample(lcp_ms=3000, cls=0.2, tbt_ms=300),
+        ]
+    )
+    assert merged["route"] == "/tools/glass"
+    assert (merged["lcp_ms"], merged["cls"], merged["tbt_ms"]) == (3000, 0.2, 300)
+    assert merged["runs"] == 3
+    assert set(merged["ratings"]) == set(THRESHOLDS)
+    assert merged["ratings"]["lcp_ms"] == "needs-improvement"
+    assert merged["ratings"]["tbt_ms"] == "needs-improvement"
+
+
+def test_median_of_an_even_count_averages_the_middle_pair():
+    assert _median([_sample(fcp_ms=100), _sample(fcp_ms=300)])["fcp_ms"] == 200
+
+
+def test_mobile_throttling_matches_lighthouse():
+    # Lighthouse's mobileSlow4G: 150 ms RTT, 1.6 Mbit/s down, 750 kbit/s up, 4x CPU.
+    mobile = THROTTLING["mobile"]
+    assert mobile["latency_ms"] == 150 * 3.75
+    assert mobile["download_kbps"] == pytest.approx(1.6 * 1024 * 0.9)
+    assert mobile["upload_kbps"] == pytest.approx(750 * 0.9)
+    assert mobile["cpu"] == 4
@@ -0,0 +1,269 @@
+"""Core Web Vitals for every route, under fixed CPU and network throttling.
+
+TC002 expects the blur preview to update "without performance issues", but
+the suite never measures that. This module loads each route once per run,
+in a fresh context on one shared browser, and records:
+
+* LCP, FCP and CLS, from a ``PerformanceObserver`` added before any app
+  script runs. CLS uses the largest session window, as the metric defines it.
+* TBT, the blocking part (over 50 ms) of each long task after FCP. The
+  window ends at the end of the measurement, not at TTI.
+* INP, the longest ``event`` timing of two scripted interactions: a click
+  on the page heading and a Tab. An INP of 0 means every event finished
+  in under 16 ms.
+* JS heap and DOM node count, from CDP ``Performance.getMetrics``.
+* Transfer bytes and requests, from CDP ``Network.loadingFinished``.
+
+Throttling goes through CDP as well (``Network.emulateNetworkConditions``,
+``Emulation.setCPUThrottlingRate``). The presets follow Lighthouse's
+DevTools-throttled mobile and desktop settings. The routes are those of
+``public/sitemap.xml`` plus every tool in ``src/lib/toolsConfig.ts``.
+Results go to ``tmp/vitals/<run id>.json`` and ``tmp/vitals/latest.json``.
+
+    python -m harness.vitals --dist                 # production build, mobile throttling
+    python -m harness.vitals -t desktop -n 3 /glass /blob
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import xml.etree.ElementTree as ElementTree
+from contextlib import nullcontext
+from urllib.parse import urlsplit
+
+from playwright import async_api
+
+from .config import REPO_ROOT, TMP_DIR, local_endpoint
+from .fixtures import tool_routes
+from .profiles import profile_names
+from .results import new_run_id, timestamp
+from .session import SuiteSession
+from .static_server import serve_dist
+
+SITEMAP_PATH = REPO_ROOT / "public" / "sitemap.xml"
+VITALS_DIR = TMP_DIR / "vitals"
+# After load and network idle, let late layout shifts and long tasks land.
+SETTLE_MS = 1500
+# Let the interactions' event timings be reported.
+INTERACTION_SETTLE_MS = 500
+LONG_TASK_BLOCKING_MS = 50
+
+# latency ms, download/upload kbit/s, CPU slowdown. Mobile is Lighthouse's slow 4G as
+# DevTools applies it: 150 ms x 3.75, 1638.4 and 750 kbit/s x 0.9.
+THROTTLING = {
+    "mobile": {"latency_ms": 562.5, "download_kbps": 1474.56, "upload_kbps": 675, "cpu": 4},
+    "desktop": {"latency_ms": 40, "download_kbps": 10240, "upload_kbps": 10240, "cpu": 1},
+    "none": {"latency_ms": 0, "download_kbps": 0, "upload_kbps": 0, "cpu": 1},
+}
+# (good up to, poor above) as published for each metric.
+THRESHOLDS = {
+    "lcp_ms": (2500, 4000),
+    "fcp_ms": (1800, 3000),
+    "cls": (0.1, 0.25),
+    "inp_ms": (200, 500),
+    "tbt_ms": (200, 600),
+}
+
+_OBSERVER_JS = """(() => {
+    const vitals = window.__vitals = {fcp: 0, lcp: 0, cls: 0, inp: 0, interactions: 0, longTasks: []};
+    const observe = (type, onEntry, options = {}) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(onEntry))
+                .observe({type, buffered: true, ...options});
+        } catch (error) {}  // Entry type not supported by this browser.
+    };
+    observe("paint", entry => {
+        if (entry.name === "first-contentful-paint") vitals.fcp = entry.startTime;
+    });
+    observe("largest-contentful-paint", entry => { vitals.lcp = entry.startTime; });
+    let windowValue = 0, windowStart = 0, lastShift = 0;
+    observe("layout-shift", entry => {
+        if (entry.hadRecentInput) return;
+        // A session window: shifts under 1 s apart, at most 5 s long.
+        if (windowValue && entry.startTime - lastShift < 1000 && entry.startTime - windowStart < 5000) {
+            windowValue += entry.value;
+        } else {
+            windowValue = entry.value;
+            windowStart = entry.startTime;
+        }
+        lastShift = entry.startTime;
+        vitals.cls = Math.max(vitals.cls, windowValue);
+    });
+    observe("longtask", entry => vitals.longTasks.push([entry.startTime, entry.duration]));
+    observe("event", entry => {
+        if (!entry.interactionId) return;
+        vitals.interactions += 1;
+        vitals.inp = Math.max(vitals.inp, entry.duration);
+    }, {durationThreshold: 16});
+})();"""
+
+
+def sitemap_routes(path=SITEMAP_PATH) -> list[str]:
+    """Route paths of the ``<loc>`` entries in the sitemap."""
+    try:
+        root = ElementTree.parse(path).getroot()
+    except FileNotFoundError:
+        return []
+    return [
+        urlsplit(loc.text.strip()).path or "/"
+        for loc in root.iter()
+        if loc.tag.endswith("}loc") and loc.text
+    ]
+
+
+def routes() -> list[str]:
+    """Sitemap routes, then any tool route the sitemap lacks."""
+    return list(dict.fromkeys([*sitemap_routes(), *tool_routes().values()]))
+
+
+def rating(metric: str, value: float) -> str:
+    good, poor = THRESHOLDS[metric]
+    return "good" if value <= good else "poor" if value > poor else "needs-improvement"
+
+
+async def _throttle(cdp: async_api.CDPSession, preset: dict) -> None:
+    def bytes_per_s(kbps: float) -> float:
+        return kbps * 1024 / 8 if kbps else -1  # -1 disables the limit
+
+    await cdp.send("Network.enable")
+    await cdp.send(
+        "Network.emulateNetworkConditions",
+        {
+            "offline": False,
+            "latency": preset["latency_ms"],
+            "downloadThroughput": bytes_per_s(preset["download_kbps"]),
+            "uploadThroughput": bytes_per_s(preset["upload_kbps"]),
+        },
+    )
+    await cdp.send("Emulation.setCPUThrottlingRate", {"rate": preset["cpu"]})
+    await cdp.send("Performance.enable")
+
+
+async def _interact(page: async_api.Page) -> None:
+    heading = page.locator("h1").first
+    if await heading.count():
+        await heading.click()
+    else:
+        await page.mouse.click(1, 1)
+    await page.keyboard.press("Tab")
+    await page.wait_for_timeout(INTERACTION_SETTLE_MS)
+
+
+async def measure_route(
+    session: SuiteSession, route: str, preset: dict, endpoint: str
+) -> dict:
+    """Load ``route`` once in a fresh context and return its vitals."""
+    context = await session.new_context()
+    try:
+        await context.add_init_script(_OBSERVER_JS)
+        page = await context.new_page()
+        cdp = await context.new_cdp_session(page)
+        await _throttle(cdp, preset)
+        transfer = {"bytes": 0, "requests": 0}
+
+        def on_finished(event: dict) -> None:
+            transfer["bytes"] += event.get("encodedDataLength", 0)
+            transfer["requests"] += 1
+
+        cdp.on("Network.loadingFinished", on_finished)
+        await page.goto(endpoint + route, wait_until="load")
+        await page.wait_for_load_state("networkidle")
+        await page.wait_for_timeout(SETTLE_MS)
+        await _interact(page)
+
+        vitals = await page.evaluate("() => window.__vitals")
+        metrics = {m["name"]: m["value"] for m in (await cdp.send("Performance.getMetrics"))["metrics"]}
+    finally:
+        await context.close()
+
+    after_fcp = [(start, duration) for start, duration in vitals["longTasks"] if start >= vitals["fcp"]]
+    return {
+        "route": route,
+        "fcp_ms": round(vitals["fcp"], 1),
+        "lcp_ms": round(vitals["lcp"], 1),
+        "cls": round(vitals["cls"], 4),
+        "inp_ms": round(vitals["inp"], 1),
+        "interactions": vitals["interactions"],
+        "tbt_ms": round(sum(max(0.0, d - LONG_TASK_BLOCKING_MS) for _, d in after_fcp), 1),
+        "long_tasks": len(vitals["longTasks"]),
+        "heap_used_mib": round(metrics.get("JSHeapUsedSize", 0) / 2**20, 2),
+        "dom_nodes": int(metrics.get("Nodes", 0)),
+        "transfer_kib": round(transfer["bytes"] / 1024, 1),
+        "requests": transfer["requests"],
+    }
+
+
+def _median(samples: list[dict]) -> dict:
+    """Per-metric median of repeated measurements of one route."""
+    merged = dict(samples[0])
+    for key, value in samples[0].items():
+        if isinstance(value, (int, float)):
+            merged[key] = statistics.median(sample[key] for sample in samples)
+    merged["runs"] = len(samples)
+    merged["ratings"] = {metric: rating(metric, merged[metric]) for metric in THRESHOLDS}
+    return merged
+
+
+async def measure(
+    route_list: list[str], throttling: str = "mobile", runs: int = 1, **session_options
+) -> list[dict]:
+    """Vitals of each route, the median of ``runs`` cold loads."""
+    preset = THROTTLING[throttling]
+    endpoint = local_endpoint()
+    session_options.setdefault("hook_factories", [])
+    rows = []
+    async with SuiteSession(**session_options) as session:
+        for route in route_list:
+            samples = [await measure_route(session, route, preset, endpoint) for _ in range(runs)]
+            rows.append(_median(samples))
+    return rows
+
+
+def write_results(rows: list[dict], throttling: str, run_id: str) -> str:
+    VITALS_DIR.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "run_id": run_id,
+        "measured": timestamp(),
+        "throttling": {"preset": throttling, **THROTTLING[throttling]},
+        "routes": rows,
+    }
+    text = json.dumps(payload, indent=2) + "\n"
+    path = VITALS_DIR / f"{run_id}.json"
+    path.write_text(text, encoding="utf-8")
+    (VITALS_DIR / "latest.json").write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.vitals", description=__doc__)
+    parser.add_argument("routes", nargs="*", help="route paths (default: sitemap and tool routes)")
+    parser.add_argument("-t", "--throttling", choices=THROTTLING, default="mobile")
+    parser.add_argument("-n", "--runs", type=int, default=1, help="cold loads per route; the median is kept")
+    parser.add_argument("--profile", choices=profile_names(), help="Chromium launch profile")
+    parser.add_argument(
+        "--dist", action="store_true",
+        help="build dist/ if stale and serve it like nginx-spa.conf on the localEndpoint port",
+    )
+    args = parser.parse_args(argv)
+
+    route_list = args.routes or routes()
+    with serve_dist() if args.dist else nullcontext():
+        rows = asyncio.run(measure(route_list, args.throttling, max(1, args.runs), profile=args.profile))
+    path = write_results(rows, args.throttling, new_run_id())
+
+    print(f"{'route':<22}{'LCP ms':>8}{'CLS':>7}{'INP ms':>8}{'TBT ms':>8}{'heap MiB':>10}{'KiB':>8}")
+    for row in rows:
+        poor = [metric for metric, grade in row["ratings"].items() if grade == "poor"]
+        print(
+            f"{row['route']:<22}{row['lcp_ms']:>8.0f}{row['cls']:>7.3f}{row['inp_ms']:>8.0f}"
+            f"{row['tbt_ms']:>8.0f}{row['heap_used_mib']:>10.1f}{row['transfer_kib']:>8.0f}"
+            + (f"  poor: {', '.join(poor)}" if poor else "")
+        )
+    print(f"\n{len(rows)} routes, {args.throttling} throttling: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
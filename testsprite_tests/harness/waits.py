@@ -0,0 +1,129 @@
+"""Event-driven replacement for the scripts' fixed ``page.wait_for_timeout(3000)``.
+
+The generated scripts sleep three seconds before every click or fill. Under the
+harness that sleep becomes a *settle* wait bounded by the same budget:
+
+1. if the URL changed since the last wait (a route change), wait for network
+   idle;
+2. wait until the DOM has been free of mutations for ``quiet_ms`` and two
+   animation frames have painted, which is when a tool's live preview has
+   finished re-rendering.
+
+Actionability of the element itself (attached, visible, stable, enabled) is
+already awaited by Playwright inside ``click()`` / ``fill()``. Every wait is
+recorded so the run can report what was actually spent against the budget.
+"""
+
+import time
+from dataclasses import dataclass
+
+from playwright import async_api
+
+from .hooks import ContextHook
+
+# Resolves once the DOM has been quiet for quietMs (or budgetMs elapsed),
+# then waits two frames so the settled state has actually been painted.
+_SETTLE_JS = """
+([quietMs, budgetMs]) => new Promise((resolve) => {
+  const start = performance.now();
+  let finished = false;
+  let quietTimer;
+  const done = () => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(capTimer);
+    requestAnimationFrame(() => requestAnimationFrame(() => resolve(performance.now() - start)));
+  };
+  const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(done, quietMs);
+  });
+  observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+  quietTimer = setTimeout(done, quietMs);
+  const capTimer = setTimeout(done, budgetMs);
+})
+"""
+
+
+@dataclass
+class WaitRecord:
+    reason: str
+    url: str
+    budget_ms: float
+    waited_ms: float
+
+
+class SmartWaits(ContextHook):
+    """Installs settle waits on every page of the contexts a test opens."""
+
+    def __init__(self, quiet_ms: int = 150, max_ms: float | None = None):
+        self.quiet_ms = quiet_ms
+        self.max_ms = max_ms
+        self.records: list[WaitRecord] = []
+        self._last_url: dict[int, str] = {}
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        new_page = context.new_page
+
+        async def new_page_with_waits(*args, **kwargs) -> async_api.Page:
+            page = await new_page(*args, **kwargs)
+            self.install(page)
+            return page
+
+        context.new_page = new_page_with_waits
+        context.on("page", self.install)
+
+    def install(self, page: async_api.Page) -> None:
+        """Replace ``page.wait_for_timeout`` with a settle wait on the same budget."""
+        if getattr(page, "_harness_waits", None) is self:
+            return
+        page._harness_waits = self
+
+        async def wait_for_timeout(timeout: float) -> None:
+            await self.settle(page, timeout, reason="fixed-timeout")
+
+        page.wait_for_timeout = wait_for_timeout
+
+    async def settle(self, page: async_api.Page, budget_ms: float, reason: str = "settle") -> float:
+        """Wait for the page to settle, spending at most ``budget_ms``. Returns ms waited."""
+        if self.max_ms is not None:
+            budget_ms = min(budget_ms, self.max_ms)
+        start = time.perf_counter()
+
+        url = page.url
+        if self._last_url.get(id(page)) != url:
+            self._last_url[id(page)] = url
+            try:
+                await page.wait_for_load_state("networkidle", timeout=budget_ms)
+            except async_api.Error:
+                pass
+
+        remaining = budget_ms - (time.perf_counter() - start) * 1000
+        if remaining > 0:
+            try:
+                await page.evaluate(_SETTLE_JS, [self.quiet_ms, remaining])
+            except async_api.Error:
+                # Execution context destroyed by a navigation: settle on the new document.
+                try:
+                    await page.wait_for_load_state("domcontentloaded", timeout=remaining)
+                except async_api.Error:
+                    pass
+
+        waited_ms = (time.perf_counter() - start) * 1000
+        self.records.append(WaitRecord(reason, url, budget_ms, waited_ms))
+        return waited_ms
+
+    async def for_element(self, locator: async_api.Locator, state: str = "visible", timeout: float = 5000) -> float:
+        """Wait for ``locator`` to reach ``state``; returns ms waited."""
+        start = time.perf_counter()
+        await locator.wait_for(state=state, timeout=timeout)
+        waited_ms = (time.perf_counter() - start) * 1000
+        self.records.append(WaitRecord(f"element:{state}", locator.page.url, timeout, waited_ms))
+        return waited_ms
+
+    def finish(self, result) -> None:
+        result.waits = len(self.records)
+        result.wait_budget_s = sum(r.budget_ms for r in self.records) / 1000
+        result.waited_s = sum(r.waited_ms for r in self.records) / 1000